@@ -0,0 +1,446 @@
+# Headless benchmark of every dashboard page
+# python benchmark.py [--repeat 3] [--only Statistics] [--out benchmark_results.json] [--compare old.json]
+#                     [--stations synthetic/EV_Station_Location_x10.parquet]
+#
+# Runs each page (views/ and the standalone scripts) with Streamlit, streamlit_folium and the
+# components module replaced by a stub: widgets return their defaults, output calls only record
+# what would be sent to the browser. Time is split into stages by wrapping the library calls
+# that make them up:
+#   load       parquet / CSV reads
+#   aggregate  pandas merge / groupby / value_counts and the station index and grid builds
+#   figure     Plotly Express construction and figure updates
+#   serialize  figure JSON as st.plotly_chart would send it
+#   map        folium HTML generation
+# Each page runs once cold (all caches cleared) and `--repeat` times warm. Results go to a JSON
+# file together with the commit and library versions, so runs can be compared across commits.
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from collections import defaultdict
+
+STAGES = ["load", "aggregate", "figure", "serialize", "map"]
+
+# Extra page variants: (menu title, widget overrides)
+VARIANTS = [
+    ("EV Charging Stations", {"Map mode": "Density"}),
+    ("EV Charging Stations", {"Map mode": "Pre-rendered tiles"}),
+]
+
+SCRIPTS = [
+    "evlocation.py",
+    "location.py",
+    "publicevinfra.py",
+    "gasolineprices.py",
+    "evstatecount.py",
+    "evstatecount1.py",
+    "ev10000ppl.py",
+]
+
+# Project modules that import streamlit; re-imported under the stub
+STREAMLIT_MODULES = ("datastore", "statefacts", "views")
+
+
+class StageTimer:
+    """Accumulates wall time per stage; nested timed calls count toward the outermost stage only."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+        self._active = False
+        self._patches = []
+
+    def reset(self):
+        self.totals.clear()
+        self.calls.clear()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if self._active:
+            yield
+            return
+        self._active = True
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] += time.perf_counter() - started
+            self.calls[name] += 1
+            self._active = False
+
+    @contextlib.contextmanager
+    def paused(self):
+        active, self._active = self._active, True
+        try:
+            yield
+        finally:
+            self._active = active
+
+    def patch(self, stage, owner, name):
+        original = getattr(owner, name, None)
+        if original is None:
+            return
+        timer = self
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            with timer.stage(stage):
+                return original(*args, **kwargs)
+
+        setattr(owner, name, timed)
+        self._patches.append((owner, name, original))
+
+    def unpatch(self):
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+
+
+def patch_stages(timer):
+    import branca.element
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+    import pyarrow.parquet as pq
+    from pandas.core.groupby import DataFrameGroupBy, SeriesGroupBy
+
+    import clustering
+    import density
+    import geocode
+    import spatialindex
+    import statefacts
+
+    for owner, name in [(pq, "read_table"), (pd, "read_csv"), (pd, "read_parquet")]:
+        timer.patch("load", owner, name)
+
+    for owner, name in [
+        (pd, "merge"), (pd.DataFrame, "merge"), (pd.Series, "value_counts"), (pd.DataFrame, "pivot_table"),
+        (DataFrameGroupBy, "agg"), (DataFrameGroupBy, "sum"), (DataFrameGroupBy, "size"), (DataFrameGroupBy, "mean"),
+        (SeriesGroupBy, "agg"), (SeriesGroupBy, "sum"), (SeriesGroupBy, "size"), (SeriesGroupBy, "mean"),
+        (statefacts, "build_state_facts"), (geocode, "assign_states"),
+        (clustering.StationClusterIndex, "__init__"), (clustering.StationClusterIndex, "get_clusters"),
+        (spatialindex.StationIndex, "__init__"), (spatialindex.StationIndex, "query_radius"),
+        (density, "build_density_grids"),
+    ]:
+        timer.patch("aggregate", owner, name)
+
+    for name in px.__all__:
+        if callable(getattr(px, name, None)) and name[0].islower():
+            timer.patch("figure", px, name)
+    for name in ["update_layout", "update_traces", "update_xaxes", "update_yaxes"]:
+        timer.patch("figure", go.Figure, name)
+
+    timer.patch("map", branca.element.Figure, "render")
+
+
+class SessionState(dict):
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+class StreamlitStub:
+    """Stand-in for the streamlit, streamlit.components.v1 and streamlit_folium modules."""
+
+    def __init__(self, timer):
+        self.timer = timer
+        self.overrides = {}
+        self.session_state = SessionState()
+        self.payload = defaultdict(int)
+        self.elements = 0
+        self._caches = []
+        self.components = self     # streamlit.components
+        self.v1 = self             # streamlit.components.v1
+
+    def reset(self, overrides=None, clear_session=True):
+        self.overrides = dict(overrides or {})
+        if clear_session:
+            self.session_state.clear()
+        self.payload.clear()
+        self.elements = 0
+
+    def clear_caches(self):
+        for cache in self._caches:
+            cache.clear()
+
+    def _record(self, kind, size):
+        self.payload[kind] += size
+        self.elements += 1
+
+    # Caching: memoize on hashable arguments
+    def _cache(self, func=None, **kwargs):
+        if func is None:
+            return self._cache
+        cache = {}
+        self._caches.append(cache)
+
+        @functools.wraps(func)
+        def cached(*args, **kw):
+            try:
+                key = (args, tuple(sorted(kw.items())))
+                hash(key)
+            except TypeError:
+                return func(*args, **kw)
+            if key not in cache:
+                cache[key] = func(*args, **kw)
+            return cache[key]
+
+        cached.clear = cache.clear
+        return cached
+
+    cache_resource = cache_data = property(lambda self: self._cache)
+
+    # Layout
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def sidebar(self):
+        return self
+
+    def columns(self, spec, **kwargs):
+        return [self] * (spec if isinstance(spec, int) else len(spec))
+
+    def tabs(self, labels):
+        return [self] * len(labels)
+
+    def expander(self, *args, **kwargs):
+        return self
+
+    # Widgets return their default value unless overridden by label
+    def radio(self, label, options, index=0, **kwargs):
+        return self.overrides.get(label, list(options)[index])
+
+    def selectbox(self, label, options, index=0, **kwargs):
+        return self.overrides.get(label, list(options)[index])
+
+    def multiselect(self, label, options, default=None, **kwargs):
+        return self.overrides.get(label, list(default or []))
+
+    def slider(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return self.overrides.get(label, min_value if value is None else value)
+
+    def number_input(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return self.overrides.get(label, min_value if value is None else value)
+
+    def checkbox(self, label, value=False, **kwargs):
+        return self.overrides.get(label, value)
+
+    def toggle(self, label, value=False, **kwargs):
+        return self.overrides.get(label, value)
+
+    # Output
+    def plotly_chart(self, fig, **kwargs):
+        import plotly.io as pio
+        with self.timer.stage("serialize"):
+            spec = pio.to_json(fig, validate=False)
+        self._record("figure", len(spec.encode()))
+
+    def dataframe(self, data, **kwargs):
+        import pyarrow as pa
+        with self.timer.paused():
+            table = pa.Table.from_pandas(getattr(data, "data", data))
+            sink = io.BytesIO()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+        self._record("dataframe", sink.tell())
+
+    table = dataframe
+
+    def html(self, html, **kwargs):
+        self._record("html", len(html.encode()))
+
+    def st_folium(self, fig, feature_group_to_add=None, **kwargs):
+        if feature_group_to_add is not None:
+            feature_group_to_add.add_to(fig)
+        html = fig.get_root().render()
+        self._record("map", len(html.encode()))
+        return {}
+
+    def folium_static(self, fig, **kwargs):
+        return self.st_folium(fig)
+
+    def rerun(self):
+        pass
+
+    def _text(self, *args, **kwargs):
+        self._record("text", sum(len(str(arg).encode()) for arg in args))
+
+    markdown = write = title = header = subheader = caption = text = info = warning = error = success = latex = _text
+
+    def __getattr__(self, name):
+        # set_page_config, divider, ... : accepted and ignored
+        return lambda *args, **kwargs: None
+
+
+@contextlib.contextmanager
+def stubbed_streamlit(stub):
+    """Swap the Streamlit modules for `stub` and re-import the project modules that use them."""
+    names = ["streamlit", "streamlit.components", "streamlit.components.v1", "streamlit_folium"]
+    saved = {name: sys.modules.get(name) for name in names}
+    project = [name for name in sys.modules if name.split(".")[0] in STREAMLIT_MODULES]
+    saved_project = {name: sys.modules.pop(name) for name in project}
+    for name in names:
+        sys.modules[name] = stub
+    try:
+        yield
+    finally:
+        for name in [name for name in sys.modules if name.split(".")[0] in STREAMLIT_MODULES]:
+            del sys.modules[name]
+        sys.modules.update(saved_project)
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def clear_caches(stub):
+    import figcache
+    import geometry
+
+    stub.clear_caches()
+    figcache._cache.clear()
+    for func in (geometry._read_geojson, geometry.state_shapes, geometry.state_geojson):
+        func.cache_clear()
+
+
+def run_once(stub, timer, target, overrides, cold):
+    import views
+
+    if cold:
+        clear_caches(stub)
+    stub.reset(overrides)
+    timer.reset()
+    started = time.perf_counter()
+    if target.endswith(".py"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(target, run_name="__benchmark__")
+    else:
+        views.render(target)
+    total = time.perf_counter() - started
+    stages = {stage: round(timer.totals.get(stage, 0.0), 6) for stage in STAGES}
+    stages["other"] = round(max(total - sum(timer.totals.values()), 0.0), 6)
+    return {
+        "total_s": round(total, 6),
+        "stages_s": stages,
+        "payload_bytes": dict(stub.payload, total=sum(stub.payload.values())),
+        "elements": stub.elements,
+    }
+
+
+def benchmark(targets, repeat=3):
+    timer = StageTimer()
+    stub = StreamlitStub(timer)
+    results = []
+    with stubbed_streamlit(stub):
+        patch_stages(timer)
+        try:
+            for target, overrides in targets:
+                cold = run_once(stub, timer, target, overrides, cold=True)
+                warm = [run_once(stub, timer, target, overrides, cold=False) for _ in range(repeat)]
+                results.append({
+                    "page": target,
+                    "variant": overrides,
+                    "cold": cold,
+                    "warm": warm,
+                    "warm_median_s": round(statistics.median(run["total_s"] for run in warm), 6) if warm else None,
+                })
+                print(f"{target:<40} {str(overrides or ''):<32} cold {cold['total_s']:.3f}s  "
+                      f"warm {results[-1]['warm_median_s'] or 0:.3f}s  payload {cold['payload_bytes']['total'] / 1024:,.0f} KB")
+        finally:
+            timer.unpatch()
+    return results
+
+
+def run_info():
+    import folium
+    import numpy as np
+    import pandas as pd
+    import plotly
+    import pyarrow
+    import pyarrow.dataset as pads
+
+    import datastore
+
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "stations": {"path": datastore.station_source(), "rows": pads.dataset(datastore.station_source(), partitioning="hive").count_rows()},
+        "versions": {"pandas": pd.__version__, "numpy": np.__version__, "pyarrow": pyarrow.__version__,
+                     "plotly": plotly.__version__, "folium": folium.__version__},
+    }
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    old = {(r["page"], json.dumps(r["variant"], sort_keys=True)): r for r in baseline["results"]}
+    print(f"\nCompared with {baseline_path} (commit {baseline['run'].get('commit')}):")
+    for r in results:
+        before = old.get((r["page"], json.dumps(r["variant"], sort_keys=True)))
+        if before is None:
+            continue
+        for run in ("cold",):
+            new_s, old_s = r[run]["total_s"], before[run]["total_s"]
+            print(f"  {r['page']:<40} {str(r['variant'] or ''):<32} {run} {old_s:.3f}s → {new_s:.3f}s ({(new_s - old_s) / old_s:+.0%})")
+        if r["warm_median_s"] and before.get("warm_median_s"):
+            print(f"  {'':<40} {'':<32} warm {before['warm_median_s']:.3f}s → {r['warm_median_s']:.3f}s "
+                  f"({(r['warm_median_s'] - before['warm_median_s']) / before['warm_median_s']:+.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every dashboard page headlessly.")
+    parser.add_argument("--repeat", type=int, default=3, help="Warm runs per page")
+    parser.add_argument("--only", action="append", help="Only pages whose name contains this text (repeatable)")
+    parser.add_argument("--no-scripts", action="store_true", help="Skip the standalone scripts")
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--stations", help="Station parquet to run against (e.g. a file from synthetic.py)")
+    args = parser.parse_args()
+    if args.stations:
+        os.environ["EV_STATION_PATH"] = args.stations
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    with stubbed_streamlit(StreamlitStub(StageTimer())):
+        import views
+        pages = list(views.PAGES)
+    targets = [(page, {}) for page in pages] + VARIANTS
+    if not args.no_scripts:
+        targets += [(script, {}) for script in SCRIPTS]
+    if args.only:
+        targets = [t for t in targets if any(text.lower() in t[0].lower() for text in args.only)]
+
+    results = benchmark(targets, args.repeat)
+    with open(args.out, "w") as f:
+        json.dump({"run": run_info(), "stages": STAGES, "results": results}, f, indent=2)
+    print(f"Wrote {args.out}")
+    if args.compare:
+        compare(results, args.compare)
@@ -0,0 +1,109 @@
+# Server-side clustering of EV charging stations for the folium map
+# The hierarchy is built once with NumPy; the page only sends the clusters inside the current viewport.
+
+import numpy as np
+import pandas as pd
+
+MIN_ZOOM = 2
+MAX_ZOOM = 15           # Above this zoom level every station is shown on its own
+CLUSTER_RADIUS = 60     # Cluster cell size in screen pixels
+TILE_SIZE = 256
+
+
+def project(lat, lon):
+    """Project WGS84 coordinates to Web Mercator world coordinates in [0, 1)."""
+    lat = np.clip(np.asarray(lat, dtype=np.float64), -85.05112878, 85.05112878)
+    lon = np.asarray(lon, dtype=np.float64)
+    x = lon / 360.0 + 0.5
+    sin_lat = np.sin(np.radians(lat))
+    y = 0.5 - 0.25 * np.log((1 + sin_lat) / (1 - sin_lat)) / np.pi
+    return x, y
+
+
+def unproject(x, y):
+    """Inverse of `project`."""
+    lon = (np.asarray(x) - 0.5) * 360.0
+    lat = np.degrees(2 * np.arctan(np.exp((0.5 - np.asarray(y)) * 2 * np.pi)) - np.pi / 2)
+    return lat, lon
+
+
+class StationClusterIndex:
+    """Grid-based cluster hierarchy over all station coordinates.
+
+    Level `MAX_ZOOM + 1` holds the individual stations. Every coarser level is
+    built from the level below it by snapping the weighted centroids onto a grid
+    of `CLUSTER_RADIUS` pixels at that zoom, so the whole hierarchy costs one
+    `np.unique` + `np.bincount` pass per zoom level.
+    """
+
+    def __init__(self, lat, lon, names=None, radius=CLUSTER_RADIUS, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        valid = np.isfinite(lat) & np.isfinite(lon)
+        point_ids = np.flatnonzero(valid)
+
+        self.names = None if names is None else np.asarray(names, dtype=object)
+        self.radius = radius
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+
+        x, y = project(lat[valid], lon[valid])
+        leaves = {
+            "x": x,
+            "y": y,
+            "count": np.ones(len(x), dtype=np.int64),
+            "point": point_ids,                       # Station row for single-station clusters, -1 otherwise
+        }
+        self.levels = {max_zoom + 1: leaves}
+
+        # Build every coarser level from the one below it
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            self.levels[zoom] = self._cluster(self.levels[zoom + 1], zoom)
+
+    def _cluster(self, finer, zoom):
+        cells = 2 ** zoom * TILE_SIZE / self.radius
+        cx = np.minimum(np.floor(finer["x"] * cells), cells - 1).astype(np.int64)
+        cy = np.minimum(np.floor(finer["y"] * cells), cells - 1).astype(np.int64)
+        keys = cx * (int(cells) + 1) + cy
+
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        count = np.bincount(inverse, weights=finer["count"]).astype(np.int64)
+        x = np.bincount(inverse, weights=finer["x"] * finer["count"]) / count
+        y = np.bincount(inverse, weights=finer["y"] * finer["count"]) / count
+        point = np.where(count == 1, finer["point"][first], -1)
+        return {"x": x, "y": y, "count": count, "point": point}
+
+    def level_for(self, zoom):
+        return int(np.clip(np.floor(zoom), self.min_zoom, self.max_zoom + 1))
+
+    def get_clusters(self, bounds, zoom, pad=0.25):
+        """Return the clusters inside `bounds` at `zoom` as a DataFrame.
+
+        `bounds` is ((south, west), (north, east)). The box is widened by `pad`
+        of its size on each side so small pans do not need a new query.
+        """
+        (south, west), (north, east) = bounds
+        lat_pad = (north - south) * pad
+        lon_pad = (east - west) * pad
+        x_min, y_max = project(south - lat_pad, west - lon_pad)
+        x_max, y_min = project(north + lat_pad, east + lon_pad)
+
+        level = self.levels[self.level_for(zoom)]
+        mask = (level["x"] >= x_min) & (level["x"] <= x_max) & (level["y"] >= y_min) & (level["y"] <= y_max)
+
+        lat, lon = unproject(level["x"][mask], level["y"][mask])
+        clusters = pd.DataFrame({
+            "Latitude": lat,
+            "Longitude": lon,
+            "count": level["count"][mask],
+            "point": level["point"][mask],
+        })
+        if self.names is not None:
+            single = clusters["point"].to_numpy() >= 0
+            names = np.full(len(clusters), None, dtype=object)
+            names[single] = self.names[clusters["point"].to_numpy()[single]]
+            clusters["Station Name"] = names
+        return clusters
+
+    def __len__(self):
+        return len(self.levels[self.max_zoom + 1]["x"])
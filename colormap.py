@@ -0,0 +1,57 @@
+# Vectorized color lookup for the named Plotly color scales
+# Each scale is sampled once into a 256-entry RGB lookup table; mapping values to colors is then a
+# single normalize + index operation over a whole NumPy array (no per-value scale scan or parsing).
+# Used for coloring folium layers by a metric so they match the choropleths' color scales.
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.colors
+
+LUT_SIZE = 256
+MISSING_COLOR = "#9e9e9e"       # NaN values
+
+
+@lru_cache(maxsize=None)
+def lookup_table(scale="Blues", start=0.0, end=1.0):
+    """(LUT_SIZE, 3) uint8 RGB table of the part `start`..`end` of a named Plotly scale."""
+    stops = plotly.colors.get_colorscale(scale)
+    positions = np.array([position for position, _ in stops], dtype=np.float64)
+    rgb = np.array([plotly.colors.unlabel_rgb(plotly.colors.convert_colors_to_same_type(color, "rgb")[0][0])
+                    for _, color in stops], dtype=np.float64)
+    samples = np.linspace(start, end, LUT_SIZE)
+    table = np.column_stack([np.interp(samples, positions, rgb[:, channel]) for channel in range(3)])
+    return np.round(table).astype(np.uint8)
+
+
+@lru_cache(maxsize=None)
+def _hex_table(scale, start, end):
+    return np.array(["#%02x%02x%02x" % tuple(rgb) for rgb in lookup_table(scale, start, end)], dtype=object)
+
+
+def lut_indices(values, vmin=None, vmax=None, log=False):
+    """Index into a lookup table for each value (-1 for NaN); `log` maps log10(values) instead."""
+    values = np.asarray(values, dtype=np.float64)
+    if log:
+        values = np.log10(np.where(values > 0, values, np.nan))
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.full(values.shape, -1, dtype=np.int64)
+    vmin = np.nanmin(values[finite]) if vmin is None else (np.log10(vmin) if log else vmin)
+    vmax = np.nanmax(values[finite]) if vmax is None else (np.log10(vmax) if log else vmax)
+    span = vmax - vmin if vmax > vmin else 1.0
+    ratio = np.clip((np.where(finite, values, vmin) - vmin) / span, 0.0, 1.0)
+    return np.where(finite, np.round(ratio * (LUT_SIZE - 1)).astype(np.int64), -1)
+
+
+def rgb_colors(values, vmin=None, vmax=None, scale="Blues", log=False, start=0.0, end=1.0):
+    """(n, 3) uint8 RGB colors for an array of values (NaN → the scale's lowest color)."""
+    return lookup_table(scale, start, end)[np.maximum(lut_indices(values, vmin, vmax, log), 0)]
+
+
+def hex_colors(values, vmin=None, vmax=None, scale="Blues", log=False, start=0.0, end=1.0):
+    """'#rrggbb' strings for an array of values (NaN → MISSING_COLOR), e.g. for folium payloads."""
+    indices = lut_indices(values, vmin, vmax, log)
+    colors = _hex_table(scale, start, end)[np.maximum(indices, 0)]
+    colors[indices < 0] = MISSING_COLOR
+    return colors
@@ -0,0 +1,134 @@
+# Build-time conversion of the CSV inputs into typed Arrow IPC files
+# python databuild.py [--only infrastructure|registrations|ev_density ...]
+#
+# Each CSV is parsed and cleaned once (BOM, padded headers and values, quoted thousands
+# separators, empty rows) and written uncompressed to ARROW_DIR/<name>.arrow with the SHA-1 of
+# its source. The dashboard memory-maps these files (read_table()), so the column buffers are
+# pages of the OS file cache shared by every Streamlit process instead of per-process copies,
+# and nothing is parsed at startup. A missing or stale file is rebuilt on first read.
+
+import argparse
+import hashlib
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import datastore
+import states
+
+BUILD_VERSION = 1       # Bump when a cleaning step changes
+
+
+def _read_text(path):
+    """CSV with every value as stripped text (header and values), fully empty rows dropped."""
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+    df = df.rename(columns=lambda c: c.strip())
+    df = df.apply(lambda column: column.str.strip())
+    return df[(df != "").any(axis=1)].reset_index(drop=True)
+
+
+def _numbers(column):
+    # "1,256" → 1256.0; empty or non-numeric → NaN
+    return pd.to_numeric(column.str.replace(",", "", regex=False), errors="coerce")
+
+
+def clean_infrastructure(df):
+    """U.S. charging ports and station locations by year."""
+    df = pd.DataFrame({
+        "Year": _numbers(df["Year"]),
+        "EV Charging Ports": _numbers(df["EV Charging Ports"]),
+        "Station Locations": _numbers(df["Station Locations"]),
+    }).dropna()
+    return df.astype("int64").sort_values("Year").reset_index(drop=True)
+
+
+def clean_registrations(df):
+    """2023 population estimate and EV registrations (US total, regions and states)."""
+    return pd.DataFrame({
+        "Geographic Area": df["Geographic Area"],
+        "State": df["State"].str.upper(),
+        "state_key": states.keys(df["State"]),
+        "2023": _numbers(df["2023"]),
+        "EV registration by state": _numbers(df["EV registration by state"]),
+    })
+
+
+def clean_density(df):
+    """EVs per 10,000 people by state and year."""
+    df = pd.DataFrame({
+        "state": df["state"],
+        "state_key": states.keys(df["state"]),
+        "year": _numbers(df["year"]),
+        "ev_per_10000": _numbers(df["ev_per_10000"]).astype("float64"),
+    }).dropna(subset=["year"])
+    return df.astype({"year": "int16"}).reset_index(drop=True)
+
+
+# name → (source CSV, cleaning function)
+SOURCES = {
+    "infrastructure": (datastore.INFRASTRUCTURE_PATH, clean_infrastructure),
+    "registrations": (datastore.REGISTRATION_PATH, clean_registrations),
+    "ev_density": (datastore.DENSITY_PATH, clean_density),
+}
+
+
+def arrow_path(name):
+    return os.path.join(datastore.ARROW_DIR, f"{name}.arrow")
+
+
+def source_sha1(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def build(name):
+    """Clean one source and write its Arrow file; returns the table."""
+    source, clean = SOURCES[name]
+    table = pa.Table.from_pandas(clean(_read_text(source)), preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"build_version"] = str(BUILD_VERSION).encode()
+    metadata[b"source_sha1"] = source_sha1(source).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    # Uncompressed so it can be memory-mapped without decoding; written aside and renamed so
+    # other processes never map a half-written file
+    path = arrow_path(name)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+    return table
+
+
+def is_current(name, table):
+    metadata = table.schema.metadata or {}
+    return (metadata.get(b"build_version", b"").decode() == str(BUILD_VERSION)
+            and metadata.get(b"source_sha1", b"").decode() == source_sha1(SOURCES[name][0]))
+
+
+def read_table(name):
+    """Memory-mapped Arrow table of a built source (built first when missing or stale)."""
+    try:
+        table = feather.read_table(arrow_path(name), memory_map=True)
+        if is_current(name, table):
+            return table
+    except FileNotFoundError:
+        pass
+    build(name)
+    return feather.read_table(arrow_path(name), memory_map=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the CSV inputs into memory-mappable Arrow files.")
+    parser.add_argument("--only", nargs="+", choices=list(SOURCES), help="Sources to build (all by default)")
+    args = parser.parse_args()
+
+    for name in args.only or SOURCES:
+        table = build(name)
+        print(f"{SOURCES[name][0]} → {arrow_path(name)}: {table.num_rows} rows, {table.nbytes:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Shared data layer for the dashboard
+# Every dataset is loaded once per process with `st.cache_resource` and the same Arrow-backed
+# frame is handed to every session and page (no pickling, no per-call copy).
+# The frames are shared: treat them as read-only and use `.assign()`/`.copy()` before adding columns.
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+import partitions
+import perf
+import schema
+# Data file locations, re-exported (datastore.STATION_PATH, ...; overridable with EV_* variables)
+from paths import (
+    ARROW_DIR, DATASET_MANIFEST, DENSITY_PATH, DERIVED_DIR, INFRASTRUCTURE_PATH, REGISTRATION_PATH,
+    STATION_DATASET, STATION_PATH,
+)
+
+
+def _arrow_strings(arrow_type):
+    # Keep the remaining strings in Arrow memory instead of Python objects
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def station_source():
+    """Ingested station dataset if there is one, otherwise the single parquet file."""
+    return STATION_DATASET if os.path.isdir(STATION_DATASET) else STATION_PATH
+
+
+def station_version_path():
+    """File that changes whenever the station data does (dataset manifest or parquet file)."""
+    source = station_source()
+    return os.path.join(source, DATASET_MANIFEST) if os.path.isdir(source) else source
+
+
+def station_version():
+    # Cache key for the loaded frames, so an ingest shows up without restarting the app
+    try:
+        return os.stat(station_version_path()).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def read_stations(columns=None, states=None, bbox=None, path=None, compact=False) -> pd.DataFrame:
+    """Read only the requested station columns and rows from the station data (see station_source()).
+
+    `states` (codes) and `bbox` ((south, west, north, east)) are pushed down to the
+    parquet reader, so row groups whose statistics fall outside them are skipped. For the
+    ingested dataset, `states` selects the State=XX/ partitions to open (partitions.py).
+    Numeric columns come back as NumPy, categorical-like columns as categoricals and
+    the other strings as Arrow-backed strings. `compact` applies the in-memory layout of
+    schema.py (float32 coordinates, int32 IDs, parsed dates, no junk columns).
+    """
+    source = path or station_source()
+    filters = []
+    if bbox is not None:
+        south, west, north, east = bbox
+        filters += [
+            ("Latitude", ">=", south), ("Latitude", "<=", north),
+            ("Longitude", ">=", west), ("Longitude", "<=", east),
+        ]
+    read_dictionary = [c for c in schema.STATION_CATEGORIES if columns is None or c in columns]
+
+    table = None
+    if states is not None and os.path.isdir(source):
+        table = partitions.read_partitions(source, states, columns, filters or None, read_dictionary)
+    if table is None:
+        if states is not None:
+            filters.append(("State", "in", sorted(states)))
+        table = pq.read_table(
+            source,
+            columns=None if columns is None else list(columns),
+            filters=filters or None,
+            read_dictionary=read_dictionary,
+        )
+    if compact:
+        table = schema.compact_table(table)
+    df = table.to_pandas(types_mapper=_arrow_strings)
+    if states is not None or bbox is not None:
+        # A filtered read keeps the file's whole dictionaries; drop the values no remaining row has
+        for column in df.select_dtypes("category"):
+            df[column] = df[column].cat.remove_unused_categories()
+    return df
+
+
+@st.cache_resource(max_entries=8)
+def _load_stations(columns=None, version=None):
+    return schema.check(read_stations(columns, compact=True), station_source())
+
+
+@st.cache_resource(max_entries=16)
+def _load_state_stations(state, columns=None, version=None):
+    return read_stations(columns, states=[state], compact=True)
+
+
+def _load_built(name):
+    import databuild
+
+    # Arrow-backed columns stay views of the memory-mapped file (shared between processes)
+    return databuild.read_table(name).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+@st.cache_resource
+def _load_registrations():
+    return _load_built("registrations")
+
+
+@st.cache_resource
+def _load_ev_density():
+    return _load_built("ev_density")
+
+
+@st.cache_resource
+def _load_infrastructure():
+    return _load_built("infrastructure")
+
+
+@st.cache_resource
+def _load_ev_density_matrix():
+    import timeseries
+
+    return timeseries.StateYearMatrix.from_frame(_load_ev_density())
+
+
+@st.cache_resource
+def _load_state_facts(version=None):
+    import statefacts
+
+    # Rebuild only when the table is missing or older than its sources
+    try:
+        df_facts, info = statefacts.read_state_facts()
+        if statefacts.is_current(info):
+            return df_facts
+    except FileNotFoundError:
+        pass
+    return statefacts.build()
+
+
+@perf.timed("load")
+def stations(columns=None) -> pd.DataFrame:
+    """Charging station locations (one row per station, `State` as a 2-letter code).
+
+    Pass the columns the page needs; each projection is loaded once per process, in the
+    compact layout of schema.py and checked with schema.validate().
+    """
+    return _load_stations(None if columns is None else tuple(columns), station_version())
+
+
+@perf.timed("load")
+def state_stations(state, columns=None) -> pd.DataFrame:
+    """Stations of one state (2-letter code) for drill-downs.
+
+    With the ingested dataset only that state's partition is read.
+    """
+    return _load_state_stations(state, None if columns is None else tuple(columns), station_version())
+
+
+@perf.timed("load")
+def registrations() -> pd.DataFrame:
+    """2023 population estimate and EV registrations by state (`State` as a 2-letter code)."""
+    return _load_registrations()
+
+
+@perf.timed("load")
+def infrastructure() -> pd.DataFrame:
+    """U.S. public charging ports and station locations by year (sorted by year)."""
+    return _load_infrastructure()
+
+
+@perf.timed("load")
+def ev_density() -> pd.DataFrame:
+    """EVs per 10,000 people by state (full name) and year."""
+    return _load_ev_density()
+
+
+@perf.timed("load")
+def ev_density_matrix():
+    """EVs per 10,000 people as a state × year matrix with growth metrics (see timeseries.py)."""
+    return _load_ev_density_matrix()
+
+
+@perf.timed("load")
+def state_facts() -> pd.DataFrame:
+    """Precomputed per-state fact table (see statefacts.py), one row per state."""
+    return _load_state_facts(station_version())
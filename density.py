@@ -0,0 +1,86 @@
+# Station density grids for the national map view
+# All stations are binned once into a 2D histogram per zoom band with NumPy; the map then sends
+# one weighted point per non-empty cell (folium HeatMap), so the payload does not grow with the
+# number of stations.
+
+import numpy as np
+import pandas as pd
+from folium.plugins import HeatMap
+
+# (min zoom, max zoom, cell size in degrees)
+ZOOM_BANDS = [
+    (0, 5, 0.5),
+    (6, 8, 0.1),
+    (9, 11, 0.02),
+    (12, 22, 0.005),
+]
+
+
+class DensityGrid:
+    """Station counts on a regular lat/lon grid (only non-empty cells are stored)."""
+
+    def __init__(self, lat, lon, cell_deg):
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        valid = np.isfinite(lat) & np.isfinite(lon)
+
+        self.cell_deg = cell_deg
+        n_cols = int(np.ceil(360 / cell_deg)) + 1
+        rows = ((lat[valid] + 90) // cell_deg).astype(np.int64)
+        cols = ((lon[valid] + 180) // cell_deg).astype(np.int64)
+        keys, counts = np.unique(rows * n_cols + cols, return_counts=True)
+        rows, cols = np.divmod(keys, n_cols)
+
+        # Cell centers
+        self.lat = (rows + 0.5) * cell_deg - 90
+        self.lon = (cols + 0.5) * cell_deg - 180
+        self.count = counts
+
+    def cells(self, bounds=None, pad=0.25):
+        """Non-empty cells as a DataFrame, optionally limited to ((south, west), (north, east))."""
+        mask = slice(None)
+        if bounds is not None:
+            (south, west), (north, east) = bounds
+            lat_pad = (north - south) * pad + self.cell_deg
+            lon_pad = (east - west) * pad + self.cell_deg
+            mask = (
+                (self.lat >= south - lat_pad) & (self.lat <= north + lat_pad)
+                & (self.lon >= west - lon_pad) & (self.lon <= east + lon_pad)
+            )
+        return pd.DataFrame({
+            "Latitude": self.lat[mask],
+            "Longitude": self.lon[mask],
+            "count": self.count[mask],
+        })
+
+    def __len__(self):
+        return len(self.count)
+
+
+def build_density_grids(lat, lon, bands=ZOOM_BANDS):
+    """One DensityGrid per zoom band, keyed by the band's cell size."""
+    return {cell_deg: DensityGrid(lat, lon, cell_deg) for _, _, cell_deg in bands}
+
+
+def cell_size_for(zoom, bands=ZOOM_BANDS):
+    for min_zoom, max_zoom, cell_deg in bands:
+        if min_zoom <= zoom <= max_zoom:
+            return cell_deg
+    return bands[-1][2]
+
+
+def heatmap_layer(cells, zoom, cell_deg, name="Station Density"):
+    """folium HeatMap of grid cells; weights are log-scaled so dense metros do not wash out the rest."""
+    weights = np.log1p(cells["count"].to_numpy(dtype=np.float64))
+    if len(weights) and weights.max() > 0:
+        weights = weights / weights.max()
+    payload = np.column_stack([
+        np.round(cells["Latitude"].to_numpy(), 4),
+        np.round(cells["Longitude"].to_numpy(), 4),
+        np.round(weights, 3),
+    ]).tolist()
+
+    # Blur radius roughly one and a half cells wide at the current zoom
+    cell_px = cell_deg * 256 * 2 ** zoom / 360
+    radius = int(np.clip(cell_px * 1.5, 8, 40))
+    return HeatMap(payload, name=name, radius=radius, blur=int(radius * 0.8), min_opacity=0.25, max_zoom=zoom)
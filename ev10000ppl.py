@@ -5,38 +5,10 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.colors
 import numpy as np
-
-def get_color_from_scale(value, vmin, vmax, scale_name="Blues"):
-    """
-    value가 vmin~vmax 사이 어딘가에 있을 때,
-    Plotly 내장 색상 스케일(scale_name)에 따라
-    대응하는 'rgb(r,g,b)' 형태의 문자열을 반환합니다.
-    """
-    import re
-    if vmax <= vmin:
-        return "rgb(0,0,0)"
-    ratio = (value - vmin) / (vmax - vmin)
-    ratio = max(0, min(1, ratio))
-    color_scale = plotly.colors.get_colorscale(scale_name)
-    for i in range(len(color_scale) - 1):
-        left_ratio, left_color = color_scale[i]
-        right_ratio, right_color = color_scale[i+1]
-        if left_ratio <= ratio <= right_ratio:
-            denom = (right_ratio - left_ratio)
-            sub_ratio = 0 if denom == 0 else (ratio - left_ratio) / denom
-            def parse_rgb_str(rgb_str):
-                m = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', rgb_str.strip())
-                if m:
-                    return [int(m.group(1)), int(m.group(2)), int(m.group(3))]
-                return [0,0,0]
-            lc = parse_rgb_str(left_color)
-            rc = parse_rgb_str(right_color)
-            c = [int(lc[j] + (rc[j] - lc[j]) * sub_ratio) for j in range(3)]
-            return f"rgb({c[0]},{c[1]},{c[2]})"
-    return color_scale[-1][1]
-
+import figcache
+import geometry
+import states
 
 # 페이지 설정 (스크립트 최상단에서 한 번만)
 st.set_page_config(
@@ -73,124 +45,124 @@ def load_map_data():
                   "Ohio", "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina", 
                   "South Dakota", "Tennessee", "Texas", "Utah", "Vermont", "Virginia", "Washington", 
                   "West Virginia", "Wisconsin", "Wyoming"],
-        "state_code": ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL", "GA", "HI", "ID", "IL", 
-                       "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", 
-                       "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", 
-                       "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"],
         "ev_per_10000": [25, 37, 121, 23, 322, 153, 87, 81, 119, 113, 84, 178, 43, 79, 38, 28, 38, 26, 
                          18, 53, 117, 105, 50, 65, 12, 43, 41, 35, 148, 71, 145, 49, 67, 65, 13, 43, 56, 
                          152, 54, 58, 39, 18, 47, 75, 117, 120, 97, 195, 16, 42, 19],
     }
     df = pd.DataFrame(data)
-    return df
-
-@st.cache_data
-def load_time_data():
-    # CSV 파일에서 (state, year, ev_per_10000) 등이 포함된 데이터를 불러옴
-    df = pd.read_csv("ev_per_10000.csv")  
+    df["state_code"] = states.codes(states.keys(df["state"]))
     return df
 
 df_map = load_map_data()
-df_time = load_time_data()
 
 
 max_ev = df_map["ev_per_10000"].max()
 
 # --- (A) 전용 컬러바 figure ---
-df_dummy = pd.DataFrame({
-    "dummy_x": [0, 1],
-    "dummy_y": [0, 1],
-    "value":   [0, max_ev]
-})
-fig_colorbar = px.scatter(
-    df_dummy,
-    x="dummy_x",
-    y="dummy_y",
-    color="value",
-    color_continuous_scale="Blues",
-    range_color=(0, max_ev)
-)
-# 점, 축, 호버 숨기기 + 컬러바 높이 축소
-# 점, 축, 호버 숨기기 + 컬러바 높이 축소
-fig_colorbar.update_traces(marker=dict(size=0), hovertemplate=None, hoverinfo="skip")
-fig_colorbar.update_xaxes(visible=False)
-fig_colorbar.update_yaxes(visible=False)
-fig_colorbar.update_layout(
-    height=60,  # 컬러바 전체 높이
-    margin=dict(l=0, r=0, t=0, b=0),
-    coloraxis_colorbar=dict(
-        orientation="h",
-        x=0.54,  # 중앙 정렬
-        xanchor="center",
-        y=0,
-        yanchor="top",
-        title=None 
-    ),
-    title=dict(
-        text="<span style='color:gray; font-size:14px; font-weight:normal;'>EV per 10,000 People</span>",  
-        x=0.08, 
-        y=0.83,
-        xanchor="left",
-        yanchor="top"
+def build_colorbar():
+    df_dummy = pd.DataFrame({
+        "dummy_x": [0, 1],
+        "dummy_y": [0, 1],
+        "value":   [0, max_ev]
+    })
+    fig_colorbar = px.scatter(
+        df_dummy,
+        x="dummy_x",
+        y="dummy_y",
+        color="value",
+        color_continuous_scale="Blues",
+        range_color=(0, max_ev)
     )
-)
+    # 점, 축, 호버 숨기기 + 컬러바 높이 축소
+    # 점, 축, 호버 숨기기 + 컬러바 높이 축소
+    fig_colorbar.update_traces(marker=dict(size=0), hovertemplate=None, hoverinfo="skip")
+    fig_colorbar.update_xaxes(visible=False)
+    fig_colorbar.update_yaxes(visible=False)
+    fig_colorbar.update_layout(
+        height=60,  # 컬러바 전체 높이
+        margin=dict(l=0, r=0, t=0, b=0),
+        coloraxis_colorbar=dict(
+            orientation="h",
+            x=0.54,  # 중앙 정렬
+            xanchor="center",
+            y=0,
+            yanchor="top",
+            title=None 
+        ),
+        title=dict(
+            text="<span style='color:gray; font-size:14px; font-weight:normal;'>EV per 10,000 People</span>",  
+            x=0.08, 
+            y=0.83,
+            xanchor="left",
+            yanchor="top"
+        )
+    )
+    return fig_colorbar
+fig_colorbar = figcache.cached_figure("colorbar", df_map, "ev_per_10000", "Blues", (None, 60), build_colorbar)
 
 # --- (B) 지도(Choropleth) ---
-fig_map = px.choropleth(
-    df_map,
-    color="ev_per_10000",
-    custom_data=["state", "ev_per_10000"],
-    locationmode="USA-states",
-    locations="state_code",
-    scope="usa",
-    color_continuous_scale="Blues",
-    range_color=(0, max_ev),
-    labels={"ev_per_10000": "EV per 10,000 People"}
-)
-fig_map.update_traces(
-    hovertemplate="EV per 10,000 People<br>%{customdata[0]}: <b>%{customdata[1]}</b><extra></extra>"
-)
+def build_map():
+    fig_map = px.choropleth(
+        df_map,
+        color="ev_per_10000",
+        custom_data=["state", "ev_per_10000"],
+        geojson=geometry.state_geojson(),
+        featureidkey="id",
+        locations="state_code",
+        scope="usa",
+        color_continuous_scale="Blues",
+        range_color=(0, max_ev),
+        labels={"ev_per_10000": "EV per 10,000 People"}
+    )
+    fig_map.update_traces(
+        hovertemplate="EV per 10,000 People<br>%{customdata[0]}: <b>%{customdata[1]}</b><extra></extra>"
+    )
 
 
-# 컬러바 숨김 + 그래프 여백 최소화
-fig_map.update_layout(
-    margin=dict(l=0, r=0, t=0, b=0),
-    height=380,
-    width=600,
-    coloraxis_showscale=False
-)
+    # 컬러바 숨김 + 그래프 여백 최소화
+    fig_map.update_layout(
+        margin=dict(l=0, r=0, t=0, b=0),
+        height=380,
+        width=600,
+        coloraxis_showscale=False
+    )
+    return fig_map
+fig_map = figcache.cached_figure("choropleth", df_map, "ev_per_10000", "Blues", (600, 380), build_map)
 
 # --- (C) 막대그래프 (Top 10) ---
-df_top10 = df_map.sort_values("ev_per_10000", ascending=False).head(10)
+def build_top10():
+    df_top10 = df_map.sort_values("ev_per_10000", ascending=False).head(10)
 
-fig_top10 = px.bar(
-    df_top10,
-    x="ev_per_10000",
-    y="state",
-    orientation="h",
-    custom_data=["state", "ev_per_10000"],
-    color="ev_per_10000",
-    color_continuous_scale="Blues",
-    range_color=(0, max_ev),
-    labels={"ev_per_10000": "EV per 10,000 People", "state": "State"}
-)
-fig_top10.update_traces(
-    hovertemplate="EV per 10,000 People<br>%{customdata[0]}: <b>%{customdata[1]}</b><extra></extra>"
-)
-fig_top10.update_layout(
-    margin=dict(l=0, r=0, t=10, b=0),
-    yaxis=dict(autorange="reversed"),
-    bargap=0.35,
-    height=400,
-    coloraxis_showscale=False
-)
+    fig_top10 = px.bar(
+        df_top10,
+        x="ev_per_10000",
+        y="state",
+        orientation="h",
+        custom_data=["state", "ev_per_10000"],
+        color="ev_per_10000",
+        color_continuous_scale="Blues",
+        range_color=(0, max_ev),
+        labels={"ev_per_10000": "EV per 10,000 People", "state": "State"}
+    )
+    fig_top10.update_traces(
+        hovertemplate="EV per 10,000 People<br>%{customdata[0]}: <b>%{customdata[1]}</b><extra></extra>"
+    )
+    fig_top10.update_layout(
+        margin=dict(l=0, r=0, t=10, b=0),
+        yaxis=dict(autorange="reversed"),
+        bargap=0.35,
+        height=400,
+        coloraxis_showscale=False
+    )
 
-fig_top10.update_xaxes(
-    showgrid=True,          # 그리드선 표시
-    gridcolor="lightgray",  # 그리드선 색상
-    gridwidth=1,            # 그리드선 두께
-    griddash="dot"          # 점선(dotted line) 스타일
-)
+    fig_top10.update_xaxes(
+        showgrid=True,          # 그리드선 표시
+        gridcolor="lightgray",  # 그리드선 색상
+        gridwidth=1,            # 그리드선 두께
+        griddash="dot"          # 점선(dotted line) 스타일
+    )
+    return fig_top10
+fig_top10 = figcache.cached_figure("top10", df_map, "ev_per_10000", "Blues", (None, 400), build_top10)
 
 
 # --- 3. 레이아웃: 지도 + 막대그래프(좌우), 하단 컬러바 ---
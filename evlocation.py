@@ -3,10 +3,10 @@
 # 한국어 주석 영어로 고치기!!!!
 
 import streamlit as st
-import pandas as pd
 import folium
-from folium.plugins import MarkerCluster
 from streamlit_folium import st_folium
+from markers import station_marker_cluster
+import datastore
 # import warnings
 # warnings.filterwarnings('ignore')
 
@@ -16,20 +16,14 @@ st.set_page_config(
     page_icon="⚡"
 )
 
-# CSV 불러오기
-df = pd.read_csv('EV_Station_Location.csv')
+# Parquet 불러오기 (지도에 필요한 컬럼만)
+df = datastore.stations(['Latitude', 'Longitude', 'Station Name'])
 
 # 지도 생성
 map_usa = folium.Map(location=[39.5, -98.35], zoom_start=4)
-marker_cluster = MarkerCluster().add_to(map_usa)
 
-# MarkerCluster에 충전소 위치 추가
-for idx, row in df.iterrows():
-    folium.Marker(
-        location=[row['Latitude'], row['Longitude']],
-        popup=row.get('Station_Name'),
-        icon=folium.Icon(color='green', icon='bolt', prefix='fa')
-    ).add_to(marker_cluster)
+# 충전소 위치를 한 번에 payload로 변환해 FastMarkerCluster로 추가
+station_marker_cluster(df).add_to(map_usa)
 
 # Streamlit 앱에 지도 표시
 st.title("Locations of Electric Vehicle Charging Stations in the U.S.")
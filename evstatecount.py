@@ -7,6 +7,8 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
+import geometry
+import states
 
 # Streamlit title
 st.set_page_config(
@@ -35,26 +37,15 @@ state_ev_data = {
 df = pd.DataFrame(list(state_ev_data.items()), columns=['State', 'EV_Count'])
 
 # Mapping state names to abbreviations
-state_codes = {
-    'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR', 'California': 'CA',
-    'Colorado': 'CO', 'Connecticut': 'CT', 'Delaware': 'DE', 'Florida': 'FL', 'Georgia': 'GA',
-    'Hawaii': 'HI', 'Idaho': 'ID', 'Illinois': 'IL', 'Indiana': 'IN', 'Iowa': 'IA',
-    'Kansas': 'KS', 'Kentucky': 'KY', 'Louisiana': 'LA', 'Maine': 'ME', 'Maryland': 'MD',
-    'Massachusetts': 'MA', 'Michigan': 'MI', 'Minnesota': 'MN', 'Mississippi': 'MS', 'Missouri': 'MO',
-    'Montana': 'MT', 'Nebraska': 'NE', 'Nevada': 'NV', 'New Hampshire': 'NH', 'New Jersey': 'NJ',
-    'New Mexico': 'NM', 'New York': 'NY', 'North Carolina': 'NC', 'North Dakota': 'ND', 'Ohio': 'OH',
-    'Oklahoma': 'OK', 'Oregon': 'OR', 'Pennsylvania': 'PA', 'Rhode Island': 'RI', 'South Carolina': 'SC',
-    'South Dakota': 'SD', 'Tennessee': 'TN', 'Texas': 'TX', 'Utah': 'UT', 'Vermont': 'VT',
-    'Virginia': 'VA', 'Washington': 'WA', 'West Virginia': 'WV', 'Wisconsin': 'WI', 'Wyoming': 'WY'
-}
-df['State_Code'] = df['State'].map(state_codes)
+df['State_Code'] = states.codes(states.keys(df['State']))
 
 
 # Plotly choropleth map
 fig = px.choropleth(
     df,
     locations='State_Code',
-    locationmode="USA-states",
+    geojson=geometry.state_geojson(),
+    featureidkey="id",
     color='EV_Count',
     hover_name='State',
     hover_data={'EV_Count': False},  # Hide default EV_Count in the hover box
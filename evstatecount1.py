@@ -4,6 +4,9 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import figcache
+import geometry
+import states
 
 # Streamlit 페이지 설정
 st.set_page_config(
@@ -32,91 +35,89 @@ state_ev_data = {
 df = pd.DataFrame(list(state_ev_data.items()), columns=['State', 'EV_Count'])
 
 # 주 이름을 주 약어로 매핑
-state_codes = {
-    'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR', 'California': 'CA',
-    'Colorado': 'CO', 'Connecticut': 'CT', 'Delaware': 'DE', 'Florida': 'FL', 'Georgia': 'GA',
-    'Hawaii': 'HI', 'Idaho': 'ID', 'Illinois': 'IL', 'Indiana': 'IN', 'Iowa': 'IA',
-    'Kansas': 'KS', 'Kentucky': 'KY', 'Louisiana': 'LA', 'Maine': 'ME', 'Maryland': 'MD',
-    'Massachusetts': 'MA', 'Michigan': 'MI', 'Minnesota': 'MN', 'Mississippi': 'MS', 'Missouri': 'MO',
-    'Montana': 'MT', 'Nebraska': 'NE', 'Nevada': 'NV', 'New Hampshire': 'NH', 'New Jersey': 'NJ',
-    'New Mexico': 'NM', 'New York': 'NY', 'North Carolina': 'NC', 'North Dakota': 'ND', 'Ohio': 'OH',
-    'Oklahoma': 'OK', 'Oregon': 'OR', 'Pennsylvania': 'PA', 'Rhode Island': 'RI', 'South Carolina': 'SC',
-    'South Dakota': 'SD', 'Tennessee': 'TN', 'Texas': 'TX', 'Utah': 'UT', 'Vermont': 'VT',
-    'Virginia': 'VA', 'Washington': 'WA', 'West Virginia': 'WV', 'Wisconsin': 'WI', 'Wyoming': 'WY'
-}
-df['State_Code'] = df['State'].map(state_codes)
+df['State_Code'] = states.codes(states.keys(df['State']))
 
 max_ev = df["EV_Count"].max()
 
 # --- (A) 컬러바 (범례) 설정 ---
-df_dummy = pd.DataFrame({"dummy_x": [0, 1], "dummy_y": [0, 1], "value": [0, max_ev]})
-fig_colorbar = px.scatter(
-    df_dummy, x="dummy_x", y="dummy_y", color="value", color_continuous_scale="Blues", range_color=(0, max_ev)
-)
-fig_colorbar.update_traces(marker=dict(size=0), hoverinfo="skip")
-fig_colorbar.update_layout(
-    height=60,
-    margin=dict(l=0, r=0, t=0, b=0),
-    coloraxis_colorbar=dict(
-        orientation="h",
-        x=0.54, xanchor="center",
-        y=0, yanchor="top",
-        title=None
-    ),
-    title=dict(
-        text="<span style='color:gray; font-size:14px; font-weight:normal;'>Electric Vehicles</span>",
-        x=0.08, y=0.83,
-        xanchor="left", yanchor="top"
+def build_colorbar():
+    df_dummy = pd.DataFrame({"dummy_x": [0, 1], "dummy_y": [0, 1], "value": [0, max_ev]})
+    fig_colorbar = px.scatter(
+        df_dummy, x="dummy_x", y="dummy_y", color="value", color_continuous_scale="Blues", range_color=(0, max_ev)
     )
-)
+    fig_colorbar.update_traces(marker=dict(size=0), hoverinfo="skip")
+    fig_colorbar.update_layout(
+        height=60,
+        margin=dict(l=0, r=0, t=0, b=0),
+        coloraxis_colorbar=dict(
+            orientation="h",
+            x=0.54, xanchor="center",
+            y=0, yanchor="top",
+            title=None
+        ),
+        title=dict(
+            text="<span style='color:gray; font-size:14px; font-weight:normal;'>Electric Vehicles</span>",
+            x=0.08, y=0.83,
+            xanchor="left", yanchor="top"
+        )
+    )
+    return fig_colorbar
+fig_colorbar = figcache.cached_figure("colorbar", df, "EV_Count", "Blues", (None, 60), build_colorbar)
 
 # --- (B) 미국 지도 (Choropleth Map) ---
-fig_map = px.choropleth(
-    df,
-    locations="State_Code",
-    locationmode="USA-states",
-    color="EV_Count",
-    custom_data=["State", "EV_Count"],
-    scope="usa",
-    color_continuous_scale="Blues",
-    range_color=(0, max_ev),
-    labels={"EV_Count": "Electric Vehicles"}
-)
-fig_map.update_traces(
-    hovertemplate="Electric Vehicles<br>%{customdata[0]}: <b>%{customdata[1]:,}</b><extra></extra>"
-)
-fig_map.update_layout(
-    margin=dict(l=0, r=0, t=0, b=0),
-    height=380, width=600,
-    coloraxis_showscale=False
-)
+def build_map():
+    fig_map = px.choropleth(
+        df,
+        locations="State_Code",
+        geojson=geometry.state_geojson(),
+        featureidkey="id",
+        color="EV_Count",
+        custom_data=["State", "EV_Count"],
+        scope="usa",
+        color_continuous_scale="Blues",
+        range_color=(0, max_ev),
+        labels={"EV_Count": "Electric Vehicles"}
+    )
+    fig_map.update_traces(
+        hovertemplate="Electric Vehicles<br>%{customdata[0]}: <b>%{customdata[1]:,}</b><extra></extra>"
+    )
+    fig_map.update_layout(
+        margin=dict(l=0, r=0, t=0, b=0),
+        height=380, width=600,
+        coloraxis_showscale=False
+    )
+    return fig_map
+fig_map = figcache.cached_figure("choropleth", df, "EV_Count", "Blues", (600, 380), build_map)
 
 # --- (C) 상위 10개 주 (막대그래프) ---
-df_top10 = df.sort_values("EV_Count", ascending=False).head(10)
-fig_top10 = px.bar(
-    df_top10,
-    x="EV_Count", y="State",
-    orientation="h",
-    custom_data=["State", "EV_Count"],
-    color="EV_Count",
-    color_continuous_scale="Blues",
-    range_color=(0, max_ev),
-    labels={"EV_Count": "Electric Vehicles", "State": "State"}
-)
-fig_top10.update_traces(
-    hovertemplate="Electric Vehicles<br>%{customdata[0]}: <b>%{customdata[1]:,}</b><extra></extra>"
-)
-fig_top10.update_layout(
-    margin=dict(l=0, r=0, t=10, b=0),
-    yaxis=dict(autorange="reversed"),
-    bargap=0.35,
-    height=400,
-    coloraxis_showscale=False
-)
+def build_top10():
+    df_top10 = df.sort_values("EV_Count", ascending=False).head(10)
+    fig_top10 = px.bar(
+        df_top10,
+        x="EV_Count", y="State",
+        orientation="h",
+        custom_data=["State", "EV_Count"],
+        color="EV_Count",
+        color_continuous_scale="Blues",
+        range_color=(0, max_ev),
+        labels={"EV_Count": "Electric Vehicles", "State": "State"}
+    )
+    fig_top10.update_traces(
+        hovertemplate="Electric Vehicles<br>%{customdata[0]}: <b>%{customdata[1]:,}</b><extra></extra>"
+    )
+    fig_top10.update_layout(
+        margin=dict(l=0, r=0, t=10, b=0),
+        yaxis=dict(autorange="reversed"),
+        bargap=0.35,
+        height=400,
+        coloraxis_showscale=False
+    )
 
-fig_top10.update_xaxes(
-    showgrid=True, gridcolor="lightgray", gridwidth=1, griddash="dot"
-)
+    fig_top10.update_xaxes(
+        showgrid=True, gridcolor="lightgray", gridwidth=1, griddash="dot"
+    )
+    return fig_top10
+fig_top10 = figcache.cached_figure("top10", df, "EV_Count", "Blues", (None, 400), build_top10)
 
 # --- (3) 지도 + 막대그래프 (2열 레이아웃) ---
 col1, col2 = st.columns([1, 1], gap="small")
@@ -0,0 +1,200 @@
+# Static export of every dashboard figure and map for reports
+# python export.py [--out export] [--jobs N] [--only Statistics] [--png] [--offline] [--no-scripts]
+#
+# Runs the dashboard pages (views/) and the standalone scripts without a Streamlit server, using the
+# stub from benchmark.py, and writes every Plotly figure and folium map they show as a standalone
+# HTML file: export/<page>/<NN>-<title>.html, plus export/index.html linking them all.
+# With --png, Plotly figures are also written as PNG images (needs the optional `kaleido` package;
+# folium maps are HTML only).
+#
+# Pages run in a process pool. The station data, state facts and spatial indexes are loaded once in
+# the parent before the workers start; with the default fork start method the workers share that
+# memory instead of reading and building it again.
+
+import argparse
+import contextlib
+import html
+import io
+import multiprocessing
+import os
+import re
+import runpy
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import benchmark
+
+EXPORT_DIR = "export"
+
+# (target, widget overrides): every page and script that shows a figure or a map
+TARGETS = [
+    ("EV Charging Stations", {}),
+    ("EV Charging Stations", {"Map mode": "Density"}),
+    ("Station Finder", {}),
+    ("EV Infrastructure & Gas Price Trends", {}),
+    ("EV Statistics I", {}),
+    ("EV Statistics II", {}),
+    ("EV Adoption Over Time", {}),
+]
+SCRIPTS = benchmark.SCRIPTS
+
+_stub = None
+
+
+class CaptureStub(benchmark.StreamlitStub):
+    """Streamlit stub that keeps the figures and maps a page shows."""
+
+    def __init__(self):
+        super().__init__(benchmark.StageTimer())
+        self.outputs = []
+
+    def reset(self, overrides=None, clear_session=True):
+        super().reset(overrides, clear_session)
+        self.outputs = []
+
+    def plotly_chart(self, fig, **kwargs):
+        self.outputs.append(("figure", fig))
+
+    def st_folium(self, fig, feature_group_to_add=None, **kwargs):
+        if feature_group_to_add is not None:
+            feature_group_to_add.add_to(fig)
+        self.outputs.append(("map", fig.get_root().render()))
+        return {}
+
+    def html(self, html, **kwargs):
+        self.outputs.append(("map", html))
+
+
+def slugify(text, default):
+    text = re.sub(r"<[^>]+>", "", text or "")
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return slug[:60] or default
+
+
+def preload():
+    """Load the shared datasets and indexes into the stub caches (inherited by forked workers)."""
+    import datastore
+    import geometry
+    from views import station_finder, station_map
+
+    datastore.state_facts()
+    datastore.registrations()
+    datastore.ev_density()
+    datastore.infrastructure()
+    geometry.state_geojson()
+    version = datastore.station_version()
+    station_map.load_cluster_index(version)
+    station_map.load_density_grids(version)
+    station_finder.load_station_index(version)
+
+
+def _init_worker():
+    # Spawned workers (no fork) set up the stub and the shared data themselves
+    global _stub
+    if _stub is None:
+        _stub = CaptureStub()
+        benchmark.stubbed_streamlit(_stub).__enter__()     # Kept for the life of the worker
+        preload()
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def export_target(target, overrides, out_dir, png=False, offline=False):
+    """Run one page or script and write what it shows; returns (target, overrides, written paths, seconds)."""
+    import plotly.io as pio
+    import views
+
+    started = time.perf_counter()
+    _stub.reset(overrides)
+    if target.endswith(".py"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(target, run_name="__export__")
+    else:
+        views.render(target)
+
+    name = slugify(os.path.splitext(target)[0] + "-" + "-".join(map(str, overrides.values())), "page")
+    target_dir = os.path.join(out_dir, name)
+    os.makedirs(target_dir, exist_ok=True)
+    written = []
+    for i, (kind, output) in enumerate(_stub.outputs, 1):
+        if kind == "figure":
+            base = os.path.join(target_dir, f"{i:02d}-{slugify(output.layout.title.text, 'figure')}")
+            pio.write_html(output, base + ".html", include_plotlyjs=True if offline else "cdn", validate=False)
+            written.append(base + ".html")
+            if png:
+                output.write_image(base + ".png", scale=2)
+                written.append(base + ".png")
+        else:
+            path = os.path.join(target_dir, f"{i:02d}-map.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(output)
+            written.append(path)
+    return target, overrides, written, time.perf_counter() - started
+
+
+def write_index(results, out_dir):
+    rows = []
+    for target, overrides, written, _ in results:
+        label = target + (f" ({', '.join(map(str, overrides.values()))})" if overrides else "")
+        links = "".join(
+            f'<li><a href="{html.escape(os.path.relpath(path, out_dir))}">{html.escape(os.path.basename(path))}</a></li>'
+            for path in written
+        )
+        rows.append(f"<h2>{html.escape(label)}</h2><ul>{links}</ul>")
+    path = os.path.join(out_dir, "index.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>EV Dashboard export</title></head>"
+                f"<body><h1>EV Dashboard export ({time.strftime('%Y-%m-%d %H:%M')})</h1>{''.join(rows)}</body></html>")
+    return path
+
+
+def export(targets, out_dir=EXPORT_DIR, jobs=None, png=False, offline=False):
+    global _stub
+    if png:
+        try:
+            import kaleido  # noqa: F401
+        except ImportError:
+            print("kaleido is not installed: writing HTML only (pip install kaleido for PNG images)")
+            png = False
+
+    os.makedirs(out_dir, exist_ok=True)
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    results = []
+    _stub = CaptureStub()
+    with benchmark.stubbed_streamlit(_stub):
+        # Load once here; forked workers start with the data in memory
+        preload()
+        with ProcessPoolExecutor(jobs or os.cpu_count(), mp_context=context, initializer=_init_worker) as pool:
+            futures = [pool.submit(export_target, target, overrides, out_dir, png, offline) for target, overrides in targets]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                print(f"  {result[0]:<40} {len(result[2]):>3} files  {result[3]:.2f}s")
+    _stub = None
+    order = {(t, tuple(o.items())): i for i, (t, o) in enumerate(targets)}
+    results.sort(key=lambda r: order[(r[0], tuple(r[1].items()))])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export every dashboard figure and map as static files.")
+    parser.add_argument("--out", default=EXPORT_DIR, help="Output directory")
+    parser.add_argument("--jobs", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--only", action="append", help="Only pages whose name contains this text (repeatable)")
+    parser.add_argument("--no-scripts", action="store_true", help="Skip the standalone scripts")
+    parser.add_argument("--png", action="store_true", help="Also write PNG images of the Plotly figures (needs kaleido)")
+    parser.add_argument("--offline", action="store_true", help="Embed plotly.js in every HTML file instead of loading it from the CDN")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    targets = list(TARGETS)
+    if not args.no_scripts:
+        targets += [(script, {}) for script in SCRIPTS]
+    if args.only:
+        targets = [t for t in targets if any(text.lower() in t[0].lower() for text in args.only)]
+
+    started = time.perf_counter()
+    results = export(targets, args.out, args.jobs, args.png, args.offline)
+    index = write_index(results, args.out)
+    print(f"Wrote {sum(len(r[2]) for r in results)} files to {args.out}/ in {time.perf_counter() - started:.1f}s ({index})")
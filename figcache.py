@@ -0,0 +1,82 @@
+# Figure cache for the state statistics charts
+# Plotly Express figures are stored as serialized Plotly JSON keyed by
+# (builder, figure name, dataset hash, metric, color scale, size). The builder is identified by its
+# source file, module and qualified name, so pages that reuse a figure name ("colorbar", "top10",
+# ...) with a different layout get their own entries. A rerun or another viewer asking for the
+# same chart gets the figure back from JSON instead of running Plotly Express again.
+# The cache lives at module level, so it is shared by every session of the process.
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.io as pio
+
+import perf
+
+MAX_FIGURES = 64
+
+
+def dataset_hash(df):
+    """Content hash of a DataFrame (values, index and column names)."""
+    digest = hashlib.sha1()
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+class FigureCache:
+    """LRU cache of Plotly figure JSON."""
+
+    def __init__(self, max_entries=MAX_FIGURES):
+        self.max_entries = max_entries
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """Figure for `key`; `build()` is only called on a miss."""
+        with self._lock:
+            spec = self._figures.get(key)
+            if spec is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+        if spec is None:
+            spec = pio.to_json(build(), validate=False)
+            with self._lock:
+                self.misses += 1
+                self._figures[key] = spec
+                self._figures.move_to_end(key)
+                while len(self._figures) > self.max_entries:
+                    self._figures.popitem(last=False)
+        return pio.from_json(spec)
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._figures)
+
+
+_cache = FigureCache()
+
+
+def builder_key(build):
+    """Identity of a figure builder (pages run as scripts all have the module "__main__")."""
+    code = getattr(build, "__code__", None)
+    return (code.co_filename if code is not None else None,
+            getattr(build, "__module__", None), getattr(build, "__qualname__", repr(build)))
+
+
+@perf.timed("figure")
+def cached_figure(name, df, metric, color_scale, size, build):
+    """Cached figure `name` built from `df`; `size` is (width, height) and may contain None."""
+    return _cache.get((builder_key(build), name, dataset_hash(df), metric, color_scale, tuple(size)), build)
+
+
+def cache_info():
+    return {"entries": len(_cache), "max_entries": _cache.max_entries, "hits": _cache.hits, "misses": _cache.misses}
@@ -0,0 +1,59 @@
+# Regression statistics quoted on the Conclusion page
+# statefacts.py fits the two log-scale scatter plots of the EV Statistics pages whenever it writes
+# the fact table, and saves slope, intercept and R² next to it as JSON. The Conclusion page reads
+# that file, so it imports neither regression.py nor pandas, pyarrow, NumPy or plotly.
+
+import json
+import os
+
+import paths
+
+# name → (x column, y column) of the fact table, as on the EV Statistics pages
+FITS = {
+    "adoption": ("Charging Stations per 10k (log)", "EV Adoptions (log)"),
+    "population": ("EV per 10000 (log)", "Charging Stations per 10k (log)"),
+}
+
+
+def summary_path(facts_path=paths.FACTS_PATH):
+    """JSON file stored with a fact table (state_facts.parquet → state_facts_fits.json)."""
+    return os.path.splitext(facts_path)[0] + "_fits.json"
+
+
+def compute(df_facts):
+    """{name: {"slope", "intercept", "r2", "n"}} of the FITS on a fact table."""
+    import regression
+
+    df = df_facts.dropna(subset=["Charging Stations per 10k", "ev_per_10000"])
+    summary = {}
+    for name, (x, y) in FITS.items():
+        fit = regression.fit_columns(df, x, y)
+        summary[name] = {"slope": fit.slope, "intercept": fit.intercept, "r2": fit.r2, "n": fit.n}
+    return summary
+
+
+def write(summary, facts_path=paths.FACTS_PATH):
+    # Written aside and renamed so other processes never read a half-written file
+    path = summary_path(facts_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def read(facts_path=paths.FACTS_PATH):
+    """Stored summary, or None when it has not been written yet."""
+    try:
+        with open(summary_path(facts_path)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def strength(r2):
+    """Plain-language size of an R² value for the insight text."""
+    if r2 < 0.3:
+        return "low"
+    if r2 < 0.7:
+        return "moderate"
+    return "high"
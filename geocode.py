@@ -0,0 +1,190 @@
+# Station → state assignment against the us-states.json polygons
+# python geocode.py
+#
+# Every station gets a state from its coordinates, so rows with a missing or wrong `State` value
+# are no longer dropped by the per-state joins. Candidates are prefiltered by state bounding box
+# and then tested with vectorized ray casting (geometry.points_in_shape). Results are cached by
+# (ID, coordinates, recorded state) in a parquet file, so a refresh only geocodes new or changed rows.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import datastore
+import geometry
+
+GEOCODE_CACHE_PATH = os.path.join(datastore.DERIVED_DIR, "station_states.parquet")
+KEY_COLUMNS = ["ID", "Latitude", "Longitude", "Recorded"]
+
+RESOLVE_VERSION = 2     # Bump when resolve_states() changes, so cached assignments are redone
+
+# Every station is tested against the polygons, and its recorded state is kept only when the point
+# lies in that state's polygon or close to its outline. The outlines are coarse, so:
+# - stations of border towns often fall just across a land border. They are kept when they are
+#   within BORDER_KM of the recorded state and about as far from the containing state's outline
+#   (within SHARED_BORDER_KM), i.e. next to a border the two outlines share. A point across a
+#   river or bay from its recorded state (Jersey City recorded as NY) is farther from the recorded
+#   outline than from the containing one and is corrected.
+# - stations on islands and coastlines often fall outside every polygon. They are kept within
+#   COAST_KM of the recorded state's outline.
+BORDER_KM = 5.0
+SHARED_BORDER_KM = 0.1
+COAST_KM = 50.0
+
+
+def locate_states(lat, lon):
+    """State code of the polygon containing each point (None outside every polygon)."""
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    shapes = geometry.state_shapes("full")
+    found = np.full(len(lat), -1, dtype=np.int64)
+    for i, shape in enumerate(shapes):
+        west, south, east, north = shape.bbox
+        candidates = np.flatnonzero((found < 0) & (lon >= west) & (lon <= east) & (lat >= south) & (lat <= north))
+        if len(candidates):
+            inside = geometry.points_in_shape(lon[candidates], lat[candidates], shape)
+            found[candidates[inside]] = i
+    codes = np.array([shape.code for shape in shapes] + [None], dtype=object)
+    return codes[found]
+
+
+def nearest_states(lat, lon):
+    """State code of the nearest polygon vertex (for points offshore or outside the coarse outlines)."""
+    shapes = geometry.state_shapes("full")
+    vertices = np.concatenate([ring for shape in shapes for polygon in shape.polygons for ring in polygon])
+    owners = np.concatenate([[shape.code] * sum(len(ring) for polygon in shape.polygons for ring in polygon) for shape in shapes])
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    codes = np.empty(len(lat), dtype=object)
+    for start in range(0, len(lat), 1024):
+        dlon = (lon[start:start + 1024, None] - vertices[None, :, 0]) * np.cos(np.radians(lat[start:start + 1024, None]))
+        dlat = lat[start:start + 1024, None] - vertices[None, :, 1]
+        codes[start:start + 1024] = owners[np.argmin(dlon ** 2 + dlat ** 2, axis=1)]
+    return codes
+
+
+def distances_to_states(lat, lon, codes):
+    """Distance (km) from each point to the outline of its state in `codes` (inf for unknown codes)."""
+    shapes = {shape.code: shape for shape in geometry.state_shapes("full")}
+    codes = np.asarray(codes, dtype=object)
+    distances = np.full(len(codes), np.inf)
+    for code, shape in shapes.items():
+        rows = np.flatnonzero(codes == code)
+        if len(rows):
+            distances[rows] = geometry.distance_to_shape(lon[rows], lat[rows], shape)
+    return distances
+
+
+def resolve_states(lat, lon, recorded):
+    """(state codes, source) per station; source is "recorded", "polygon" or "nearest"."""
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    recorded = np.asarray(recorded, dtype=object)
+    states = np.empty(len(lat), dtype=object)
+    source = np.empty(len(lat), dtype=object)
+
+    # Containing polygon of every station with coordinates
+    has_coords = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+    located = np.full(len(lat), None, dtype=object)
+    located[has_coords] = locate_states(lat[has_coords], lon[has_coords])
+    inside = located != None    # noqa: E711 (elementwise comparison on an object array)
+
+    # Keep the recorded state inside its polygon, or near its outline (see BORDER_KM, COAST_KM)
+    keep = inside & (located == recorded)
+    near = np.flatnonzero(~keep & np.isin(recorded, list(geometry.state_bounds())))
+    near = near[np.isfinite(lat[near]) & np.isfinite(lon[near])]
+    to_recorded = distances_to_states(lat[near], lon[near], recorded[near])
+    across = inside[near]
+    to_located = distances_to_states(lat[near[across]], lon[near[across]], located[near[across]])
+    keep[near[across]] = (to_recorded[across] <= BORDER_KM) & (to_recorded[across] <= to_located + SHARED_BORDER_KM)
+    keep[near[~across]] = to_recorded[~across] <= COAST_KM
+    states[keep] = recorded[keep]
+    source[keep] = "recorded"
+
+    # Otherwise the containing polygon, or the nearest one for points outside every polygon
+    rest = np.flatnonzero(~keep & inside)
+    states[rest] = located[rest]
+    source[rest] = "polygon"
+    outside = np.flatnonzero(~keep & ~inside & np.isfinite(lat) & np.isfinite(lon))
+    states[outside] = nearest_states(lat[outside], lon[outside])
+    source[outside] = "nearest"
+    return states, source
+
+
+def _keys(df):
+    return pd.DataFrame({
+        "ID": df["ID"].astype("int64").to_numpy(),
+        "Latitude": df["Latitude"].astype("float64").to_numpy(),
+        "Longitude": df["Longitude"].astype("float64").to_numpy(),
+        "Recorded": df["State"].astype("string").fillna("").str.strip().str.upper().to_numpy(dtype=object),
+    })
+
+
+def _empty_cache():
+    return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in
+                         [("ID", "int64"), ("Latitude", "float64"), ("Longitude", "float64"),
+                          ("Recorded", "object"), ("State", "object"), ("Source", "object")]})
+
+
+def read_cache(path=GEOCODE_CACHE_PATH):
+    """Cached assignments for the current geometry and rules (empty if missing or built otherwise)."""
+    try:
+        table = pq.read_table(path)
+    except FileNotFoundError:
+        return _empty_cache()
+    metadata = table.schema.metadata or {}
+    if (metadata.get(b"geometry_sha1", b"").decode() != geometry.fingerprint()
+            or metadata.get(b"resolve_version", b"").decode() != str(RESOLVE_VERSION)):
+        return _empty_cache()
+    return table.to_pandas()
+
+
+def write_cache(df_cache, path=GEOCODE_CACHE_PATH):
+    table = pa.Table.from_pandas(df_cache, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"geometry_sha1"] = geometry.fingerprint().encode()
+    metadata[b"resolve_version"] = str(RESOLVE_VERSION).encode()
+    # Written aside and renamed so other processes never read a half-written cache
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+    os.replace(tmp_path, path)
+
+
+def assign_states(df_stations, cache_path=GEOCODE_CACHE_PATH):
+    """Resolved state code for every row of a frame with ID, Latitude, Longitude and State columns.
+
+    Pass `cache_path=None` to skip the on-disk cache.
+    """
+    keys = _keys(df_stations)
+    df_cache = read_cache(cache_path) if cache_path else _empty_cache()
+    merged = keys.merge(df_cache.drop_duplicates(KEY_COLUMNS), on=KEY_COLUMNS, how="left")
+
+    # Geocode only the rows the cache has not seen
+    missing = merged["State"].isna().to_numpy()
+    if missing.any():
+        new = keys[missing].drop_duplicates(KEY_COLUMNS)
+        states, source = resolve_states(new["Latitude"], new["Longitude"], new["Recorded"])
+        new = new.assign(State=states, Source=source)
+        df_cache = pd.concat([df_cache, new], ignore_index=True).drop_duplicates(KEY_COLUMNS)
+        merged = keys.merge(df_cache, on=KEY_COLUMNS, how="left")
+        if cache_path:
+            # Keep only the rows of the current table
+            write_cache(merged.drop_duplicates(KEY_COLUMNS), cache_path)
+
+    return pd.Series(merged["State"].to_numpy(), index=df_stations.index, name="State")
+
+
+if __name__ == "__main__":
+    import time
+
+    started = time.perf_counter()
+    df = datastore.read_stations(["ID", "Latitude", "Longitude", "State"])
+    keys = _keys(df)
+    states, source = resolve_states(keys["Latitude"], keys["Longitude"], keys["Recorded"])
+    print(f"Geocoded {len(df):,} stations in {time.perf_counter() - started:.2f}s")
+    print(pd.Series(source).value_counts().to_string())
+    changed = states != keys["Recorded"].to_numpy()
+    print(f"{changed.sum():,} stations assigned a different state than recorded")
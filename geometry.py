@@ -0,0 +1,211 @@
+# Shared U.S. state geometry from us-states.json
+# The file is read once per process. Polygons are simplified (Ramer-Douglas-Peucker) to a few
+# tolerance levels: the choropleths use a simplified level as their `geojson=`, and station
+# geocoding runs point-in-polygon tests against the full-resolution rings.
+# us-states.json covers the 50 states, keyed by 2-letter code; the District of Columbia is added
+# from EXTRA_FEATURES (the gap the file leaves between the Maryland and Virginia outlines).
+
+import hashlib
+import json
+from functools import lru_cache
+
+import numpy as np
+
+GEOJSON_PATH = "us-states.json"
+
+# Simplification tolerance per level (degrees)
+TOLERANCES = {"full": 0.0, "medium": 0.05, "coarse": 0.1}
+CHOROPLETH_LEVEL = "coarse"
+COORD_DECIMALS = 2
+
+# Features missing from us-states.json. The DC ring uses the Maryland and Virginia vertices around
+# the gap, so it shares their borders exactly.
+EXTRA_FEATURES = [{
+    "type": "Feature",
+    "id": "DC",
+    "properties": {"name": "District of Columbia"},
+    "geometry": {"type": "Polygon", "coordinates": [[
+        [-77.040741, 38.791222], [-76.909294, 38.895284], [-77.035264, 38.993869],
+        [-77.117418, 38.933623], [-77.040741, 38.791222],
+    ]]},
+}]
+KM_PER_DEGREE = 111.32          # Length of a degree of latitude
+
+
+class StateShape:
+    """One state: polygons as lists of (n, 2) lon/lat ring arrays (exterior ring first) and its bbox."""
+
+    def __init__(self, code, name, polygons):
+        self.code = code
+        self.name = name
+        self.polygons = polygons
+        points = np.concatenate([ring for polygon in polygons for ring in polygon])
+        self.bbox = (points[:, 0].min(), points[:, 1].min(), points[:, 0].max(), points[:, 1].max())   # (west, south, east, north)
+
+    def __repr__(self):
+        return f"StateShape({self.code}, {len(self.polygons)} polygons)"
+
+
+@lru_cache(maxsize=1)
+def _read_geojson(path=GEOJSON_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _features():
+    return _read_geojson()["features"] + EXTRA_FEATURES
+
+
+def fingerprint():
+    """SHA-1 of us-states.json and EXTRA_FEATURES (changes whenever a state outline does)."""
+    digest = hashlib.sha1()
+    with open(GEOJSON_PATH, "rb") as f:
+        digest.update(f.read())
+    digest.update(json.dumps(EXTRA_FEATURES, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _polygons(geometry):
+    coords = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+    return [[np.asarray(ring, dtype=np.float64) for ring in polygon] for polygon in coords]
+
+
+def _signed_area(ring):
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * np.sum(x[:-1] * y[1:] - x[1:] * y[:-1])
+
+
+def _rdp_keep(points, tolerance):
+    """Ramer-Douglas-Peucker on an open polyline → boolean mask of the points to keep."""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = points[start], points[end]
+        inner = points[start + 1:end]
+        ab = b - a
+        length = np.hypot(*ab)
+        if length == 0:
+            dist = np.hypot(*(inner - a).T)
+        else:
+            dist = np.abs(ab[0] * (inner[:, 1] - a[1]) - ab[1] * (inner[:, 0] - a[0])) / length
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep
+
+
+def simplify_ring(ring, tolerance):
+    """Simplified closed ring, or None if it collapses below a triangle."""
+    if tolerance <= 0:
+        return ring
+    # Split the closed ring at the point farthest from its start so both halves are open polylines
+    far = int(np.argmax(np.hypot(*(ring - ring[0]).T)))
+    keep = np.concatenate([_rdp_keep(ring[:far + 1], tolerance)[:-1], _rdp_keep(ring[far:], tolerance)])
+    simplified = ring[keep]
+    return simplified if len(simplified) >= 4 else None
+
+
+@lru_cache(maxsize=None)
+def state_shapes(level="full"):
+    """StateShape per feature of us-states.json (plus EXTRA_FEATURES) at one simplification level."""
+    shapes = []
+    for feature in _features():
+        # The extra features have only a few vertices, so they are kept as drawn at every level
+        tolerance = 0.0 if feature in EXTRA_FEATURES else TOLERANCES[level]
+        source = _polygons(feature["geometry"])
+        polygons = []
+        for polygon in source:
+            exterior = simplify_ring(polygon[0], tolerance)
+            if exterior is None:
+                continue
+            # d3-geo (plotly.js) expects clockwise exterior rings and counter-clockwise holes
+            if _signed_area(exterior) > 0:
+                exterior = exterior[::-1]
+            holes = [hole for hole in (simplify_ring(r, tolerance) for r in polygon[1:]) if hole is not None]
+            holes = [hole[::-1] if _signed_area(hole) < 0 else hole for hole in holes]
+            polygons.append([exterior] + holes)
+        if not polygons:
+            # Every part collapsed: keep the largest polygon unsimplified
+            polygons = [max(source, key=lambda p: abs(_signed_area(p[0])))]
+        shapes.append(StateShape(feature["id"], feature["properties"]["name"], polygons))
+    return shapes
+
+
+def state_bounds(level="full"):
+    """{state code: (west, south, east, north)}"""
+    return {shape.code: shape.bbox for shape in state_shapes(level)}
+
+
+@lru_cache(maxsize=None)
+def state_geojson(level=CHOROPLETH_LEVEL):
+    """FeatureCollection for `px.choropleth(geojson=..., featureidkey="id")` with per-feature bbox."""
+    features = []
+    for shape in state_shapes(level):
+        polygons = [[np.round(ring, COORD_DECIMALS).tolist() for ring in polygon] for polygon in shape.polygons]
+        features.append({
+            "type": "Feature",
+            "id": shape.code,
+            "properties": {"name": shape.name},
+            "bbox": [round(float(v), COORD_DECIMALS) for v in shape.bbox],
+            "geometry": {"type": "MultiPolygon", "coordinates": polygons},
+        })
+    bboxes = np.array([feature["bbox"] for feature in features])
+    return {
+        "type": "FeatureCollection",
+        "bbox": [bboxes[:, 0].min(), bboxes[:, 1].min(), bboxes[:, 2].max(), bboxes[:, 3].max()],
+        "features": features,
+    }
+
+
+def points_in_ring(lon, lat, ring):
+    """Even-odd ray casting of many points against one closed ring (vectorized over the points)."""
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    inside = np.zeros(lon.shape, dtype=bool)
+    x1, y1 = ring[:-1, 0], ring[:-1, 1]
+    x2, y2 = ring[1:, 0], ring[1:, 1]
+    for ax, ay, bx, by in zip(x1, y1, x2, y2):
+        crosses = (ay > lat) != (by > lat)
+        if crosses.any():
+            x_cross = ax + (lat[crosses] - ay) * (bx - ax) / (by - ay)
+            inside[crosses] ^= lon[crosses] < x_cross
+    return inside
+
+
+def points_in_shape(lon, lat, shape):
+    """Which points fall inside a StateShape (holes excluded)."""
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    inside = np.zeros(lon.shape, dtype=bool)
+    for polygon in shape.polygons:
+        in_polygon = points_in_ring(lon, lat, polygon[0])
+        for hole in polygon[1:]:
+            in_polygon &= ~points_in_ring(lon, lat, hole)
+        inside |= in_polygon
+    return inside
+
+
+def distance_to_shape(lon, lat, shape):
+    """Distance (km) from each point to the nearest edge of a StateShape (equirectangular)."""
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    # Local x/y in km around each point, so the segment math is planar
+    kx = KM_PER_DEGREE * np.cos(np.radians(lat))
+    best = np.full(lon.shape, np.inf)
+    for polygon in shape.polygons:
+        for ring in polygon:
+            ax, ay = (ring[:-1, 0] - lon[:, None]) * kx[:, None], (ring[:-1, 1] - lat[:, None]) * KM_PER_DEGREE
+            bx, by = (ring[1:, 0] - lon[:, None]) * kx[:, None], (ring[1:, 1] - lat[:, None]) * KM_PER_DEGREE
+            dx, dy = bx - ax, by - ay
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = np.clip(-(ax * dx + ay * dy) / (dx * dx + dy * dy), 0, 1)
+            t = np.nan_to_num(t)        # Zero-length edges
+            best = np.minimum(best, np.hypot(ax + t * dx, ay + t * dy).min(axis=1))
+    return best
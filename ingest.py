@@ -0,0 +1,265 @@
+# Incremental ingestion of AFDC station exports into the state-partitioned station dataset
+# python ingest.py alt_fuel_stations.csv [more.csv|.parquet ...] [--dataset stations] [--chunk-rows 100000]
+#
+# The first ingest (e.g. `python ingest.py EV_Station_Location.parquet`) creates the dataset; from
+# then on datastore.py reads it instead of the single parquet file. Layout (see partitions.py):
+#   stations/State=CA/part-<batch>-<chunk>.parquet   station rows, State taken from geocode.py
+#   stations/_keys.parquet                           ID, coordinate key, row hash, state and file of every station
+#   stations/_manifest.json                          ingest history (changes with every ingest)
+#
+# Exports are read in chunks and de-duplicated by station ID, or by coordinates (~1 m) for rows
+# without one (those stations get negative IDs). A row identical to the stored station is skipped,
+# a changed one replaces it. Only the new and changed rows are geocoded and written, only the files
+# that held replaced rows are rewritten, and only the station counts of the touched states are
+# updated in state_facts.parquet.
+# A daily full export therefore costs a hash per row plus work proportional to what changed.
+
+import argparse
+import json
+import os
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+import datastore
+import geocode
+import partitions
+import schema
+import statefacts
+
+KEYS_FILE = "_keys.parquet"
+CHUNK_ROWS = 100_000
+COORD_SCALE = 1e5                   # Coordinate keys in 1e-5 degrees (~1 m)
+MAX_FILES_PER_PARTITION = 32        # Partitions with more files are compacted into one
+
+
+def read_chunks(path, chunk_rows=CHUNK_ROWS):
+    """Yield the rows of a CSV or parquet export as DataFrames of at most `chunk_rows` rows."""
+    if path.endswith(".parquet"):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+        return
+    # Keep every CSV column as text; normalize() converts them
+    reader = pacsv.open_csv(path, convert_options=pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in schema.STATION_SCHEMA.names + ["State"]}
+    ))
+    pending, rows = [], 0
+    for batch in reader:
+        pending.append(batch)
+        rows += batch.num_rows
+        if rows >= chunk_rows:
+            yield pa.Table.from_batches(pending).to_pandas()
+            pending, rows = [], 0
+    if pending:
+        yield pa.Table.from_batches(pending).to_pandas()
+
+
+def normalize(df):
+    """Export rows → schema.STATION_SCHEMA columns plus the recorded `State`."""
+    df = df.rename(columns=lambda c: str(c).strip())
+    out = pd.DataFrame(index=df.index)
+    for field in schema.STATION_SCHEMA:
+        column = df[field.name] if field.name in df else pd.Series(None, index=df.index, dtype=object)
+        if pa.types.is_floating(field.type):
+            out[field.name] = pd.to_numeric(column, errors="coerce").astype("float64")
+        elif pa.types.is_integer(field.type):
+            out[field.name] = pd.to_numeric(column, errors="coerce").astype("Int64")
+        else:
+            out[field.name] = column.astype("string").str.strip()
+    out["State"] = (df["State"] if "State" in df else pd.Series(None, index=df.index)).astype("string").str.strip().str.upper()
+    return out.reset_index(drop=True)
+
+
+def coord_keys(df):
+    return (
+        (df["Latitude"] * COORD_SCALE).round().astype("Int64"),
+        (df["Longitude"] * COORD_SCALE).round().astype("Int64"),
+    )
+
+
+def row_hashes(df):
+    return pd.util.hash_pandas_object(df[schema.STATION_SCHEMA.names + ["State"]], index=False).to_numpy()
+
+
+def _empty_keys():
+    return pd.DataFrame({
+        "ID": pd.Series(dtype="int64"), "LatKey": pd.Series(dtype="Int64"), "LonKey": pd.Series(dtype="Int64"),
+        "Hash": pd.Series(dtype="uint64"), "State": pd.Series(dtype="object"), "File": pd.Series(dtype="object"),
+    })
+
+
+def read_keys(dataset):
+    try:
+        return pq.read_table(os.path.join(dataset, KEYS_FILE)).to_pandas()
+    except FileNotFoundError:
+        return _empty_keys()
+
+
+def read_manifest(dataset):
+    try:
+        with open(os.path.join(dataset, datastore.DATASET_MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"batches": []}
+
+
+def _write_json(path, data):
+    # Write next to the target and rename, so readers never see a half-written manifest
+    with open(path + ".tmp", "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def _write_partition_file(df, dataset, state, name):
+    directory = partitions.partition_dir(dataset, state)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    table = pa.Table.from_pandas(df[schema.STATION_SCHEMA.names], schema=schema.STATION_SCHEMA, preserve_index=False)
+    pq.write_table(table.replace_schema_metadata(None), path)
+    return os.path.relpath(path, dataset)
+
+
+def ingest_chunk(df, keys, dataset, batch, chunk):
+    """Write the new and changed rows of one normalized chunk; returns (new keys, replaced keys, stats)."""
+    stats = {"rows": len(df), "added": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+    df["LatKey"], df["LonKey"] = coord_keys(df)
+
+    # Rows without an ID take the ID of a stored station at the same coordinates, or a new one.
+    # New ones are negative (counting down), so they never collide with AFDC IDs, which are positive
+    # and assigned in increasing order.
+    no_id = df["ID"].isna()
+    if no_id.any():
+        by_coords = keys.drop_duplicates(["LatKey", "LonKey"]).set_index(["LatKey", "LonKey"])["ID"]
+        matched = by_coords.reindex(pd.MultiIndex.from_arrays([df.loc[no_id, "LatKey"], df.loc[no_id, "LonKey"]])).to_numpy()
+        df.loc[no_id, "ID"] = matched
+        # Unmatched rows at the same coordinates within the chunk are one station
+        unmatched = df["ID"].isna().to_numpy()
+        coords = df.loc[unmatched, ["LatKey", "LonKey"]]
+        located = coords.notna().all(axis=1).to_numpy()
+        group = np.empty(len(coords), dtype=np.int64)
+        group[located] = coords[located].groupby(["LatKey", "LonKey"], sort=False).ngroup().to_numpy()
+        group[~located] = group[located].max(initial=-1) + 1 + np.arange((~located).sum())
+        next_id = int(min(0, keys["ID"].min() if len(keys) else 0, df["ID"].min() if df["ID"].notna().any() else 0)) - 1
+        df.loc[unmatched, "ID"] = next_id - group
+    df["ID"] = df["ID"].astype("int64")
+
+    # Last occurrence of an ID in the chunk wins
+    df = df.drop_duplicates("ID", keep="last").reset_index(drop=True)
+    df["Hash"] = row_hashes(df)
+    stored = pd.Index(keys["ID"]).get_indexer(df["ID"])
+    stored_hashes = np.append(keys["Hash"].to_numpy(dtype=np.uint64), np.uint64(0))     # [-1] for new IDs
+    is_new = stored < 0
+    is_changed = ~is_new & (stored_hashes[stored] != df["Hash"].to_numpy())
+    stats["unchanged"] = int((~is_new & ~is_changed).sum())
+
+    replaced = keys[keys["ID"].isin(df.loc[is_changed, "ID"])]
+    write = df[is_new | is_changed].assign(New=is_new[is_new | is_changed]).reset_index(drop=True)
+    if len(write) == 0:
+        return _empty_keys(), replaced, stats
+
+    # Geocode only the rows being written, then one file per state
+    states, _ = geocode.resolve_states(write["Latitude"], write["Longitude"], write["State"].fillna(""))
+    write["State"] = states
+    # Rows without coordinates or a valid state cannot be placed in a partition
+    stats["skipped"] = int(write["State"].isna().sum())
+    write = write[write["State"].notna()]
+    stats["added"] = int(write["New"].sum())
+    stats["updated"] = int(len(write) - stats["added"])
+    files = {}
+    for state, rows in write.groupby("State", sort=False):
+        files[state] = _write_partition_file(rows, dataset, state, f"part-{batch}-{chunk:05d}.parquet")
+    new_keys = write[["ID", "LatKey", "LonKey", "Hash", "State"]].assign(File=write["State"].map(files))
+    return new_keys, replaced, stats
+
+
+def remove_rows(dataset, replaced):
+    """Drop replaced stations from the files that held them (only those files are rewritten)."""
+    for name, rows in replaced.groupby("File"):
+        path = os.path.join(dataset, name)
+        table = pq.read_table(path)
+        keep = ~np.isin(table["ID"].to_numpy(), rows["ID"].to_numpy())
+        if keep.any():
+            pq.write_table(table.filter(pa.array(keep)), path)
+        else:
+            os.remove(path)
+
+
+def compact(dataset, state, keys, batch):
+    """Merge the files of one partition into one; returns the keys with the new file name."""
+    paths = partitions.partition_files(dataset, [state])[state]
+    if len(paths) <= MAX_FILES_PER_PARTITION:
+        return keys
+    df = pq.read_table(paths, schema=schema.STATION_SCHEMA).to_pandas()
+    name = _write_partition_file(df, dataset, state, f"part-{batch}-compacted.parquet")
+    for path in paths:
+        os.remove(path)
+    keys.loc[keys["State"] == state, "File"] = name
+    return keys
+
+
+def ingest(paths, dataset=None, chunk_rows=CHUNK_ROWS, update_facts=True):
+    """Ingest station exports into the dataset; returns the batch record written to the manifest."""
+    dataset = dataset or datastore.STATION_DATASET
+    os.makedirs(dataset, exist_ok=True)
+    started = time.perf_counter()
+    previous_sha1 = statefacts.source_fingerprint() if update_facts and os.path.exists(os.path.join(dataset, datastore.DATASET_MANIFEST)) else None
+    batch = time.strftime("%Y%m%d%H%M%S") + "-" + uuid.uuid4().hex[:6]
+    keys = read_keys(dataset)
+    totals = {"rows": 0, "added": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+    touched = set()
+    all_replaced = []
+
+    chunk = 0
+    for path in paths:
+        for df in read_chunks(path, chunk_rows):
+            new_keys, replaced, stats = ingest_chunk(normalize(df), keys, dataset, batch, chunk)
+            keys = pd.concat([keys[~keys["ID"].isin(replaced["ID"])], new_keys], ignore_index=True)
+            all_replaced.append(replaced)
+            touched.update(new_keys["State"])
+            touched.update(replaced["State"])
+            for name in totals:
+                totals[name] += stats[name]
+            chunk += 1
+
+    replaced = pd.concat(all_replaced, ignore_index=True) if all_replaced else _empty_keys()
+    remove_rows(dataset, replaced)
+    for state in touched:
+        keys = compact(dataset, state, keys, batch)
+    pq.write_table(pa.Table.from_pandas(keys, preserve_index=False), os.path.join(dataset, KEYS_FILE))
+
+    record = dict(totals, batch=batch, sources=[os.path.basename(path) for path in paths],
+                  states=sorted(touched), stations=len(keys),
+                  ingested_at=time.strftime("%Y-%m-%dT%H:%M:%S"), seconds=round(time.perf_counter() - started, 3))
+    manifest = read_manifest(dataset)
+    manifest["batches"].append(record)
+    manifest["stations"] = len(keys)
+    _write_json(os.path.join(dataset, datastore.DATASET_MANIFEST), manifest)
+
+    # Station counts of the touched states only (full build for a new dataset or a stale table)
+    if update_facts and os.path.abspath(dataset) == os.path.abspath(datastore.STATION_DATASET):
+        counts = keys[keys["State"].isin(touched)].groupby("State").size().to_dict()
+        counts.update({state: 0 for state in touched if state not in counts})
+        if previous_sha1 is None:
+            statefacts.build()
+        else:
+            statefacts.update_station_counts(counts, previous_sha1)
+    return record
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest AFDC station exports into the state-partitioned dataset.")
+    parser.add_argument("paths", nargs="+", help="CSV or parquet exports")
+    parser.add_argument("--dataset", default=datastore.STATION_DATASET, help="Dataset directory")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--no-facts", action="store_true", help="Do not update state_facts.parquet")
+    args = parser.parse_args()
+
+    record = ingest(args.paths, args.dataset, args.chunk_rows, update_facts=not args.no_facts)
+    print(f"{record['rows']:,} rows: {record['added']:,} added, {record['updated']:,} updated, "
+          f"{record['unchanged']:,} unchanged, {record['skipped']:,} skipped; {len(record['states'])} states touched, "
+          f"{record['stations']:,} stations in {args.dataset}/ ({record['seconds']:.2f}s)")
@@ -3,8 +3,8 @@
 # import streamlit as st
 # import pandas as pd
 # import folium
-# from folium.plugins import MarkerCluster
 # from streamlit_folium import st_folium
+# from markers import station_marker_cluster
 
 # # 데이터 로드 (캐싱 적용)
 # @st.cache_data
@@ -16,15 +16,9 @@
 # def create_ev_map(data):
 #     # 지도 생성
 #     m = folium.Map(location=[39.5, -98.35], zoom_start=4)
-#     marker_cluster = MarkerCluster().add_to(m)
 
-#     # 모든 데이터 포인트 표시 (샘플링 없음)
-#     for idx, row in data.iterrows():
-#         folium.Marker(
-#             location=[row['Latitude'], row['Longitude']],
-#             popup=row.get('Station_Name', 'Unknown'),
-#             icon=folium.Icon(color='green', icon='bolt', prefix='fa')
-#         ).add_to(marker_cluster)
+#     # 모든 데이터 포인트 표시 (샘플링 없음, 한 번의 payload로 전송)
+#     station_marker_cluster(data).add_to(m)
 
 #     return m
 
@@ -41,11 +35,11 @@
 # st.markdown("### Overview: Electric Vehicle Data and Infrastructure in the U.S.")
 
 import streamlit as st
-import pandas as pd
 import folium
-from folium.plugins import MarkerCluster
 from streamlit_folium import st_folium
 import streamlit.components.v1 as components
+from markers import station_marker_cluster
+import datastore
 
 # 페이지 설정
 st.set_page_config(
@@ -58,21 +52,17 @@ st.set_page_config(
 # 제목
 st.title("Locations of Electric Vehicle Charging Stations in the U.S.")
 
-# 데이터 로드 (빠르게 캐싱)
-@st.cache_data
+# 데이터 로드 (지도에 필요한 컬럼만, 프로세스당 한 번)
 def load_ev_data():
-    return pd.read_parquet('EV_Station_Location.parquet')
+    return datastore.stations(['Latitude', 'Longitude', 'Station Name'])
 
 # 지도 생성 함수 (HTML로 변환하여 저장)
 def create_ev_map_html(data):
     # Folium 지도 생성
     m = folium.Map(location=[39.5, -98.35], zoom_start=4.5, tiles="CartoDB positron")
     
-    # 위치 데이터만 리스트로 변환 (속도 개선)
-    locations = list(zip(data['Latitude'], data['Longitude']))
-    
-    # FastMarkerCluster 적용
-    MarkerCluster(locations).add_to(m)
+    # FastMarkerCluster 적용 (위치 데이터를 한 번에 payload로 변환)
+    station_marker_cluster(data).add_to(m)
     
     # Folium 지도 객체를 HTML로 변환하여 반환
     return m._repr_html_()
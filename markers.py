@@ -0,0 +1,85 @@
+# Compact marker payloads for the folium station maps
+# Replaces the per-row `iterrows()` + `folium.Marker` loops: the columns are turned into one
+# array payload in a single vectorized pass and the markers are created in the browser.
+
+import numpy as np
+from branca.element import MacroElement
+from folium.plugins import FastMarkerCluster
+from jinja2 import Template
+
+COORD_DECIMALS = 5      # ~1 m precision, keeps the embedded payload small
+
+# JavaScript callbacks (One row of the payload → one Leaflet layer)
+STATION_CALLBACK = """
+function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {
+        icon: L.AwesomeMarkers.icon({icon: "bolt", prefix: "fa", markerColor: "green"})
+    });
+    marker.bindPopup(document.createTextNode(row[2]));
+    return marker;
+}"""
+
+CLUSTER_CALLBACK = """
+function (row) {
+    if (row[3] > 1) {
+        return L.circleMarker(new L.LatLng(row[0], row[1]), {
+            radius: 8 + 4 * Math.log10(row[3]),
+            color: row[4] || "#2E7D32",
+            fillColor: row[4] || "#2E7D32",
+            fill: true,
+            fillOpacity: 0.6
+        }).bindTooltip(row[3].toLocaleString() + " stations");
+    }
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {
+        icon: L.AwesomeMarkers.icon({icon: "bolt", prefix: "fa", markerColor: "green"})
+    });
+    marker.bindPopup(document.createTextNode(row[2]));
+    return marker;
+}"""
+
+
+def marker_payload(data, name_column="Station Name", extra_columns=(), default_name="EV Station"):
+    """Build `[[lat, lon, name, *extra], ...]` from a DataFrame in one vectorized pass."""
+    coords = np.round(data[["Latitude", "Longitude"]].to_numpy(dtype=np.float64), COORD_DECIMALS)
+    valid = np.isfinite(coords).all(axis=1)
+
+    if name_column in data:
+        names = data[name_column].astype(object).where(data[name_column].notna(), default_name).astype(str).to_numpy()
+    else:
+        names = np.full(len(data), default_name, dtype=object)
+
+    columns = [coords[:, 0].astype(object), coords[:, 1].astype(object), names.astype(object)]
+    columns += [data[column].to_numpy().astype(object) for column in extra_columns]
+    return np.column_stack(columns)[valid].tolist()
+
+
+def station_marker_cluster(data, name_column="Station Name", **kwargs):
+    """FastMarkerCluster of every station in `data` (Clustered in the browser)."""
+    return FastMarkerCluster(marker_payload(data, name_column), callback=STATION_CALLBACK, **kwargs)
+
+
+class StationLayer(MacroElement):
+    """Adds every row of a marker payload to its parent layer without further clustering.
+
+    Used for clusters that were already computed on the server (see clustering.py):
+    the payload rows are `[lat, lon, name, count, color]`.
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            (function(){
+                var callback = {{ this.callback }};
+                var data = {{ this.data|tojson }};
+                for (var i = 0; i < data.length; i++) {
+                    callback(data[i]).addTo({{ this._parent.get_name() }});
+                }
+            })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, data, callback=CLUSTER_CALLBACK):
+        super().__init__()
+        self._name = "StationLayer"
+        self.data = data
+        self.callback = callback.strip()
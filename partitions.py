@@ -0,0 +1,58 @@
+# State-partitioned station storage
+# The station dataset (written by ingest.py) keeps one hive-style directory per state:
+#   stations/State=CA/part-*.parquet
+# read_partitions() only lists and opens the directories of the requested states, so a single-state
+# query reads that state's files and nothing else (no discovery of the whole tree).
+
+import glob
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PARTITION_KEY = "State"
+
+
+def partition_dir(dataset, state):
+    return os.path.join(dataset, f"{PARTITION_KEY}={state}")
+
+
+def partition_states(dataset):
+    """State codes that have a partition directory."""
+    prefix = PARTITION_KEY + "="
+    return sorted(name[len(prefix):] for name in os.listdir(dataset) if name.startswith(prefix))
+
+
+def partition_files(dataset, states):
+    """Parquet files of the given states' partitions (states without a partition are ignored)."""
+    return {state: sorted(glob.glob(os.path.join(partition_dir(dataset, state), "*.parquet"))) for state in states}
+
+
+def read_partitions(dataset, states, columns=None, filters=None, read_dictionary=None):
+    """Read the requested states' partitions as one Arrow table with a dictionary `State` column.
+
+    `columns` may include `State`; `filters` (row filters on the file columns, as for
+    pq.read_table) are applied within the selected partitions.
+    """
+    files = partition_files(dataset, sorted(states))
+    file_columns = None if columns is None else [c for c in columns if c != PARTITION_KEY]
+    tables = []
+    for state, paths in files.items():
+        if not paths:
+            continue
+        table = pq.read_table(paths, columns=file_columns, filters=filters, read_dictionary=read_dictionary, partitioning=None)
+        if columns is None or PARTITION_KEY in columns:
+            state_column = pa.DictionaryArray.from_arrays(pa.array(np.zeros(table.num_rows, dtype=np.int32)), pa.array([state]))
+            table = table.append_column(PARTITION_KEY, state_column)
+        tables.append(table)
+    if not tables:
+        return None
+    table = pa.concat_tables(tables)
+    return table if columns is None else table.select(list(columns))
+
+
+def partition_bytes(dataset, states=None):
+    """On-disk size of the given states' partitions (all states by default)."""
+    states = partition_states(dataset) if states is None else states
+    return sum(os.path.getsize(path) for paths in partition_files(dataset, states).values() for path in paths)
@@ -0,0 +1,27 @@
+# Data file locations
+# Kept apart from datastore.py so the text-only pages can find a derived file (fitsummary.py)
+# without importing pandas, pyarrow or the loaders; datastore.py re-exports every name.
+
+import os
+
+# Data files (each can be overridden with an environment variable, e.g.
+# EV_STATION_PATH=synthetic/EV_Station_Location_x10.parquet for a file from synthetic.py)
+STATION_PATH = os.environ.get("EV_STATION_PATH", "EV_Station_Location.parquet")
+REGISTRATION_PATH = os.environ.get("EV_REGISTRATION_PATH", "Population Estimate & EV Count.csv")
+DENSITY_PATH = os.environ.get("EV_DENSITY_PATH", "ev_per_10000.csv")
+INFRASTRUCTURE_PATH = os.environ.get("EV_INFRASTRUCTURE_PATH", "U.S. Public Electric Vehicle Charging Infrastructure.csv")
+
+# Files derived from the station data (state fact table, geocoding cache) are kept next to it,
+# so a synthetic station file never overwrites the ones built from the real data
+DERIVED_DIR = os.environ.get("EV_DERIVED_DIR", os.path.dirname(STATION_PATH))
+
+# Station dataset written by ingest.py: one hive-style State=XX/ directory per state, plus a
+# manifest that changes with every ingest. Used instead of STATION_PATH once it exists.
+STATION_DATASET = os.environ.get("EV_STATION_DATASET", os.path.join(DERIVED_DIR, "stations"))
+DATASET_MANIFEST = "_manifest.json"
+
+# Cleaned, memory-mappable copies of the CSV inputs (databuild.py)
+ARROW_DIR = os.environ.get("EV_ARROW_DIR", os.path.join(DERIVED_DIR, "arrow"))
+
+# Per-state fact table (statefacts.py)
+FACTS_PATH = os.path.join(DERIVED_DIR, "state_facts.parquet")
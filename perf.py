@@ -0,0 +1,172 @@
+# Per-page performance timing for the dashboard
+# final.py runs each page inside perf.page(); the hot paths are marked with perf.stage() or
+# @perf.timed() as "load", "transform" or "figure". Whatever is left of the page time is "render"
+# (Streamlit element calls, st_folium, text). The bytes sent to the browser are counted per
+# element type on the outgoing Streamlit messages, so nothing is serialized twice.
+# Every rerun becomes one record: shown in the optional sidebar panel and appended to a JSONL
+# trace file (EV_PERF_TRACE, default perf_trace.jsonl; set it to "" to turn the file off).
+
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+import streamlit as st
+
+TRACE_PATH = os.environ.get("EV_PERF_TRACE", "perf_trace.jsonl")
+TRACE_MAX_BYTES = 50 * 2 ** 20      # Rotated to <path>.1 beyond this size
+HISTORY = 20                        # Records kept per session for the panel
+STAGES = ["load", "transform", "figure", "render"]
+
+_current = contextvars.ContextVar("perf_trace", default=None)
+_write_lock = threading.Lock()
+
+
+class PageTrace:
+    """Timings and payload sizes of one page run."""
+
+    def __init__(self, page, session_id):
+        self.page = page
+        self.session_id = session_id
+        self.stages = defaultdict(float)
+        self.payload = defaultdict(int)
+        self.messages = 0
+        self.status = "ok"
+        self._active = None
+        self._started = time.perf_counter()
+        self.total = 0.0
+
+    def count(self, msg):
+        # Element type of a delta message ("plotly_chart", "markdown", "arrow_data_frame", ...)
+        kind = msg.WhichOneof("type")
+        if kind == "delta":
+            kind = msg.delta.WhichOneof("type")     # "add_block" for columns/containers
+            if kind == "new_element":
+                kind = msg.delta.new_element.WhichOneof("type")
+        self.payload[kind] += msg.ByteSize()
+        self.messages += 1
+
+    def finish(self):
+        self.total = time.perf_counter() - self._started
+        self.stages["render"] = max(self.total - sum(v for k, v in self.stages.items() if k != "render"), 0.0)
+
+    def record(self):
+        return {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "session": self.session_id,
+            "page": self.page,
+            "status": self.status,
+            "total_ms": round(self.total * 1000, 2),
+            "stages_ms": {stage: round(self.stages.get(stage, 0.0) * 1000, 2) for stage in STAGES},
+            "payload_bytes": dict(self.payload, total=sum(self.payload.values())),
+            "messages": self.messages,
+        }
+
+
+@contextlib.contextmanager
+def stage(name):
+    """Time a block as `name`; blocks nested in another stage count toward the outer one."""
+    trace = _current.get()
+    if trace is None or trace._active is not None:
+        yield
+        return
+    trace._active = name
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.stages[name] += time.perf_counter() - started
+        trace._active = None
+
+
+def timed(name):
+    """Decorator form of stage()."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextlib.contextmanager
+def page(title):
+    """Trace one page run: stage timings plus the bytes of every message it sends."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    trace = PageTrace(title, getattr(ctx, "session_id", None))
+    token = _current.set(trace)
+
+    # Count outgoing messages while the page runs
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is not None:
+        def counting_enqueue(msg):
+            trace.count(msg)
+            enqueue(msg)
+        ctx._enqueue = counting_enqueue
+
+    try:
+        yield trace
+    except BaseException as exc:      # st.rerun() / st.stop() arrive as exceptions too
+        trace.status = type(exc).__name__
+        raise
+    finally:
+        if enqueue is not None:
+            ctx._enqueue = enqueue
+        _current.reset(token)
+        trace.finish()
+        record = trace.record()
+        if ctx is not None:
+            st.session_state.setdefault("perf_history", deque(maxlen=HISTORY)).append(record)
+        write_trace(record)
+
+
+def write_trace(record, path=None):
+    path = TRACE_PATH if path is None else path
+    if not path:
+        return
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    with _write_lock:
+        try:
+            if os.path.exists(path) and os.path.getsize(path) > TRACE_MAX_BYTES:
+                os.replace(path, path + ".1")
+            with open(path, "a") as f:
+                f.write(line)
+        except OSError:
+            pass    # Tracing must never break the page
+
+
+def sidebar_panel():
+    """Optional sidebar panel with the timings of this session's latest page runs."""
+    if not st.sidebar.toggle("Performance panel", value=False, key="perf_panel"):
+        return
+    history = list(st.session_state.get("perf_history", []))
+    if not history:
+        return
+    last = history[-1]
+    with st.sidebar:
+        st.write(f"**{last['page']}**: {last['total_ms']:,.0f} ms, {last['payload_bytes']['total'] / 1024:,.1f} KB sent")
+        st.dataframe(
+            {"Stage": STAGES, "ms": [last["stages_ms"][s] for s in STAGES]},
+            hide_index=True, use_container_width=True
+        )
+        payload = {k: v for k, v in last["payload_bytes"].items() if k != "total"}
+        st.dataframe(
+            {"Element": list(payload), "KB": [round(v / 1024, 1) for v in payload.values()]},
+            hide_index=True, use_container_width=True
+        )
+        st.caption("Recent runs")
+        st.dataframe(
+            {
+                "Page": [r["page"] for r in reversed(history)],
+                "ms": [r["total_ms"] for r in reversed(history)],
+                "KB": [round(r["payload_bytes"]["total"] / 1024, 1) for r in reversed(history)],
+            },
+            hide_index=True, use_container_width=True
+        )
@@ -4,9 +4,10 @@
 # 추가로 데이터 소스만 하기
 
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 
+import datastore
+
 # 1. 페이지 전체 화면 설정
 st.set_page_config(
     page_title="U.S. Public EV Charging Infrastructure",
@@ -17,24 +18,8 @@ st.set_page_config(
 # 2. 제목
 st.title("U.S. Public EV Charging Infrastructure Over Time")
 
-# 3. CSV 파일 불러오기
-file_path = "U.S. Public Electric Vehicle Charging Infrastructure.csv"
-df = pd.read_csv(file_path)
-df.columns = df.columns.str.strip()
-
-# 4. 숫자형 변환 (콤마 제거 → 숫자로)
-df["EV Charging Ports"] = df["EV Charging Ports"].astype(str).str.replace(",", "")
-df["Station Locations"] = df["Station Locations"].astype(str).str.replace(",", "")
-
-df["EV Charging Ports"] = pd.to_numeric(df["EV Charging Ports"], errors="coerce")
-df["Station Locations"] = pd.to_numeric(df["Station Locations"], errors="coerce")
-df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
-
-# 5. 결측치 제거 및 연도 순 정렬
-df = df.dropna(subset=["Year", "EV Charging Ports", "Station Locations"])
-df = df.sort_values("Year")
-
-df["Year"] = df["Year"].astype(int)
+# 3. 정리된 데이터 불러오기 (databuild.py에서 한 번만 변환, 연도 순 정렬)
+df = datastore.infrastructure()
 
 
 # 6. 연도 슬라이더
@@ -0,0 +1,119 @@
+# Closed-form least squares for the scatter plots
+# Replaces px.scatter(..., trendline="ols"), which imports statsmodels on the request path and
+# refits on every rerun. Slope, intercept, R², residuals and the confidence band come from a few
+# NumPy reductions; fits are cached per dataset (figcache.dataset_hash), and the numbers quoted in
+# the insight text are formatted from the same fit that draws the trend line.
+
+import threading
+from collections import OrderedDict
+from statistics import NormalDist
+
+import numpy as np
+
+import figcache
+from fitsummary import strength  # noqa: F401 (plain-Python helper, used as regression.strength)
+
+CONFIDENCE = 0.95
+BAND_POINTS = 50
+MAX_FITS = 64
+
+
+def ols(x, y):
+    """Slope, intercept and R² of y on x along axis 0 (columns of 2-D inputs are fitted independently)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    dx = x - x.mean(axis=0)
+    dy = y - y.mean(axis=0)
+    sxx = (dx * dx).sum(axis=0)
+    sxy = (dx * dy).sum(axis=0)
+    syy = (dy * dy).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        r2 = sxy * sxy / (sxx * syy)
+    intercept = y.mean(axis=0) - slope * x.mean(axis=0)
+    return slope, intercept, r2
+
+
+def t_quantile(p, df):
+    """Student t quantile (Cornish-Fisher expansion around the normal quantile; fine for df >= 3)."""
+    z = NormalDist().inv_cdf(p)
+    return (z
+            + (z ** 3 + z) / (4 * df)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * df ** 4))
+
+
+class LinearFit:
+    """Ordinary least squares fit of y = slope × x + intercept."""
+
+    def __init__(self, x, y):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        keep = np.isfinite(x) & np.isfinite(y)
+        self.x, self.y = x[keep], y[keep]
+        self.n = len(self.x)
+        self.slope, self.intercept, self.r2 = (float(v) for v in ols(self.x, self.y))
+        self.r = float(np.sign(self.slope) * np.sqrt(self.r2))
+        self.fitted = self.intercept + self.slope * self.x
+        self.residuals = self.y - self.fitted
+
+        # Standard errors (n - 2 degrees of freedom)
+        self.x_mean = self.x.mean()
+        self.sxx = float(((self.x - self.x_mean) ** 2).sum())
+        self.sigma = float(np.sqrt((self.residuals ** 2).sum() / (self.n - 2)))
+        self.slope_se = self.sigma / np.sqrt(self.sxx)
+        self.intercept_se = self.sigma * np.sqrt(1 / self.n + self.x_mean ** 2 / self.sxx)
+
+    def predict(self, x):
+        return self.intercept + self.slope * np.asarray(x, dtype=np.float64)
+
+    def band(self, x, confidence=CONFIDENCE):
+        """(lower, upper) confidence band of the mean response at x."""
+        x = np.asarray(x, dtype=np.float64)
+        half = t_quantile(0.5 + confidence / 2, self.n - 2) * self.sigma * np.sqrt(1 / self.n + (x - self.x_mean) ** 2 / self.sxx)
+        return self.predict(x) - half, self.predict(x) + half
+
+    def equation(self, y_label, x_label, digits=6):
+        """'y = slope × x ± intercept' with the statsmodels-style significant digits."""
+        sign = "−" if self.intercept < 0 else "+"
+        return f"{y_label} = {self.slope:,.{digits}g} × {x_label} {sign} {abs(self.intercept):,.{digits}g}"
+
+
+_fits = OrderedDict()
+_lock = threading.Lock()
+
+
+def fit_columns(df, x, y):
+    """Cached LinearFit of column y on column x (refitted only when those columns change)."""
+    key = (figcache.dataset_hash(df[[x, y]]), x, y)
+    with _lock:
+        if key in _fits:
+            _fits.move_to_end(key)
+            return _fits[key]
+    fit = LinearFit(df[x].to_numpy(dtype=np.float64), df[y].to_numpy(dtype=np.float64))
+    with _lock:
+        _fits[key] = fit
+        while len(_fits) > MAX_FITS:
+            _fits.popitem(last=False)
+    return fit
+
+
+def trend_traces(fit, color="#4C72B0", confidence=CONFIDENCE, name="OLS trend"):
+    """Plotly traces of the fitted line and its confidence band."""
+    import plotly.graph_objects as go
+
+    grid = np.linspace(fit.x.min(), fit.x.max(), BAND_POINTS)
+    lower, upper = fit.band(grid, confidence)
+    return [
+        go.Scatter(
+            x=np.concatenate([grid, grid[::-1]]), y=np.concatenate([upper, lower[::-1]]),
+            fill="toself", fillcolor="rgba(76, 114, 176, 0.15)", line=dict(width=0),
+            hoverinfo="skip", showlegend=False, name=f"{confidence:.0%} confidence band",
+        ),
+        go.Scatter(
+            x=grid[[0, -1]], y=fit.predict(grid[[0, -1]]), mode="lines",
+            line=dict(color=color, width=2), showlegend=False, name=name,
+            hovertemplate=f"{name}<br>slope {fit.slope:,.4g}, intercept {fit.intercept:,.4g}<br>R² = {fit.r2:.4f}<extra></extra>",
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Station record schema
+# STATION_SCHEMA is the stored layout of the station files (the partition files written by
+# ingest.py; the original parquet file has the same columns plus State and two empty export
+# columns). compact_table() casts an Arrow table of station rows to the smaller in-memory layout
+# the dashboard keeps loaded, before the conversion to pandas:
+#   Latitude, Longitude                    float32 (about 1 m at U.S. longitudes; the spatial
+#                                          indexes and marker payloads cast back to float64)
+#   ID                                     int32
+#   Fuel Type Code, City, State, Country   dictionary → pandas categorical
+#   Date Last Confirmed                    timestamp (unparseable dates become NaT)
+#   other strings                          Arrow strings
+# Export junk columns ("Unnamed: 11", ...) are dropped. validate() checks coordinate ranges and
+# duplicate IDs with whole-array operations.
+
+import warnings
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Columns stored in the partition files (State is the partition key; junk export columns are dropped)
+STATION_SCHEMA = pa.schema([
+    ("Fuel Type Code", pa.string()),
+    ("Latitude", pa.float64()),
+    ("Longitude", pa.float64()),
+    ("Station Name", pa.string()),
+    ("Street Address", pa.string()),
+    ("City", pa.string()),
+    ("ZIP", pa.string()),
+    ("Date Last Confirmed", pa.string()),
+    ("ID", pa.int64()),
+    ("Country", pa.string()),
+])
+
+# In-memory types
+STATION_CATEGORIES = ["Fuel Type Code", "City", "State", "Country"]
+FLOAT32_COLUMNS = ["Latitude", "Longitude"]
+INT32_COLUMNS = ["ID"]
+DATE_COLUMNS = {"Date Last Confirmed": "%Y-%m-%d"}
+JUNK_PREFIX = "Unnamed:"
+
+
+def is_junk(name, column):
+    """Spreadsheet index/empty columns of the AFDC export."""
+    return name.startswith(JUNK_PREFIX) or (name not in STATION_SCHEMA.names and name != "State"
+                                            and len(column) > 0 and column.null_count == len(column))
+
+
+def compact_column(name, column):
+    """One Arrow column cast to its in-memory type (unchanged when it has none)."""
+    if name in FLOAT32_COLUMNS and pa.types.is_floating(column.type):
+        return pc.cast(column, pa.float32())
+    if name in INT32_COLUMNS and pa.types.is_integer(column.type):
+        try:
+            return pc.cast(column, pa.int32())     # Raises instead of wrapping when an ID does not fit
+        except pa.ArrowInvalid:
+            return column
+    if name in STATION_CATEGORIES and not pa.types.is_dictionary(column.type):
+        return column.dictionary_encode()
+    if name in DATE_COLUMNS and pa.types.is_string(column.type):
+        return pc.strptime(column, format=DATE_COLUMNS[name], unit="s", error_is_null=True)
+    return column
+
+
+def compact_table(table):
+    """Station table in the in-memory layout, without junk columns."""
+    names = [name for name, column in zip(table.column_names, table.columns) if not is_junk(name, column)]
+    return pa.table([compact_column(name, table[name]) for name in names], names=names)
+
+
+def validate(df):
+    """Number of rows failing each check (all zero for clean data)."""
+    problems = {}
+    if "Latitude" in df and "Longitude" in df:
+        lat = df["Latitude"].to_numpy(dtype=np.float64, na_value=np.nan)
+        lon = df["Longitude"].to_numpy(dtype=np.float64, na_value=np.nan)
+        # NaN fails both comparisons; (0, 0) is a missing location exported as zeros
+        valid = (np.abs(lat) <= 90) & (np.abs(lon) <= 180) & ~((lat == 0) & (lon == 0))
+        problems["bad_coordinates"] = int(len(df) - np.count_nonzero(valid))
+    if "ID" in df:
+        missing = df["ID"].isna().to_numpy()
+        ids = np.sort(df["ID"].to_numpy()[~missing].astype(np.int64))
+        problems["missing_ids"] = int(np.count_nonzero(missing))
+        problems["duplicate_ids"] = int(np.count_nonzero(ids[1:] == ids[:-1]))
+    return problems
+
+
+def check(df, source="station data"):
+    """Warn about the failed checks of validate(); returns df for chaining."""
+    problems = {name: count for name, count in validate(df).items() if count}
+    if problems:
+        details = ", ".join(f"{count:,} {name.replace('_', ' ')}" for name, count in problems.items())
+        warnings.warn(f"{source}: {details}", stacklevel=2)
+    return df
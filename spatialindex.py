@@ -0,0 +1,109 @@
+# Spatial index over station coordinates for nearest-station and radius queries
+# Stations are bucketed into a regular lat/lon grid and sorted by cell key once; a query only
+# looks at the cells that can contain a match (np.searchsorted per grid row) and computes the
+# exact haversine distance for those candidates.
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+CELL_DEG = 0.25         # Grid cell size in degrees (~28 km north-south)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km (broadcasts over NumPy arrays)."""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class StationIndex:
+    """Grid-bucket index answering radius and k-nearest queries in km.
+
+    Longitudes are not wrapped across the antimeridian (all U.S. stations lie east of it).
+    """
+
+    def __init__(self, lat, lon, cell_deg=CELL_DEG):
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        valid = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+
+        self.cell_deg = cell_deg
+        self.n_cols = int(np.ceil(360 / cell_deg)) + 1
+        self.n_rows = int(np.ceil(180 / cell_deg)) + 1
+
+        keys = self._keys(lat[valid], lon[valid])
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.ids = valid[order]                 # Row position in the source frame
+        self.lat = lat[self.ids]
+        self.lon = lon[self.ids]
+
+    def _rows(self, lat):
+        return np.clip(((np.asarray(lat) + 90) // self.cell_deg).astype(np.int64), 0, self.n_rows - 1)
+
+    def _cols(self, lon):
+        return np.clip(((np.asarray(lon) + 180) // self.cell_deg).astype(np.int64), 0, self.n_cols - 1)
+
+    def _keys(self, lat, lon):
+        return self._rows(lat) * self.n_cols + self._cols(lon)
+
+    def _candidates(self, lat, lon, radius_km):
+        # Grid rows/columns covering the bounding box of the search circle
+        dlat = np.degrees(radius_km / EARTH_RADIUS_KM)
+        max_lat = min(abs(lat) + dlat, 90.0)
+        dlon = 180.0 if max_lat >= 89.9 else dlat / np.cos(np.radians(max_lat))
+
+        rows = np.arange(self._rows(lat - dlat), self._rows(lat + dlat) + 1)
+        lo = rows * self.n_cols + self._cols(lon - dlon)
+        hi = rows * self.n_cols + self._cols(lon + dlon)
+        starts = np.searchsorted(self.keys, lo, side="left")
+        ends = np.searchsorted(self.keys, hi, side="right")
+
+        lengths = ends - starts
+        if lengths.sum() == 0:
+            return np.empty(0, dtype=np.int64)
+        # Concatenate the [start, end) ranges without a Python loop
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return offsets + np.arange(lengths.sum())
+
+    def query_radius(self, lat, lon, radius_km, sort=True):
+        """Stations within `radius_km` of one point → (row ids, distances in km)."""
+        positions = self._candidates(lat, lon, radius_km)
+        dist = haversine_km(lat, lon, self.lat[positions], self.lon[positions])
+        inside = dist <= radius_km
+        positions, dist = positions[inside], dist[inside]
+        if sort:
+            order = np.argsort(dist, kind="stable")
+            positions, dist = positions[order], dist[order]
+        return self.ids[positions], dist
+
+    def query_knn(self, lat, lon, k=5, start_km=10.0):
+        """The `k` nearest stations to one point → (row ids, distances in km)."""
+        k = min(k, len(self.ids))
+        radius = start_km
+        while True:
+            ids, dist = self.query_radius(lat, lon, radius)
+            if len(ids) >= k or radius > np.pi * EARTH_RADIUS_KM:
+                return ids[:k], dist[:k]
+            radius *= 2
+
+    def query_radius_batch(self, lats, lons, radius_km):
+        """Radius query for many points → list of (row ids, distances)."""
+        return [self.query_radius(lat, lon, radius_km) for lat, lon in zip(np.ravel(lats), np.ravel(lons))]
+
+    def query_knn_batch(self, lats, lons, k=5):
+        """kNN for many points → (ids, distances) arrays of shape (n_points, k)."""
+        lats, lons = np.ravel(lats), np.ravel(lons)
+        k = min(k, len(self.ids))
+        ids = np.empty((len(lats), k), dtype=np.int64)
+        dist = np.empty((len(lats), k), dtype=np.float64)
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            ids[i], dist[i] = self.query_knn(lat, lon, k)
+        return ids, dist
+
+    def count_within(self, lats, lons, radius_km):
+        """Number of stations within `radius_km` of each point."""
+        return np.array([len(self.query_radius(lat, lon, radius_km, sort=False)[0]) for lat, lon in zip(np.ravel(lats), np.ravel(lons))])
+
+    def __len__(self):
+        return len(self.ids)
@@ -0,0 +1,150 @@
+# Per-state fact table for the "EV Statistics" pages
+# python statefacts.py
+#
+# Computes the station counts, registrations, population, EV density and the derived
+# per-10k / log columns once from the source files and stores them as a small parquet file,
+# with the regression statistics of the Conclusion page beside it (fitsummary.py).
+# The dashboard only reads this table (see datastore.state_facts()).
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import databuild
+import datastore
+import fitsummary
+import geocode
+import geometry
+import paths
+import states
+import timeseries
+
+FACTS_PATH = paths.FACTS_PATH
+FACTS_VERSION = 4       # Bump when the columns or their derivation change
+
+
+def source_paths():
+    return [datastore.station_version_path(), datastore.REGISTRATION_PATH, datastore.DENSITY_PATH, geometry.GEOJSON_PATH]
+
+
+def source_fingerprint(paths=None):
+    """SHA-1 of the source files, stored with the table to detect stale builds."""
+    digest = hashlib.sha1()
+    for path in paths or source_paths():
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def build_state_facts(df_stations, df_ev, df_density):
+    """Join the three sources into one row per state.
+
+    Every source is reduced to an array indexed by state key (states.py), so the joins are
+    plain array alignment; a state is kept when all three sources have it.
+    """
+    # Number of EV charging stations by state
+    station_counts = states.counts(states.keys(df_stations["State"]))
+
+    # EV registrations and population (US total and regional rows get no key)
+    ev_keys = states.keys(df_ev["State"])
+    population = states.dense(ev_keys, df_ev["2023"].to_numpy(dtype=np.float64))
+    registrations = states.dense(ev_keys, df_ev["EV registration by state"].to_numpy(dtype=np.float64))
+
+    # Latest year of EV density (one column of the state × year matrix)
+    matrix = timeseries.StateYearMatrix.from_frame(df_density)
+    density = states.dense(matrix.keys, matrix.year(matrix.latest_year))
+
+    keys = np.flatnonzero(states.is_state(np.arange(states.COUNT))
+                          & (station_counts > 0) & np.isfinite(population) & np.isfinite(registrations) & np.isfinite(density))
+    df_facts = pd.DataFrame({
+        "state_key": keys.astype(states.KEY_DTYPE),
+        "State": states.codes(keys),
+        "Charging_Stations": station_counts[keys].astype("int64"),
+        "State_Full": states.names(keys),
+        "Population": population[keys],
+        "EV_Registrations": registrations[keys].astype("int64"),
+        "ev_per_10000": density[keys],
+    })
+
+    df_facts = add_density_columns(df_facts)
+    return df_facts.sort_values("State").reset_index(drop=True)
+
+
+def add_density_columns(df_facts):
+    """Charging station density per 10K people and log transformations."""
+    df_facts["Charging Stations per 10k"] = df_facts["Charging_Stations"] / (df_facts["Population"] / 10000)
+    df_facts["Charging Stations per 10k (log)"] = np.log1p(df_facts["Charging Stations per 10k"])
+    df_facts["EV Adoptions (log)"] = np.log1p(df_facts["EV_Registrations"])
+    df_facts["EV per 10000 (log)"] = np.log1p(df_facts["ev_per_10000"])
+    return df_facts
+
+
+def write_state_facts(df_facts, fingerprint, path=FACTS_PATH):
+    table = pa.Table.from_pandas(df_facts, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"facts_version"] = str(FACTS_VERSION).encode()
+    metadata[b"sources"] = json.dumps({"paths": source_paths(), "sha1": fingerprint}).encode()
+    # Written aside and renamed so other processes never read a half-written fact table
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+    os.replace(tmp_path, path)
+    fitsummary.write(fitsummary.compute(df_facts), path)
+
+
+def read_state_facts(path=FACTS_PATH):
+    """Return (facts, metadata dict) for a built table."""
+    table = pq.read_table(path)
+    metadata = table.schema.metadata or {}
+    info = {
+        "facts_version": int(metadata.get(b"facts_version", b"0")),
+        "sources": json.loads(metadata.get(b"sources", b"{}")),
+    }
+    return table.to_pandas(), info
+
+
+def is_current(info):
+    return info["facts_version"] == FACTS_VERSION and info["sources"].get("sha1") == source_fingerprint()
+
+
+def build(path=FACTS_PATH):
+    # Station states from the coordinates (geocode.py), so no station is lost to a missing or wrong State value
+    df_stations = datastore.read_stations(["ID", "Latitude", "Longitude", "State"])
+    df_stations = df_stations.assign(State=geocode.assign_states(df_stations))
+    df_ev = databuild.read_table("registrations").to_pandas()
+    df_density = databuild.read_table("ev_density").to_pandas()
+    df_facts = build_state_facts(df_stations, df_ev, df_density)
+    write_state_facts(df_facts, source_fingerprint(), path)
+    return df_facts
+
+
+def update_station_counts(counts, previous_sha1, path=FACTS_PATH):
+    """Set the station counts of some states after an incremental ingest (ingest.py).
+
+    `counts` maps state code → stations now in the dataset and `previous_sha1` is the source
+    fingerprint from before the ingest. Only those rows change; when the table was not current
+    before the ingest, or a state is new to it, the whole table is rebuilt instead.
+    """
+    try:
+        df_facts, info = read_state_facts(path)
+    except FileNotFoundError:
+        return build(path)
+    known = set(df_facts["State"])
+    new_states = {state for state in counts if state not in known and states.is_state(states.key_of(state))}
+    if info["facts_version"] != FACTS_VERSION or info["sources"].get("sha1") != previous_sha1 or new_states:
+        return build(path)
+
+    rows = df_facts["State"].isin(list(counts))
+    df_facts.loc[rows, "Charging_Stations"] = df_facts.loc[rows, "State"].map(counts).astype("int64")
+    df_facts = add_density_columns(df_facts)
+    write_state_facts(df_facts, source_fingerprint(), path)
+    return df_facts
+
+
+if __name__ == "__main__":
+    df_facts = build()
+    print(f"Wrote {FACTS_PATH}: {len(df_facts)} states, version {FACTS_VERSION}")
@@ -0,0 +1,84 @@
+# U.S. state reference table
+# One canonical list of the states, DC and the territories. Each gets a small integer key (its
+# position in STATES, starting at 1; 0 = unknown), and the datasets carry that key so joins are
+# integer index alignment instead of string-keyed merges. Lookups from names or 2-letter codes
+# normalize only the distinct labels of a column (not every row) and accept either form.
+
+import numpy as np
+import pandas as pd
+
+UNKNOWN = 0
+
+# (code, name); the order defines the keys, so only append
+STATES = (
+    ("AL", "Alabama"), ("AK", "Alaska"), ("AZ", "Arizona"), ("AR", "Arkansas"), ("CA", "California"),
+    ("CO", "Colorado"), ("CT", "Connecticut"), ("DE", "Delaware"), ("DC", "District of Columbia"), ("FL", "Florida"),
+    ("GA", "Georgia"), ("HI", "Hawaii"), ("ID", "Idaho"), ("IL", "Illinois"), ("IN", "Indiana"),
+    ("IA", "Iowa"), ("KS", "Kansas"), ("KY", "Kentucky"), ("LA", "Louisiana"), ("ME", "Maine"),
+    ("MD", "Maryland"), ("MA", "Massachusetts"), ("MI", "Michigan"), ("MN", "Minnesota"), ("MS", "Mississippi"),
+    ("MO", "Missouri"), ("MT", "Montana"), ("NE", "Nebraska"), ("NV", "Nevada"), ("NH", "New Hampshire"),
+    ("NJ", "New Jersey"), ("NM", "New Mexico"), ("NY", "New York"), ("NC", "North Carolina"), ("ND", "North Dakota"),
+    ("OH", "Ohio"), ("OK", "Oklahoma"), ("OR", "Oregon"), ("PA", "Pennsylvania"), ("RI", "Rhode Island"),
+    ("SC", "South Carolina"), ("SD", "South Dakota"), ("TN", "Tennessee"), ("TX", "Texas"), ("UT", "Utah"),
+    ("VT", "Vermont"), ("VA", "Virginia"), ("WA", "Washington"), ("WV", "West Virginia"), ("WI", "Wisconsin"),
+    ("WY", "Wyoming"),
+    # Territories
+    ("PR", "Puerto Rico"), ("VI", "U.S. Virgin Islands"), ("GU", "Guam"), ("AS", "American Samoa"),
+    ("MP", "Northern Mariana Islands"),
+)
+TERRITORIES = {"PR", "VI", "GU", "AS", "MP"}
+
+KEY_DTYPE = np.int8
+COUNT = len(STATES) + 1             # Size of an array indexed by key (slot 0 = unknown)
+
+# Indexed by key
+CODES = np.array([None] + [code for code, _ in STATES], dtype=object)
+NAMES = np.array([None] + [name for _, name in STATES], dtype=object)
+
+STATE_CODES = {name: code for code, name in STATES}     # Name → code
+_LABEL_KEYS = {}
+for _key, (_code, _name) in enumerate(STATES, start=1):
+    _LABEL_KEYS[_code] = _key
+    _LABEL_KEYS[_name.upper()] = _key
+
+
+def key_of(label):
+    """Key of a single name or code (UNKNOWN if not a state)."""
+    return _LABEL_KEYS.get(str(label).strip().upper(), UNKNOWN) if isinstance(label, str) else UNKNOWN
+
+
+def keys(values):
+    """Key array for a column of names and/or codes (case and surrounding whitespace ignored)."""
+    codes, labels = pd.factorize(pd.Series(values, copy=False), use_na_sentinel=True)
+    lookup = np.array([key_of(label) for label in labels] + [UNKNOWN], dtype=KEY_DTYPE)
+    return lookup[codes]        # The NA sentinel -1 picks the trailing UNKNOWN
+
+
+def codes(keys_):
+    """2-letter codes of a key array (None for UNKNOWN)."""
+    return CODES[np.asarray(keys_)]
+
+
+def names(keys_):
+    """Full names of a key array (None for UNKNOWN)."""
+    return NAMES[np.asarray(keys_)]
+
+
+def is_state(keys_, territories=False):
+    """True for the 50 states and DC (and the territories when `territories`)."""
+    keys_ = np.asarray(keys_)
+    last = len(STATES) if territories else len(STATES) - len(TERRITORIES)
+    return (keys_ > UNKNOWN) & (keys_ <= last)
+
+
+def dense(keys_, values, fill=np.nan):
+    """Array of length COUNT with values[i] at position keys_[i] (later duplicates win)."""
+    values = np.asarray(values)
+    out = np.full(COUNT, fill, dtype=np.result_type(values.dtype, np.asarray(fill).dtype))
+    out[np.asarray(keys_)] = values
+    return out
+
+
+def counts(keys_):
+    """Number of rows per key (array of length COUNT)."""
+    return np.bincount(np.asarray(keys_, dtype=np.intp), minlength=COUNT)
@@ -0,0 +1,95 @@
+# Synthetic station files for scale testing
+# python synthetic.py --scale 10 [--out synthetic/EV_Station_Location_x10.parquet] [--chunk-rows 250000] [--seed 0]
+#
+# Every synthetic row copies a randomly drawn real station, so states, cities, ZIPs, fuel types and
+# confirmation dates follow the distributions of EV_Station_Location.parquet. Its coordinates are
+# jittered by a few km and it gets a new unique ID. Rows are generated and written one chunk (row
+# group) at a time, so memory stays bounded by the source file plus one chunk at any scale.
+#
+# Point the dashboard or the benchmark at the result with
+#   EV_STATION_PATH=synthetic/EV_Station_Location_x10.parquet streamlit run final.py
+#   python benchmark.py --stations synthetic/EV_Station_Location_x10.parquet
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import datastore
+
+SYNTHETIC_DIR = "synthetic"
+CHUNK_ROWS = 250_000
+JITTER_KM = 3.0
+KM_PER_DEGREE = 111.32
+
+
+def default_path(scale):
+    return os.path.join(SYNTHETIC_DIR, f"EV_Station_Location_x{scale:g}.parquet")
+
+
+def synthetic_chunks(source, rows, chunk_rows=CHUNK_ROWS, seed=0, jitter_km=JITTER_KM):
+    """Yield Arrow tables of at most `chunk_rows` synthetic stations with the source schema."""
+    rng = np.random.default_rng(seed)
+    lat_source = source["Latitude"].to_numpy(zero_copy_only=False)
+    lon_source = source["Longitude"].to_numpy(zero_copy_only=False)
+    next_id = pc.max(source["ID"]).as_py() + 1
+    names = source.schema.names
+
+    for start in range(0, rows, chunk_rows):
+        n = min(chunk_rows, rows - start)
+        picks = rng.integers(0, len(source), n)
+        chunk = source.take(pa.array(picks))
+
+        # Jitter around the copied station (missing coordinates stay missing)
+        lat = lat_source[picks]
+        lon = lon_source[picks]
+        km_per_lon_degree = KM_PER_DEGREE * np.maximum(np.cos(np.radians(np.nan_to_num(lat))), 0.01)
+        lat = np.clip(lat + rng.normal(0, jitter_km / KM_PER_DEGREE, n), -90, 90)
+        lon = np.clip(lon + rng.normal(0, 1, n) * jitter_km / km_per_lon_degree, -180, 180)
+
+        chunk = chunk.set_column(names.index("Latitude"), "Latitude", pa.array(lat, pa.float64()))
+        chunk = chunk.set_column(names.index("Longitude"), "Longitude", pa.array(lon, pa.float64()))
+        chunk = chunk.set_column(names.index("ID"), "ID", pa.array(np.arange(next_id + start, next_id + start + n), pa.int64()))
+        yield chunk
+
+
+def generate(out_path, rows=None, scale=1.0, chunk_rows=CHUNK_ROWS, seed=0, jitter_km=JITTER_KM, source_path=None):
+    """Write a synthetic station parquet file; returns the number of rows written."""
+    source_path = source_path or datastore.STATION_PATH
+    source = pq.read_table(source_path)
+    rows = int(rows if rows is not None else round(len(source) * scale))
+
+    # Same columns and types as the source, without its pandas index metadata
+    schema = source.schema.remove_metadata().with_metadata({
+        b"synthetic": json.dumps({"source": source_path, "rows": rows, "seed": seed, "jitter_km": jitter_km}).encode()
+    })
+    source = source.replace_schema_metadata(None)
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with pq.ParquetWriter(out_path, schema) as writer:
+        for chunk in synthetic_chunks(source, rows, chunk_rows, seed, jitter_km):
+            writer.write_table(chunk.replace_schema_metadata(schema.metadata), row_group_size=chunk_rows)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic EV station parquet file.")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--scale", type=float, default=1.0, help="Multiple of the real station count")
+    size.add_argument("--rows", type=int, help="Exact number of rows")
+    parser.add_argument("--out", help="Output path (default: synthetic/EV_Station_Location_x<scale>.parquet)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Rows per chunk / row group")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jitter-km", type=float, default=JITTER_KM)
+    args = parser.parse_args()
+
+    out = args.out or (default_path(args.scale) if args.rows is None else os.path.join(SYNTHETIC_DIR, f"EV_Station_Location_{args.rows}.parquet"))
+    started = time.perf_counter()
+    rows = generate(out, args.rows, args.scale, args.chunk_rows, args.seed, args.jitter_km)
+    print(f"Wrote {rows:,} stations to {out} ({os.path.getsize(out) / 2 ** 20:,.1f} MB) in {time.perf_counter() - started:.1f}s")
+    print(f"Use it with: EV_STATION_PATH={out} streamlit run final.py")
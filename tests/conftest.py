@@ -0,0 +1,72 @@
+# Test setup: the data paths are read from the environment when datastore.py is imported, so
+# point every derived file (station dataset, fact table, geocoding cache, Arrow files) at a
+# temporary directory before any module of the app is imported.
+
+import os
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DERIVED_DIR = tempfile.mkdtemp(prefix="ev_infra_tests_")
+
+os.environ["EV_DERIVED_DIR"] = DERIVED_DIR
+os.environ["EV_STATION_DATASET"] = os.path.join(DERIVED_DIR, "stations")
+os.environ["EV_STATION_PATH"] = os.path.join(ROOT, "EV_Station_Location.parquet")
+os.environ["EV_REGISTRATION_PATH"] = os.path.join(ROOT, "Population Estimate & EV Count.csv")
+os.environ["EV_DENSITY_PATH"] = os.path.join(ROOT, "ev_per_10000.csv")
+os.environ["EV_INFRASTRUCTURE_PATH"] = os.path.join(ROOT, "U.S. Public Electric Vehicle Charging Infrastructure.csv")
+os.environ["EV_PERF_TRACE"] = ""
+sys.path.insert(0, ROOT)
+
+# Stations in a few states (name, city, state, latitude, longitude)
+PLACES = {
+    "dc": ("Union Station", "Washington", "DC", 38.8973, -77.0063),
+    "annapolis": ("Annapolis Garage", "Annapolis", "MD", 38.9784, -76.4922),
+    "baltimore": ("Inner Harbor", "Baltimore", "MD", 39.2858, -76.6131),
+    "richmond": ("Capitol Square", "Richmond", "VA", 37.5385, -77.4343),
+    "los_angeles": ("Grand Park", "Los Angeles", "CA", 34.0551, -118.2470),
+    "austin": ("Congress Ave", "Austin", "TX", 30.2747, -97.7404),
+}
+
+
+def station_rows(*stations):
+    """AFDC-style export rows; each station is (place, ID or None[, name])."""
+    rows = []
+    for station in stations:
+        place, station_id = station[0], station[1]
+        name, city, state, lat, lon = PLACES[place]
+        rows.append({
+            "Fuel Type Code": "ELEC", "Latitude": lat, "Longitude": lon,
+            "Station Name": station[2] if len(station) > 2 else name, "Street Address": "1 Main St",
+            "City": city, "State": state, "ZIP": "00000", "Date Last Confirmed": "2024-01-02",
+            "ID": "" if station_id is None else str(station_id), "Country": "US",
+        })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def write_export(tmp_path):
+    """Write export rows to a CSV file and return its path."""
+    counter = iter(range(1000))
+
+    def write(*stations):
+        path = str(tmp_path / f"export-{next(counter)}.csv")
+        station_rows(*stations).to_csv(path, index=False)
+        return path
+    return write
+
+
+@pytest.fixture
+def app_dataset():
+    """The dataset the app reads (datastore.STATION_DATASET), emptied for the test."""
+    import streamlit as st
+
+    shutil.rmtree(DERIVED_DIR)
+    os.makedirs(DERIVED_DIR)
+    st.cache_resource.clear()
+    yield os.environ["EV_STATION_DATASET"]
+    st.cache_resource.clear()
@@ -0,0 +1,12 @@
+import os
+
+import datastore
+
+
+def test_filtered_read_drops_unused_categories():
+    df = datastore.read_stations(["City", "State"], states=["DC"], path=os.environ["EV_STATION_PATH"], compact=True)
+
+    counts = df["City"].value_counts()
+    assert len(df) > 0
+    assert (counts > 0).all()
+    assert list(df["State"].cat.categories) == ["DC"]
@@ -0,0 +1,21 @@
+import pandas as pd
+import plotly.graph_objects as go
+
+import figcache
+
+
+def test_same_name_from_different_builders_is_not_shared():
+    df = pd.DataFrame({"State": ["CA", "TX"], "value": [1.0, 2.0]})
+
+    def build_density():
+        return go.Figure(layout={"title": {"text": "density"}})
+
+    def build_registrations():
+        return go.Figure(layout={"title": {"text": "registrations"}})
+
+    first = figcache.cached_figure("top10", df, "value", "Blues", (None, 400), build_density)
+    second = figcache.cached_figure("top10", df, "value", "Blues", (None, 400), build_registrations)
+    again = figcache.cached_figure("top10", df, "value", "Blues", (None, 400), build_density)
+
+    assert first.layout.title.text == again.layout.title.text == "density"
+    assert second.layout.title.text == "registrations"
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import fitsummary
+import regression
+import statefacts
+from conftest import ROOT
+
+
+def test_summary_is_written_with_the_fact_table(app_dataset, tmp_path):
+    path = str(tmp_path / "state_facts.parquet")
+    df_facts = statefacts.build(path)
+
+    summary = fitsummary.read(path)
+    fit = regression.fit_columns(df_facts.dropna(subset=["Charging Stations per 10k", "ev_per_10000"]),
+                                 *fitsummary.FITS["population"])
+    assert summary["population"]["r2"] == pytest.approx(fit.r2)
+    assert summary["population"]["slope"] == pytest.approx(fit.slope)
+    assert set(summary) == set(fitsummary.FITS)
+
+
+def test_conclusion_page_imports_no_data_or_plotly_modules():
+    code = ("import sys, streamlit; loaded = set(sys.modules); import views.conclusion; "
+            "print(' '.join(sorted(set(sys.modules) - loaded)))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=dict(os.environ), capture_output=True, text=True, check=True)
+    imported = result.stdout.split()
+    heavy = ("numpy", "pandas", "pyarrow", "plotly", "datastore", "regression", "figcache")
+    assert [name for name in imported if name.split(".")[0] in heavy] == []
@@ -0,0 +1,24 @@
+import geocode
+
+
+def test_recorded_state_is_corrected_across_water():
+    # Jersey City recorded as NY: inside the NJ outline and farther from NY's across the Hudson
+    states, source = geocode.resolve_states([40.7178], [-74.0431], ["NY"])
+    assert (states[0], source[0]) == ("NJ", "polygon")
+
+
+def test_recorded_state_is_kept_inside_and_near_its_outline():
+    # Washington DC, Vancouver WA (falls just inside the coarse OR outline), Honolulu (off the
+    # coarse HI coastline) and Silver Spring MD
+    lat = [38.8973, 45.6300, 21.3000, 38.9950]
+    lon = [-77.0063, -122.6700, -157.8500, -77.0260]
+    states, source = geocode.resolve_states(lat, lon, ["DC", "WA", "HI", "MD"])
+    assert states.tolist() == ["DC", "WA", "HI", "MD"]
+    assert set(source) == {"recorded"}
+
+
+def test_wrong_recorded_state_far_away_is_replaced():
+    # Los Angeles recorded as LA (Louisiana); an offshore point recorded as OR goes to the nearest state
+    states, source = geocode.resolve_states([34.0551, 21.2500], [-118.2470, -157.9500], ["LA", "OR"])
+    assert states.tolist() == ["CA", "HI"]
+    assert source.tolist() == ["polygon", "nearest"]
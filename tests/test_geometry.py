@@ -0,0 +1,11 @@
+import geocode
+import geometry
+
+
+def test_district_of_columbia_is_in_the_shared_geometry():
+    for level in geometry.TOLERANCES:
+        assert "DC" in {feature["id"] for feature in geometry.state_geojson(level)["features"]}
+
+    # Union Station (DC), Silver Spring (MD) and Arlington (VA) around the DC borders
+    codes = geocode.locate_states([38.8973, 38.9950, 38.8800], [-77.0063, -77.0260, -77.1000])
+    assert codes.tolist() == ["DC", "MD", "VA"]
@@ -0,0 +1,132 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import datastore
+import ingest
+import partitions
+import statefacts
+from spatialindex import StationIndex
+
+
+def read_dataset(dataset):
+    df = datastore.read_stations(path=dataset)
+    return df.assign(State=df["State"].astype(str)).sort_values("ID").reset_index(drop=True)
+
+
+def partition_ids(dataset):
+    return {state: sorted(pd.concat([pd.read_parquet(path, columns=["ID"]) for path in paths])["ID"])
+            for state, paths in partitions.partition_files(dataset, partitions.partition_states(dataset)).items() if paths}
+
+
+def test_dedupe_by_id_keeps_last_row(tmp_path, write_export):
+    dataset = str(tmp_path / "stations")
+    record = ingest.ingest([write_export(("dc", 101, "First"), ("annapolis", 102), ("dc", 101, "Second"))], dataset, update_facts=False)
+
+    df = read_dataset(dataset)
+    assert record["stations"] == 2
+    assert df["ID"].tolist() == [101, 102]
+    assert df.loc[df["ID"] == 101, "Station Name"].item() == "Second"
+
+
+def test_dedupe_by_coordinates_for_rows_without_id(tmp_path, write_export):
+    dataset = str(tmp_path / "stations")
+    ingest.ingest([write_export(("dc", None), ("dc", None), ("austin", None))], dataset, update_facts=False)
+    first = read_dataset(dataset)
+    assert len(first) == 2
+
+    # The same locations in a later export match the stored stations instead of adding new ones
+    record = ingest.ingest([write_export(("austin", None), ("dc", None, "Renamed"))], dataset, update_facts=False)
+    df = read_dataset(dataset)
+    assert (record["added"], record["updated"], record["unchanged"]) == (0, 1, 1)
+    assert sorted(df["ID"]) == sorted(first["ID"])
+    assert "Renamed" in df["Station Name"].tolist()
+
+
+def test_stations_without_id_do_not_take_afdc_ids(tmp_path, write_export):
+    dataset = str(tmp_path / "stations")
+    ingest.ingest([write_export(("dc", 500), ("austin", None))], dataset, update_facts=False)
+    synthetic_id = read_dataset(dataset).loc[lambda df: df["State"] == "TX", "ID"].item()
+    assert synthetic_id < 0
+
+    # The next AFDC ID is a new station, not an update of the ID-less one
+    ingest.ingest([write_export(("richmond", 501))], dataset, update_facts=False)
+    df = read_dataset(dataset)
+    assert len(df) == 3
+    assert df.set_index("ID").loc[synthetic_id, "State"] == "TX"
+    assert df.set_index("ID").loc[501, "State"] == "VA"
+
+
+def test_update_in_place(tmp_path, write_export):
+    dataset = str(tmp_path / "stations")
+    ingest.ingest([write_export(("dc", 1), ("annapolis", 2))], dataset, update_facts=False)
+    record = ingest.ingest([write_export(("dc", 1, "New Name"), ("annapolis", 2))], dataset, update_facts=False)
+
+    df = read_dataset(dataset)
+    assert (record["added"], record["updated"], record["unchanged"]) == (0, 1, 1)
+    assert len(df) == 2
+    assert df.set_index("ID").loc[1, "Station Name"] == "New Name"
+    assert partition_ids(dataset) == {"DC": [1], "MD": [2]}
+
+
+def test_moved_station_changes_partition(tmp_path, write_export):
+    dataset = str(tmp_path / "stations")
+    ingest.ingest([write_export(("annapolis", 7), ("baltimore", 8))], dataset, update_facts=False)
+    record = ingest.ingest([write_export(("richmond", 7), ("baltimore", 8))], dataset, update_facts=False)
+
+    assert record["states"] == ["MD", "VA"]
+    assert partition_ids(dataset) == {"MD": [8], "VA": [7]}
+    keys = ingest.read_keys(dataset).set_index("ID")
+    assert keys.loc[7, "State"] == "VA"
+
+
+def test_reingesting_the_same_export_is_a_no_op(tmp_path, write_export):
+    dataset = str(tmp_path / "stations")
+    export = write_export(("dc", 1), ("annapolis", 2), ("los_angeles", None))
+    ingest.ingest([export], dataset, update_facts=False)
+    files = {path: os.path.getmtime(path) for paths in partitions.partition_files(dataset, partitions.partition_states(dataset)).values() for path in paths}
+    before = read_dataset(dataset)
+
+    record = ingest.ingest([export], dataset, update_facts=False)
+    assert (record["added"], record["updated"], record["unchanged"], record["states"]) == (0, 0, 3, [])
+    after_files = {path: os.path.getmtime(path) for paths in partitions.partition_files(dataset, partitions.partition_states(dataset)).values() for path in paths}
+    assert after_files == files
+    pd.testing.assert_frame_equal(read_dataset(dataset), before)
+
+
+def test_incremental_state_counts_equal_full_recount(app_dataset, write_export, monkeypatch, tmp_path):
+    ingest.ingest([write_export(("dc", 1), ("annapolis", 2), ("baltimore", 3), ("austin", 4), ("richmond", 5),
+                                ("los_angeles", 6))], app_dataset)
+
+    # The second ingest touches only states already in the table, so it takes the incremental path
+    builds = []
+    build = statefacts.build
+    monkeypatch.setattr(statefacts, "build", lambda *args, **kwargs: builds.append(1) or build(*args, **kwargs))
+    ingest.ingest([write_export(("richmond", 2), ("los_angeles", 7), ("austin", 4, "Renamed"))], app_dataset)
+    assert builds == []
+
+    incremental, _ = statefacts.read_state_facts()
+    full = build(str(tmp_path / "full_facts.parquet"))
+    pd.testing.assert_frame_equal(incremental, full)
+    assert incremental.set_index("State")["Charging_Stations"].to_dict() == {"CA": 2, "DC": 1, "MD": 1, "TX": 1, "VA": 2}
+
+
+def test_station_finder_index_follows_ingest(app_dataset, write_export):
+    from views import station_finder
+
+    def nearest_names(lat, lon, k):
+        df, index = station_finder.load_station_index(datastore.station_version())
+        ids, _ = index.query_knn(lat, lon, k)
+        # Brute force over the same frame the page shows
+        brute = StationIndex(df["Latitude"], df["Longitude"]).query_knn(lat, lon, k)[0]
+        assert np.array_equal(np.sort(ids), np.sort(brute))
+        return df.iloc[ids]["Station Name"].tolist()
+
+    ingest.ingest([write_export(("annapolis", 10), ("baltimore", 11))], app_dataset, update_facts=False)
+    assert nearest_names(38.8973, -77.0063, 1) == ["Annapolis Garage"]
+
+    # A station added in another partition changes the row order of the reloaded frame
+    ingest.ingest([write_export(("dc", 12))], app_dataset, update_facts=False)
+    assert nearest_names(38.8973, -77.0063, 1) == ["Union Station"]
+    assert len(station_finder.load_station_index(datastore.station_version())[0]) == 3
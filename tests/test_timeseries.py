@@ -0,0 +1,19 @@
+import numpy as np
+
+from timeseries import StateYearMatrix
+
+
+def test_ranks_share_the_best_rank_on_ties():
+    values = np.array([[3.0, 1.0], [5.0, np.nan], [3.0, 2.0], [1.0, 2.0]])
+    ranks = StateYearMatrix._ranks(values)
+    np.testing.assert_array_equal(ranks, [[2, 3], [1, np.nan], [2, 1], [4, 1]])
+
+
+def test_growth_frame_for_a_state_without_a_first_year_value():
+    matrix = StateYearMatrix(["North Dakota", "Texas"], [2016, 2017, 2018], [[np.nan, 1.0, 4.0], [1.0, 2.0, 4.0]])
+    df = matrix.growth_frame().set_index("State")
+
+    assert df.loc["ND", "since"] == 2017
+    assert df.loc["ND", "start"] == 1.0
+    assert df.loc["ND", "cagr"] == 3.0
+    assert df["rank_change"].isna().tolist() == [True, False]
@@ -0,0 +1,154 @@
+# Static raster tiles for the charging station map
+# python tiles.py [--min-zoom 0] [--max-zoom 11] [--out static/tiles]
+#
+# Pre-renders every station into a z/x/y PNG pyramid. Streamlit serves the folder through
+# static file serving (.streamlit/config.toml), so the "Pre-rendered tiles" map mode costs
+# no Python work per page view whatever the station count.
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+import datastore
+from clustering import TILE_SIZE, project
+
+TILE_DIR = os.path.join("static", "tiles")
+TILE_URL = "app/static/tiles/{z}/{x}/{y}.png"
+MIN_ZOOM = 0
+MAX_ZOOM = 11
+
+# Dot colors from sparse (light green) to dense (dark green) pixels; index 0 is transparent
+PALETTE = [
+    (0, 0, 0),
+    (143, 193, 52),
+    (76, 175, 80),
+    (46, 125, 50),
+    (27, 94, 32),
+]
+DOT_ALPHA = 220
+
+
+def dot_radius(zoom):
+    return 1 if zoom < 5 else 2 if zoom < 9 else 3
+
+
+def _disk(radius):
+    offsets = np.arange(-radius, radius + 1)
+    dy, dx = np.meshgrid(offsets, offsets, indexing="ij")
+    inside = dx ** 2 + dy ** 2 <= radius ** 2 + radius
+    return dy[inside], dx[inside]
+
+
+def render_tile(local_x, local_y, radius):
+    """Palette-index array for one tile; `local_x/y` are pixel positions relative to the tile."""
+    # Station count per occupied pixel (shifted by `radius` so edge pixels stay non-negative)
+    width = TILE_SIZE + 2 * radius
+    pixels, counts = np.unique((local_y + radius) * width + (local_x + radius), return_counts=True)
+    pixel_y, pixel_x = np.divmod(pixels, width)
+    pixel_y, pixel_x = pixel_y - radius, pixel_x - radius
+
+    # Palette level per occupied pixel (1 station → 1, 2-3 → 2, 4-7 → 3, 8+ → 4)
+    levels = np.minimum(np.log2(counts).astype(np.int64) + 1, len(PALETTE) - 1)
+
+    # Stamp a disk around every occupied pixel; denser pixels are written last and win
+    dy, dx = _disk(radius)
+    stamp_y = (pixel_y[:, None] + dy[None, :]).ravel()
+    stamp_x = (pixel_x[:, None] + dx[None, :]).ravel()
+    stamp_level = np.repeat(levels, len(dy))
+    inside = (stamp_x >= 0) & (stamp_x < TILE_SIZE) & (stamp_y >= 0) & (stamp_y < TILE_SIZE)
+    stamp_index = stamp_y[inside] * TILE_SIZE + stamp_x[inside]
+    stamp_level = stamp_level[inside]
+
+    tile = np.zeros(TILE_SIZE * TILE_SIZE, dtype=np.uint8)
+    for level in range(1, len(PALETTE)):
+        tile[stamp_index[stamp_level >= level]] = level
+    return tile.reshape(TILE_SIZE, TILE_SIZE)
+
+
+def save_tile(tile, path):
+    image = Image.fromarray(tile, "P")
+    image.putpalette([channel for color in PALETTE for channel in color])
+    image.save(path, transparency=bytes([0] + [DOT_ALPHA] * (len(PALETTE) - 1)))
+
+
+def render_zoom(x, y, zoom, out_dir):
+    """Write every non-empty tile of one zoom level; returns the number of tiles."""
+    radius = dot_radius(zoom)
+    scale = TILE_SIZE * 2 ** zoom
+    px = np.floor(x * scale).astype(np.int64)
+    py = np.floor(y * scale).astype(np.int64)
+    n_tiles = 2 ** zoom
+
+    # A dot near a tile edge also belongs to the neighbouring tiles it overlaps
+    corners = [(ox, oy) for ox in (-radius, radius) for oy in (-radius, radius)]
+    tile_x = np.concatenate([(px + ox) // TILE_SIZE for ox, _ in corners])
+    tile_y = np.concatenate([(py + oy) // TILE_SIZE for _, oy in corners])
+    point = np.tile(np.arange(len(px)), len(corners))
+    keep = (tile_x >= 0) & (tile_x < n_tiles) & (tile_y >= 0) & (tile_y < n_tiles)
+    pairs = np.unique(np.stack([tile_x[keep] * n_tiles + tile_y[keep], point[keep]], axis=1), axis=0)
+
+    tile_keys, starts = np.unique(pairs[:, 0], return_index=True)
+    ends = np.append(starts[1:], len(pairs))
+    for key, start, end in zip(tile_keys, starts, ends):
+        tx, ty = divmod(int(key), n_tiles)
+        members = pairs[start:end, 1]
+        local_x = px[members] - tx * TILE_SIZE
+        local_y = py[members] - ty * TILE_SIZE
+        inside = (local_x >= -radius) & (local_x < TILE_SIZE + radius) & (local_y >= -radius) & (local_y < TILE_SIZE + radius)
+        tile = render_tile(local_x[inside], local_y[inside], radius)
+
+        tile_dir = os.path.join(out_dir, str(zoom), str(tx))
+        os.makedirs(tile_dir, exist_ok=True)
+        save_tile(tile, os.path.join(tile_dir, f"{ty}.png"))
+    return len(tile_keys)
+
+
+def build_tiles(lat, lon, out_dir=TILE_DIR, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    valid = np.isfinite(lat) & np.isfinite(lon)
+    x, y = project(lat[valid], lon[valid])
+
+    counts = {}
+    for zoom in range(min_zoom, max_zoom + 1):
+        counts[zoom] = render_zoom(x, y, zoom, out_dir)
+
+    # Manifest read by the dashboard (zoom range for max_native_zoom, build info)
+    manifest = {
+        "min_zoom": min_zoom,
+        "max_zoom": max_zoom,
+        "stations": int(valid.sum()),
+        "tiles": counts,
+        "source": datastore.station_source(),
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(out_dir=TILE_DIR):
+    """Manifest of the built pyramid, or None if the tiles have not been generated."""
+    try:
+        with open(os.path.join(out_dir, "manifest.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render the charging station tile pyramid.")
+    parser.add_argument("--min-zoom", type=int, default=MIN_ZOOM)
+    parser.add_argument("--max-zoom", type=int, default=MAX_ZOOM)
+    parser.add_argument("--out", default=TILE_DIR)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    df = datastore.read_stations(["Latitude", "Longitude"])
+    manifest = build_tiles(df["Latitude"], df["Longitude"], args.out, args.min_zoom, args.max_zoom)
+    print(f"Wrote {sum(manifest['tiles'].values()):,} tiles for {manifest['stations']:,} stations "
+          f"to {args.out} in {time.perf_counter() - started:.1f}s")
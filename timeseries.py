@@ -0,0 +1,136 @@
+# State × year matrix of EVs per 10,000 people (ev_per_10000.csv)
+# The long CSV is pivoted once into a dense (states, years) NumPy matrix with state/year index
+# maps, and the growth metrics are computed over whole columns at build time:
+#   yoy      year-over-year growth (fraction; NaN for the first year)
+#   cagr     compound annual growth from each state's first to last reported year
+#   ranks    rank of each state within every year (1 = highest)
+#   rolling  trailing mean over ROLLING_YEARS years
+# A year of the map is then one matrix column, with no DataFrame filtering per year.
+
+import numpy as np
+import pandas as pd
+
+import states as state_table
+
+ROLLING_YEARS = 3
+
+
+class StateYearMatrix:
+    """Dense state × year values with precomputed growth metrics."""
+
+    def __init__(self, states, years, values):
+        self.states = np.asarray(states, dtype=object)
+        self.keys = state_table.keys(self.states)
+        self.codes = state_table.codes(self.keys)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.key_index = {int(key): i for i, key in enumerate(self.keys)}
+        self.year_index = {int(year): j for j, year in enumerate(self.years)}
+
+        self.yoy = self._yoy(self.values)
+        self.first = self._first_reported(self.values)
+        self.cagr = self._cagr(self.values, self.years, self.first)
+        self.ranks = self._ranks(self.values)
+        self.rolling = self._rolling_mean(self.values, ROLLING_YEARS)
+
+    @classmethod
+    def from_frame(cls, df, state="state", year="year", value="ev_per_10000"):
+        """Pivot a long (state, year, value) frame with index arithmetic instead of pd.pivot."""
+        keys = state_table.keys(df[state])
+        known = keys != state_table.UNKNOWN       # Rows that are not a state are dropped
+        keys, rows = np.unique(keys[known], return_inverse=True)
+        years, cols = np.unique(df[year].to_numpy(dtype=np.int64)[known], return_inverse=True)
+        values = np.full((len(keys), len(years)), np.nan)
+        values[rows, cols] = df[value].to_numpy(dtype=np.float64)[known]
+        return cls(state_table.names(keys), years, values)
+
+    @staticmethod
+    def _yoy(values):
+        yoy = np.full(values.shape, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            yoy[:, 1:] = values[:, 1:] / values[:, :-1] - 1
+        yoy[~np.isfinite(yoy)] = np.nan
+        return yoy
+
+    @staticmethod
+    def _first_reported(values):
+        # Column of each state's first reported year (0 when it has none)
+        return np.isfinite(values).argmax(axis=1)
+
+    @staticmethod
+    def _cagr(values, years, first):
+        reported = np.isfinite(values)
+        last = values.shape[1] - 1 - reported[:, ::-1].argmax(axis=1)
+        rows = np.arange(len(values))
+        start, end = values[rows, first], values[rows, last]
+        periods = years[last] - years[first]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cagr = (end / start) ** (1.0 / periods) - 1
+        cagr[(start <= 0) | (periods <= 0) | ~np.isfinite(cagr)] = np.nan
+        return cagr
+
+    @staticmethod
+    def _ranks(values):
+        # Highest value → 1; ties share the best rank (1, 2, 2, 4); missing values are not ranked
+        keys = np.where(np.isfinite(values), -values, np.inf)
+        ranks = np.empty(values.shape)
+        for j in range(values.shape[1]):
+            ranks[:, j] = np.searchsorted(np.sort(keys[:, j]), keys[:, j], side="left") + 1
+        ranks[~np.isfinite(values)] = np.nan
+        return ranks
+
+    @staticmethod
+    def _rolling_mean(values, window):
+        # Trailing window over the reported years (shorter at the start)
+        filled = np.nan_to_num(values)
+        counts = np.isfinite(values).astype(np.float64)
+        sums = np.cumsum(filled, axis=1)
+        totals = np.cumsum(counts, axis=1)
+        sums[:, window:] -= sums[:, :-window].copy()
+        totals[:, window:] -= totals[:, :-window].copy()
+        with np.errstate(invalid="ignore"):
+            return np.where(totals > 0, sums / totals, np.nan)
+
+    @property
+    def latest_year(self):
+        return int(self.years[-1])
+
+    def year(self, year, metric="values"):
+        """One column of `values`, `yoy`, `ranks` or `rolling` (one entry per state)."""
+        return getattr(self, metric)[:, self.year_index[int(year)]]
+
+    def series(self, state, metric="values"):
+        """One state's row (full name or 2-letter code)."""
+        i = self.key_index[state_table.key_of(state)]
+        return getattr(self, metric)[i]
+
+    def year_frame(self, year=None):
+        """DataFrame of one year (the latest by default): state, code, value, growth and rank."""
+        j = self.year_index[self.latest_year if year is None else int(year)]
+        return pd.DataFrame({
+            "state": self.states,
+            "State": self.codes,
+            "ev_per_10000": self.values[:, j],
+            "yoy": self.yoy[:, j],
+            "rank": self.ranks[:, j],
+            "rolling": self.rolling[:, j],
+        })
+
+    def growth_frame(self):
+        """DataFrame of every state's start year and value, latest value, CAGR and rank change.
+
+        A state's CAGR runs from its own first reported year ("since"); ranks are nullable
+        integers, and the rank change over the whole period is <NA> when a state was not ranked
+        in the first year.
+        """
+        rows = np.arange(len(self.values))
+        return pd.DataFrame({
+            "state": self.states,
+            "State": self.codes,
+            "since": pd.array(np.where(np.isfinite(self.values).any(axis=1), self.years[self.first], np.nan), dtype="Int64"),
+            "start": self.values[rows, self.first],
+            f"{self.latest_year}": self.values[:, -1],
+            "cagr": self.cagr,
+            "rank": pd.array(self.ranks[:, -1], dtype="Int64"),
+            "rank_change": pd.array(self.ranks[:, 0] - self.ranks[:, -1], dtype="Int64"),
+        })
@@ -0,0 +1,28 @@
+# Dashboard pages
+# Each page is a module with a render() function. A page module, and with it heavy imports such as
+# plotly, folium or the station data, is only imported the first time that page is selected, so
+# the text-only pages (Overview, Conclusion) never load them.
+# (Not named `pages/`: Streamlit would turn that folder into its own multipage navigation.)
+
+import importlib
+
+# Menu title → module
+PAGES = {
+    "Overview": "views.overview",
+    "EV Charging Stations": "views.station_map",
+    "Station Finder": "views.station_finder",
+    "EV Infrastructure & Gas Price Trends": "views.infrastructure",
+    "EV Statistics I": "views.statistics_registrations",
+    "EV Statistics II": "views.statistics_density",
+    "EV Adoption Over Time": "views.density_trends",
+    "Conclusion": "views.conclusion",
+}
+
+
+def load(title):
+    """Page module for a menu title (imported on first use)."""
+    return importlib.import_module(PAGES[title])
+
+
+def render(title):
+    load(title).render()
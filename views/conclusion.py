@@ -0,0 +1,73 @@
+# Conclusion page
+
+import streamlit as st
+
+import fitsummary
+
+
+def load_fits():
+    # Same fits as the EV Statistics pages, stored with the fact table (no data or plotly imports)
+    summary = fitsummary.read()
+    if summary is None:
+        # Not written yet (fact table built before the summary existed): fit once and store it
+        import datastore
+
+        summary = fitsummary.compute(datastore.state_facts())
+        fitsummary.write(summary)
+    return summary
+
+
+def render():
+    st.write("#### Conclusion & Critical Analysis")
+
+    fits = load_fits()
+    r2_adoption, r2_population = fits["adoption"]["r2"], fits["population"]["r2"]
+
+    st.markdown(f"""
+        <div style="padding-bottom: 4px;">
+        This project provides a comprehensive visualization of public EV charging infrastructure and its role in electric vehicle adoption and accessibility across the U.S. 
+        The interactive maps and statistical analyses clearly illustrate the distribution of charging stations, their accessibility relative to population density, 
+        and the relationships with EV adoption rates and gasoline price volatility.  
+    <ul>
+    <br>
+        <b>EV Charging Station Distribution</b>
+        <li>EV registrations in the U.S. show significant geographic concentration, with California leading by a large margin.</li>
+        <li>Wide disparities exist across states, suggesting factors such as state policies, economic conditions, and infrastructure availability strongly influence regional EV adoption patterns.</li>
+    <br>
+        <b>EV Charging Station Infrastructure Growth & Gasoline Prices</b>
+        <li>U.S. public EV charging infrastructure has shown consistent and rapid growth, particularly since 2011, with charging ports increasing faster than station locations, indicating a shift toward multi-port stations.</li>
+        <li>Gasoline price trends from 2007 to 2023 show significant fluctuations driven by economic crises, global energy disruptions, and supply chain issues, potentially influencing consumer decisions towards adopting electric vehicles.</li>
+    <br>
+        <b>EV Charging Station Density vs. EV Adoptions (Log Scale)</b>
+        <li>Log transformation provides a more balanced view of the relationship between charging station density and EV adoption.</li>
+        <li>While EV adoptions generally increase as charging station density grows, the rate of increase is gradual rather than linear.</li>
+        <li>A {fitsummary.strength(r2_adoption)} R² value (~{r2_adoption:.2f}) indicates that charging station density alone does not sufficiently explain EV adoption rates; thus, additional factors such as policies, economic conditions, and consumer behavior should be considered.</li>
+    <br>
+        <b>EV Charging Station Density vs. Population Density (Log Scale)</b>
+        <li>In the U.S., states with higher EV adoption generally tend to have a higher density of EV charging stations.</li>
+        <li>However, with a coefficient of determination of approximately {r2_population:.0%}, while the relationship between the two variables is relatively strong, it also suggests that other factors may still influence charging station density.</li>      
+    </ul>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Limitations
+    st.markdown("---")
+    st.write("#### Limitations")
+    st.markdown("""
+    <ul>
+        <li>The current analysis has primarily relied on aggregated state-level data, potentially masking important local variations and nuances.</li>
+        <li>The weak to moderate correlations (indicated by relatively low R² values) suggest that EV adoption and infrastructure expansion are influenced by various factors beyond the scope of the current data, such as local policies, incentives, consumer awareness, and socioeconomic conditions.</li>      
+        <li>The current analysis includes only public EV charging stations, excluding private and residential charging options. Due to the omission of private charging facilities, the dataset may underestimate the actual availability and accessibility of EV charging across states.</li>
+    </ul>
+    """, unsafe_allow_html=True)
+    
+    # Potential Improvements & Future Directions
+    st.markdown("---")
+    st.write("#### Potential Improvements & Future Directions")
+    st.markdown("""
+    <ul>
+        <li>Incorporate granular, local-level data to better capture nuances in EV adoption and charging infrastructure accessibility that state-level data might obscure.</li>
+        <li>Integrate additional influencing variables such as local policies, economic incentives, consumer demographics, and socioeconomic factors to improve explanatory power and deepen the understanding of EV adoption drivers.</li>
+        <li>Expand the dataset to include private and residential EV charging stations, providing a more accurate assessment of the true availability and accessibility of charging infrastructure.</li>      
+    </ul>
+    """, unsafe_allow_html=True)
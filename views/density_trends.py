@@ -0,0 +1,98 @@
+# EV Adoption Over Time page
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+
+import figcache
+import geometry
+import datastore
+import perf
+
+
+# Year-animated choropleth: one base trace with the geometry, and one frame per year that only
+# replaces the matrix column (z) and hover data. The slider and play button run in the browser.
+def build_animation(matrix):
+    vmax = float(np.nanmax(matrix.values))
+
+    def frame_data(j):
+        # Hover text is formatted here so missing ranks and changes show as "n/a"
+        customdata = np.column_stack([
+            matrix.states,
+            [f"{rank:.0f}" if np.isfinite(rank) else "n/a" for rank in matrix.ranks[:, j]],
+            [f"{change:.1f}%" if np.isfinite(change) else "n/a" for change in matrix.yoy[:, j] * 100],
+        ])
+        return dict(z=matrix.values[:, j], customdata=customdata)
+
+    latest = len(matrix.years) - 1
+    fig = go.Figure(
+        data=[go.Choropleth(
+            geojson=geometry.state_geojson(),
+            featureidkey="id",
+            locations=matrix.codes,
+            colorscale="Blues",
+            zmin=0, zmax=vmax,      # Same color range for every year
+            colorbar=dict(title="EV per 10,000 People", thickness=16),
+            hovertemplate="%{customdata[0]}: <b>%{z}</b> EV per 10,000 People<br>"
+                          "Rank %{customdata[1]}, %{customdata[2]} vs. previous year<extra></extra>",
+            **frame_data(latest)
+        )],
+        frames=[go.Frame(name=str(year), data=[go.Choropleth(**frame_data(j))], traces=[0])
+                for j, year in enumerate(matrix.years)],
+    )
+
+    animate = {"mode": "immediate", "frame": {"duration": 0, "redraw": True}, "transition": {"duration": 0}}
+    fig.update_layout(
+        geo=dict(scope="usa"),
+        height=520,
+        margin=dict(l=0, r=0, t=10, b=0),
+        sliders=[dict(
+            active=latest,
+            currentvalue=dict(prefix="Year: "),
+            pad=dict(t=30),
+            steps=[dict(label=str(year), method="animate", args=[[str(year)], animate]) for year in matrix.years],
+        )],
+        updatemenus=[dict(
+            type="buttons",
+            direction="left",
+            x=0, y=0, xanchor="left", yanchor="top",
+            pad=dict(t=40),
+            buttons=[
+                dict(label="▶ Play", method="animate",
+                     args=[None, {**animate, "frame": {"duration": 700, "redraw": True}, "fromcurrent": True}]),
+                dict(label="❚❚ Pause", method="animate", args=[[None], animate]),
+            ],
+        )],
+    )
+    return fig
+
+
+def render():
+    st.header("📈 EV Adoption Over Time")
+    matrix = datastore.ev_density_matrix()
+    first_year, latest_year = int(matrix.years[0]), matrix.latest_year
+    st.write(f"Electric vehicles per 10,000 people by state from {first_year} to {latest_year}. Drag the slider or press play to move through the years.")
+
+    with perf.stage("figure"):
+        fig = figcache.cached_figure("density_animation", datastore.ev_density(), "ev_per_10000", "Blues", (None, 520),
+                                     lambda: build_animation(matrix))
+    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+
+    # Growth table (Precomputed with the matrix)
+    # Growth runs from each state's first reported year ("Since"), which is not always first_year
+    st.write(f"#### Fastest Growing States (through {latest_year})")
+    with perf.stage("transform"):
+        df_growth = matrix.growth_frame().dropna(subset=["cagr"]).sort_values("cagr", ascending=False).head(10)
+        df_growth = df_growth.assign(cagr=(df_growth["cagr"] * 100).round(1)).rename(columns={
+            "state": "State", "State": "Code", "since": "Since", "start": "First Value", "cagr": "Annual Growth (%)",
+            "rank": f"Rank {latest_year}", "rank_change": f"Rank Change Since {first_year}",
+        })
+    st.dataframe(df_growth, hide_index=True, use_container_width=True)
+
+    st.markdown("""
+    <div style="font-size: 14px; color: gray;">
+        <b>Acronyms and Abbreviations</b>: EV = Electric Vehicle
+        <br>
+        <b>Source</b>: TransAtlas from the Alternative Fuels Data Center (AFDC)
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,238 @@
+# EV Infrastructure & Gas Price Trends page
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+import datastore
+import perf
+
+
+def render():
+    #####################################################
+    # 2. U.S. Public EV Charging Infrastructure Over Time
+    #####################################################
+    st.header("U.S. Public EV Charging Infrastructure Over Time")
+    st.write("This graph shows the growth of public EV charging infrastructure in the U.S. from 2007 to 2023, highlighting the increase in both station locations and charging ports.")
+
+    # Remove slider background (Apply CSS)
+    st.markdown("""
+        <style>
+            /* Remove entire slider background */
+            div[data-testid="stSlider"] > div {
+                background: transparent !important;
+            }
+            /* Adjust slider bar inner style */
+            div[data-baseweb="slider"] {
+                background: transparent !important;
+                border: none !important;
+            }
+            /* Adjust slider handle style */
+            div[data-testid="stThumbValue"] {
+                background: transparent !important;
+                color: #FF4B4B !important;  /* Slider number color */
+            }
+            /* Selected range bar (Progress bar) */
+            div[data-testid="stRangeSliderBar"] {
+                background: red !important;  /* Changeable to desired color */
+            }
+        </style>
+    """, unsafe_allow_html=True)
+
+    # Load the cleaned infrastructure table (Parsed once by databuild.py, sorted by year)
+    df = datastore.infrastructure()
+
+    # # Year slider
+    min_year = int(df["Year"].min())
+    max_year = int(df["Year"].max())
+    start_year, end_year = st.slider(
+        "Select Year Range",
+        min_value=min_year,
+        max_value=max_year,
+        value=(2013, 2023),
+        step=1
+    )
+
+    # Filter data by year range
+    with perf.stage("transform"):
+        filtered_df = df[(df["Year"] >= start_year) & (df["Year"] <= end_year)]
+
+        # Convert to "melt" format for Plotly line chart (Wide → Long)
+        melted_df = filtered_df.melt(
+            id_vars="Year",
+            value_vars=["EV Charging Ports", "Station Locations"],
+            var_name="Category",
+            value_name="Count"
+        )
+
+    # Create Plotly line chart
+    with perf.stage("figure"):
+        fig = px.line(
+            melted_df,
+            x="Year",
+            y="Count",
+            color="Category",                # Line separation
+            markers=True,                    # Show markers at each point
+            title=f"U.S. Public EV Charging Infrastructure ({start_year}-{end_year})",
+            color_discrete_map={
+            "EV Charging Ports": "#8fc134",  # Green
+            "Station Locations": "#f1bf46"   # Yellow
+            }
+        )
+
+        # Modify legend items (Set inside update_layout)
+        fig.for_each_trace(lambda t: t.update(customdata=[[t.name]] * len(t.x)))
+    
+        # Adjust line thickness and point size
+        fig.update_traces(
+            hoverlabel=dict(namelength=0),
+            line=dict(width=3), 
+            marker=dict(size=6),
+            hovertemplate="%{customdata[0]}<br>"
+                        "Year: <b>%{x}</b><br>"
+                        "Count: <b>%{y:,}</b>"
+        )
+
+        # Apply comma format to y-axis
+        fig.update_layout(
+            xaxis=dict(
+                type="category",    # Set x-axis as categorical to display only integer years
+                tickmode="linear",  # Force display of all years (Prevent omissions)
+                tickvals=filtered_df["Year"].unique(),  # Set x-axis tick values (Year)
+            ),
+            yaxis=dict(tickformat=",")  # Thousand separator comma
+        )
+
+    # Display Plotly chart in Streamlit (Interactive, not an image)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Graph description
+    st.markdown("""
+    <b>Key Insights: U.S. Public EV Charging Infrastructure (2007-2023)<b>
+    <ul>
+        <li><b>Rapid Growth Since 2011:</b> The expansion of EV charging infrastructure began to accelerate around 2011, with a steady increase in both station locations and charging ports.</li>
+        <li><b>Faster Growth in Charging Ports:</b>The number of EV Charging Ports has grown at a significantly higher rate than Station Locations, suggesting an increase in multi-port charging stations.</li>
+        """, unsafe_allow_html=True)
+
+    st.markdown("")
+    st.markdown("")
+    st.markdown("")
+    
+    # Data source
+    st.markdown("""
+    <div style="font-size: 14px; color: gray;">
+        <b>Source</b>: U.S. Public Electric Vehicle Charging Infrastructure from Alternative Fuels Data Center (AFDC)
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    st.markdown("---")
+    
+    # Title: U.S. All Grades All Formulations Retail Gasoline Prices
+    st.header("U.S. All Grades All Formulations Retail Gasoline Prices")
+    st.write("""
+             This graph shows the annual average retail gasoline prices in the U.S. from 2007 to 2023, measured in dollars per gallon. Use the slider below to adjust the year range and explore trends over time.
+            """)
+    
+    # Data definition (Gasoline price by year)
+    gas_prices = {
+        2007: 2.843, 2008: 3.299, 2009: 2.406, 2010: 2.835, 2011: 3.576,
+        2012: 3.68, 2013: 3.575, 2014: 3.437, 2015: 2.52, 2016: 2.25,
+        2017: 2.528, 2018: 2.813, 2019: 2.691, 2020: 2.258, 2021: 3.10,
+        2022: 4.059, 2023: 3.635
+    }
+
+    # Convert DataFrame (Change year to int)
+    with perf.stage("transform"):
+        df_gas_prices = pd.DataFrame(list(gas_prices.items()), columns=["Year", "Dollars per Gallon"])
+        df_gas_prices["Year"] = df_gas_prices["Year"].astype(int)
+
+    # Add year slider
+    start_year, end_year = st.slider(
+        "Select Year Range",
+        min_value=min(gas_prices.keys()),
+        max_value=max(gas_prices.keys()),
+        value=(max(2013, min(gas_prices.keys())), 2023),  # Default value (If 2013 or later)
+        step=1,
+        key="year_range_slider"
+    )
+     
+    # Add "Category" column and convert to long format
+    with perf.stage("transform"):
+        df_gas_prices["Category"] = ""
+        melted_df = df_gas_prices.melt(id_vars=["Year"], value_vars=["Dollars per Gallon"], var_name="Category", value_name="Count" )
+
+        # Filter data by selected year range
+        filtered_df = df_gas_prices[(df_gas_prices["Year"] >= start_year) & (df_gas_prices["Year"] <= end_year)]
+   
+    # Create Plotly line chart
+    with perf.stage("figure"):
+        fig = px.line(
+            filtered_df,
+            x="Year",
+            y="Dollars per Gallon",
+            color="Category",
+            markers=True,
+            title=f"U.S. Retail Gasoline Prices ({start_year}-{end_year})",
+            color_discrete_map={"Dollars per Gallon": "#467cd1"}    # Line color
+        )
+        fig = px.line(
+            filtered_df,
+            x="Year",
+            y="Dollars per Gallon",
+            color="Category",  
+            markers=True,
+            title=f"U.S. Retail Gasoline Prices ({start_year}-{end_year})",
+            color_discrete_map={"Dollars per Gallon": "#467cd1"}
+        )
+
+        # Convert x-axis to categorical to fix year decimal issue
+        fig.update_layout(
+            xaxis=dict(type="category"),    # Set year as category to display exact values
+            yaxis=dict(tickformat="$.2f"),  # Display up to 3 decimal places
+            legend=dict(                    # Set legend
+                title="Category",           # Legend title
+                x=1.025,                    # Position outside to the right on x-axis
+                y=1                         # Align top on y-axis
+            )
+        )
+    
+        # Modify legend items (Set inside update_layout)
+        fig.for_each_trace(lambda t: t.update(name="U.S. Gas Prices"))
+
+        # Apply line and marker styles to legend & Add legend names
+        fig.update_traces(
+            hoverlabel=dict(namelength=0),
+            line=dict(width=3, color="#467cd1"),
+            marker=dict(size=6, color="#467cd1", symbol="circle"),
+            hovertemplate="U.S. Gas Prices<br>"
+                        "Year: <b>%{x}</b><br>"
+                        "Dollars per Gallon: <b>$%{y:.2f}</b>",
+            showlegend=True
+        ) 
+    
+    # Display Plotly chart in Streamlit
+    st.plotly_chart(fig, use_container_width=True)    
+    
+    # Insights
+    st.markdown("""
+    <b>Key Insights: U.S. Retail Gasoline Prices (2007-2023)<b>
+    <ul>
+        <li><b>2009 Drop:</b> Prices fell sharply due to the global financial crisis.</li>
+        <li><b>2014 Peak & 2016 Drop:</b> Prices peaked around <b>$3.50/gal</b> before dropping below <b>$2.50/gal</b>, influenced by oil supply increases.</li>
+        <li><b>2020 Low & 2022 Surge:</b> Prices hit a low in 2020 due to the COVID-19 pandemic, then surged past <b>$4.00/gal</b> in 2022 due to supply chain issues & global energy shocks.</li>
+        <li><b>2023 Decline:</b> Prices slightly decreased after the 2022 spike, reflecting market stabilization.</li>
+        <li>This trend highlights <b>economic downturns</b>, <b>oil supply shifts</b>, and <b>global disruptions</b> as key drivers of gasoline price fluctuations.</li>
+        """, unsafe_allow_html=True)
+
+    st.markdown("")
+    st.markdown("")
+    st.markdown("")
+    
+    # Data source & Abbreviations
+    st.markdown("""
+    <div style="font-size: 14px; color: gray; margin-bottom: -100px; padding: 0px;">
+        <b>Acronyms and Abbreviations</b>: EV = Electric Vehicle  
+        <br>
+        <b>Source</b>: U.S. Energy Information Administration
+    </div>
+    """, unsafe_allow_html=True)
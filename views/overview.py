@@ -0,0 +1,26 @@
+# Overview page
+
+import streamlit as st
+
+
+def render():
+    st.write("#### Impact of EV Charging Infrastructure on EV Adoption & Accessibility Across the U.S.")
+    st.markdown("""
+        <div style="padding-bottom: 4px;">
+            The project <b>"Impact of EV Charging Infrastructure on EV Adoption & Accessibility Across the U.S."</b> 
+            visualizes key data collected at the end of 2023. The dashboard provides interactive maps to clearly illustrate 
+            the distribution and accessibility of public EV charging stations nationwide, highlighting how this infrastructure influences electric vehicle adoption. 
+            Additionally, it enables analysis of relationships between charging station availability, population distribution, 
+            EV adoption trends, and the potential impact of gasoline price volatility on infrastructure expansion and EV uptake.
+        </div>
+    """, unsafe_allow_html=True)
+    st.markdown("---")
+    st.write("#### 📌 Research Questions: What are we going to explore?")
+    st.markdown("""
+    <ol>
+        <li>EV Charging Station Distribution</li>
+        <li>EV Charging Station Infrastructure Growth & Gasoline Prices</li>
+        <li>EV Charging Station Density vs. EV Adoptions</li>
+        <li>EV Charging Station Density vs. Population Density</li>
+    </ol>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,75 @@
+# Station Finder page
+
+import streamlit as st
+import folium
+from streamlit_folium import st_folium
+
+from markers import StationLayer, marker_payload
+from spatialindex import StationIndex
+import datastore
+import perf
+
+
+STATION_COLUMNS = ["Latitude", "Longitude", "Station Name", "Street Address", "City", "State"]
+
+
+# Build the spatial index once per station data version and share it with every session.
+# The frame is returned with the index, so the row positions of the index always match it.
+@st.cache_resource(max_entries=2)
+def load_station_index(version=None):
+    df = datastore.stations(STATION_COLUMNS)
+    return df, StationIndex(df["Latitude"], df["Longitude"])
+
+
+def render():
+    st.header("🔎 Find Nearby EV Charging Stations")
+    st.write("Enter a location to find the nearest public EV charging stations and count how many are within a given distance. Lookups use a spatial index over every station, so no rows are scanned one by one.")
+    ####################################
+    # 1-1. Nearest Stations & Radius Search
+    ####################################
+
+    with perf.stage("transform"):
+        df_stations, station_index = load_station_index(datastore.station_version())
+
+    # Search inputs
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        query_lat = st.number_input("Latitude", min_value=-90.0, max_value=90.0, value=38.9072, format="%.4f")
+    with col2:
+        query_lon = st.number_input("Longitude", min_value=-180.0, max_value=180.0, value=-77.0369, format="%.4f")
+    with col3:
+        radius_km = st.slider("Search radius (km)", min_value=1, max_value=100, value=10)
+    with col4:
+        k_nearest = st.slider("Nearest stations", min_value=1, max_value=25, value=5)
+
+    # Queries
+    with perf.stage("transform"):
+        within_ids, within_dist = station_index.query_radius(query_lat, query_lon, radius_km)
+        nearest_ids, nearest_dist = station_index.query_knn(query_lat, query_lon, k_nearest)
+
+    st.write(f"**{len(within_ids):,}** charging stations are within **{radius_km} km** of this location.")
+    if len(nearest_ids):
+        st.write(f"The nearest station is **{nearest_dist[0]:,.2f} km** away.")
+
+    # Nearest stations table
+    with perf.stage("transform"):
+        df_nearest = df_stations.iloc[nearest_ids].reset_index(drop=True)
+        df_nearest.insert(0, "Rank", range(1, len(df_nearest) + 1))
+        df_nearest["Distance (km)"] = nearest_dist.round(2)
+    st.dataframe(df_nearest[["Rank", "Station Name", "Street Address", "City", "State", "Distance (km)"]], hide_index=True, use_container_width=True)
+
+    # Map of the search area
+    with perf.stage("figure"):
+        finder_map = folium.Map(location=[query_lat, query_lon], zoom_start=11, tiles="CartoDB positron", control_scale=True)
+        folium.Circle(location=[query_lat, query_lon], radius=radius_km * 1000, color="#467cd1", fill=True, fill_opacity=0.08).add_to(finder_map)
+        folium.Marker(location=[query_lat, query_lon], tooltip="Search location", icon=folium.Icon(color="blue", icon="location-dot", prefix="fa")).add_to(finder_map)
+        df_found = df_stations.iloc[within_ids].assign(count=1)
+        StationLayer(marker_payload(df_found, extra_columns=["count"])).add_to(finder_map)
+    st_folium(finder_map, width="100%", height=550, returned_objects=[])
+
+    # Data source
+    st.markdown("""
+        <div style="font-size: 14px; color: gray;">
+            <b>Source</b>: Electric Vehicle Charging Station Locations from the Alternative Fuels Data Center (AFDC)
+        </div>
+    """, unsafe_allow_html=True)
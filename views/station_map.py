@@ -0,0 +1,144 @@
+# EV Charging Stations page
+
+import streamlit as st
+import folium
+from streamlit_folium import st_folium
+import streamlit.components.v1 as components
+
+from clustering import StationClusterIndex
+from markers import StationLayer, marker_payload
+import colormap
+import tiles
+import density
+import datastore
+import perf
+
+
+# Build the cluster hierarchy / density grids once per station data version and share them with every session
+@st.cache_resource(max_entries=2)
+def load_cluster_index(version=None):
+    df = datastore.stations(["Latitude", "Longitude", "Station Name"])
+    return StationClusterIndex(df["Latitude"], df["Longitude"], df["Station Name"])
+
+
+@st.cache_resource(max_entries=2)
+def load_density_grids(version=None):
+    df = datastore.stations(["Latitude", "Longitude"])
+    return density.build_density_grids(df["Latitude"], df["Longitude"])
+
+
+# Cluster layer generation function (Only the clusters inside the viewport, sent as one compact payload)
+# Cluster circles are colored by station count on a log scale (colormap.py lookup table)
+def create_cluster_layer(clusters, total):
+    layer = folium.FeatureGroup(name="EV Charging Stations")
+    clusters = clusters.assign(color=colormap.hex_colors(clusters["count"], vmin=2, vmax=max(total, 3), scale="Greens", log=True, start=0.45))
+    StationLayer(marker_payload(clusters, extra_columns=["count", "color"])).add_to(layer)
+    return layer
+
+
+# Density layer generation function (One weighted point per grid cell of the current zoom band)
+def create_density_layer(cells, zoom, cell_deg):
+    layer = folium.FeatureGroup(name="Station Density")
+    density.heatmap_layer(cells, zoom, cell_deg).add_to(layer)
+    return layer
+
+
+# Static tile map: the HTML only points at the tile URLs, so it is built once per process
+@st.cache_resource
+def create_tile_map_html(max_native_zoom):
+    m = folium.Map(location=[39.5, -98.35], zoom_start=4, tiles="CartoDB positron", control_scale=True)
+    folium.TileLayer(
+        tiles=tiles.TILE_URL,
+        attr="Stations: AFDC",
+        name="EV Charging Stations",
+        overlay=True,
+        max_native_zoom=max_native_zoom,
+        max_zoom=18
+    ).add_to(m)
+    return m.get_root().render()
+
+
+def render():
+    st.header("📍 Locations of EV Charging Stations")
+    st.write("This map visualizes **all** EV charging station locations across the United States, including Alaska, Hawaii, and Washington D.C. Nearby stations are grouped into clusters that split apart as you zoom in. Use the zoom function to get a detailed view of specific states or cities!")
+    #############################
+    # 1. EV Charging Stations Map
+    #############################
+
+    # Map mode: clusters or a density grid computed on the server, or tiles pre-rendered by tiles.py
+    map_mode = st.radio("Map mode", ["Clusters", "Density", "Pre-rendered tiles"], horizontal=True)
+
+    if map_mode in ("Clusters", "Density"):
+        # Current map viewport (Updated from the map on every pan/zoom)
+        if "ev_map_view" not in st.session_state:
+            st.session_state.ev_map_view = {
+                "center": (39.5, -98.35),
+                "zoom": 4,
+                "bounds": ((18.0, -170.0), (62.0, -65.0)),
+            }
+        view = st.session_state.ev_map_view
+
+        if map_mode == "Clusters":
+            with perf.stage("transform"):
+                cluster_index = load_cluster_index(datastore.station_version())
+                clusters = cluster_index.get_clusters(view["bounds"], view["zoom"])
+            with perf.stage("figure"):
+                layer = create_cluster_layer(clusters, len(cluster_index))
+            caption = f"Showing {clusters['count'].sum():,} of {len(cluster_index):,} stations in {len(clusters):,} clusters for the current view."
+        else:
+            cell_deg = density.cell_size_for(view["zoom"])
+            with perf.stage("transform"):
+                cells = load_density_grids(datastore.station_version())[cell_deg].cells(view["bounds"])
+            with perf.stage("figure"):
+                layer = create_density_layer(cells, view["zoom"], cell_deg)
+            caption = f"Station density of {cells['count'].sum():,} stations on a {cell_deg}° grid ({len(cells):,} cells) for the current view."
+
+        # Map generation and display
+        with perf.stage("figure"):
+            ev_map = folium.Map(location=[39.5, -98.35], zoom_start=4, tiles="CartoDB positron", control_scale=True)
+        map_state = st_folium(
+            ev_map,
+            key="ev_map",
+            width="100%",       # Auto adjust ratio
+            height=650,
+            center=view["center"],
+            zoom=view["zoom"],
+            feature_group_to_add=layer,
+            returned_objects=["bounds", "zoom", "center"]
+        )
+
+        # Re-query the layer when the viewport moves
+        south_west = ((map_state or {}).get("bounds") or {}).get("_southWest") or {}
+        if south_west.get("lat") is not None and map_state.get("center"):
+            north_east = map_state["bounds"]["_northEast"]
+            new_view = {
+                "center": (map_state["center"]["lat"], map_state["center"]["lng"]),
+                "zoom": map_state["zoom"],
+                "bounds": ((south_west["lat"], south_west["lng"]), (north_east["lat"], north_east["lng"])),
+            }
+            if new_view["zoom"] != view["zoom"] or new_view["bounds"] != view["bounds"]:
+                st.session_state.ev_map_view = new_view
+                st.rerun()
+
+        st.caption(caption)
+
+    else:
+        tile_manifest = tiles.read_manifest()
+        if tile_manifest is None:
+            st.info("The station tiles have not been generated yet. Run `python tiles.py` and reload this page.")
+        else:
+            with perf.stage("figure"):
+                tile_map_html = create_tile_map_html(tile_manifest["max_zoom"])
+            components.html(tile_map_html, height=650)
+            st.caption(f"Pre-rendered tiles of {tile_manifest['stations']:,} stations (built {tile_manifest['built_at']}).")
+
+    # Data source & Abbreviations
+    st.markdown("")
+    st.markdown("")
+    st.markdown("""
+        <div style="font-size: 14px; color: gray; margin-bottom: -100px; padding: 0px;">
+            <b>Acronyms and Abbreviations</b>: EV = Electric Vehicle  
+            <br>
+            <b>Source</b>: Electric Vehicle Registrations by State from the Alternative Fuels Data Center (AFDC)
+        </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,276 @@
+# EV Statistics II page
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+import figcache
+import geometry
+import datastore
+import perf
+import regression
+import resampling
+import states
+
+
+@st.cache_data
+def load_map_data_ev10000():
+    data = {
+        "state": ["Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado", "Connecticut", 
+                "Delaware", "District of Columbia", "Florida", "Georgia", "Hawaii", "Idaho", "Illinois", 
+                "Indiana", "Iowa", "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland", "Massachusetts",
+                "Michigan", "Minnesota", "Mississippi", "Missouri", "Montana", "Nebraska", "Nevada", 
+                "New Hampshire", "New Jersey", "New Mexico", "New York", "North Carolina", "North Dakota",
+                "Ohio", "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina", 
+                "South Dakota", "Tennessee", "Texas", "Utah", "Vermont", "Virginia", "Washington", 
+                "West Virginia", "Wisconsin", "Wyoming"],
+        "ev_per_10000": [25, 37, 121, 23, 322, 153, 87, 81, 119, 113, 84, 178, 43, 79, 38, 28, 38, 26, 
+                        18, 53, 117, 105, 50, 65, 12, 43, 41, 35, 148, 71, 145, 49, 67, 65, 13, 43, 56, 
+                        152, 54, 58, 39, 18, 47, 75, 117, 120, 97, 195, 16, 42, 19],
+    }
+    df = pd.DataFrame(data)
+    df["state_code"] = states.codes(states.keys(df["state"]))
+    return df
+
+
+def render():
+    ###########################################################
+    # 4. Electric Vehicles per 10,000 People (EV Density)
+    ###########################################################
+    st.header("Electric Vehicles per 10,000 People")
+
+    with perf.stage("load"):
+        df_map_ev10000 = load_map_data_ev10000()
+        max_ev_10000 = df_map_ev10000["ev_per_10000"].max()
+    
+    # Figures are cached as Plotly JSON (figcache) and only rebuilt when the data or options change
+    # Create a dummy dataframe for a thin colorbar
+    def build_colorbar():
+        df_dummy = pd.DataFrame({
+            "dummy_x": [0, 1],
+            "dummy_y": [0, 1],
+            "value":   [0, max_ev_10000]
+        })
+    
+        # Adjust colorbar
+        fig_colorbar = px.scatter(
+            df_dummy,
+            x="dummy_x",
+            y="dummy_y",
+            color="value",
+            color_continuous_scale="Blues",
+            range_color=(0, max_ev_10000)
+        )
+        fig_colorbar.update_traces(marker=dict(size=0), hovertemplate=None, hoverinfo="skip")
+        fig_colorbar.update_xaxes(visible=False)
+        fig_colorbar.update_yaxes(visible=False)
+        fig_colorbar.update_layout(
+            height=60,
+            margin=dict(l=0, r=0, t=0, b=0),
+            coloraxis_colorbar=dict(
+                orientation="h",
+                x=0.54, 
+                xanchor="center",
+                y=0,
+                yanchor="top",
+                title=None 
+            ),
+            title=dict(
+                text="<span style='color:gray; font-size:14px; font-weight:normal;'>EV per 10,000 People</span>",  
+                x=0.055, 
+                y=0.83,
+                xanchor="left",
+                yanchor="top"
+            )
+        )
+        return fig_colorbar
+    fig_colorbar = figcache.cached_figure("colorbar", df_map_ev10000, "ev_per_10000", "Blues", (None, 60), build_colorbar)
+
+    # Choropleth map for EV density
+    def build_map():
+        fig_map_ev10000 = px.choropleth(
+            df_map_ev10000,
+            color="ev_per_10000",
+            custom_data=["state", "ev_per_10000"],
+            geojson=geometry.state_geojson(),
+            featureidkey="id",
+            locations="state_code",
+            scope="usa",
+            color_continuous_scale="Blues",
+            range_color=(0, max_ev_10000),
+            labels={"ev_per_10000": "EV per 10,000 People"}
+        )
+        fig_map_ev10000.update_traces(
+            hovertemplate="EV per 10,000 People<br>%{customdata[0]}: <b>%{customdata[1]}</b><extra></extra>"
+        )
+        fig_map_ev10000.update_layout(
+            margin=dict(l=0, r=0, t=0, b=0),
+            height=380,
+            width=600,
+            coloraxis_showscale=False
+        )
+        return fig_map_ev10000
+    fig_map_ev10000 = figcache.cached_figure("choropleth", df_map_ev10000, "ev_per_10000", "Blues", (600, 380), build_map)
+
+    # Bar chart for Top 10 states by EV density
+    def build_top10():
+        df_top10_ev10000 = df_map_ev10000.sort_values("ev_per_10000", ascending=False).head(10)
+        fig_top10_ev10000 = px.bar(
+            df_top10_ev10000,
+            x="ev_per_10000",
+            y="state",
+            orientation="h",
+            custom_data=["state", "ev_per_10000"],
+            color="ev_per_10000",
+            color_continuous_scale="Blues",
+            range_color=(0, max_ev_10000),
+            labels={"ev_per_10000": "EV per 10,000 People", "state": "State"}
+        )
+        fig_top10_ev10000.update_traces(
+            hovertemplate="EV per 10,000 People<br>%{customdata[0]}: <b>%{customdata[1]}</b><extra></extra>"
+        )
+        fig_top10_ev10000.update_layout(
+            margin=dict(l=0, r=0, t=10, b=0),
+            yaxis=dict(autorange="reversed"),
+            bargap=0.35,
+            height=400,
+            coloraxis_showscale=False
+        )
+        fig_top10_ev10000.update_xaxes(
+            showgrid=True,
+            gridcolor="lightgray",
+            gridwidth=1,
+            griddash="dot"
+        )
+        return fig_top10_ev10000
+    fig_top10_ev10000 = figcache.cached_figure("top10", df_map_ev10000, "ev_per_10000", "Blues", (None, 400), build_top10)
+
+    # Layout for EV density section: two columns for map and bar chart, then the colorbar
+    col1_ev, col2_ev = st.columns([1,1], gap="small")
+    with col1_ev:
+        st.write("#### 👥 EV Density by State per 10,000 People")
+        st.plotly_chart(fig_map_ev10000, use_container_width=True, config={"scrollZoom": True, "displayModeBar": True})
+        
+    with col2_ev:
+        st.write("#### Top 10 States by EV per 10,000 People")
+        st.plotly_chart(fig_top10_ev10000, use_container_width=True, config={"displayModeBar": False})
+    st.plotly_chart(fig_colorbar, use_container_width=True, config={"displayModeBar": False})
+
+    st.markdown("")
+    st.markdown("")
+    
+    # Data source
+    st.markdown("""
+        <div style="font-size: 14px; color: gray;">
+            <b>Source</b>: TransAtlas from the Alternative Fuels Data Center (AFDC)
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+    
+    # Comparison section for EV density
+    st.header("⚖️ Comparison of EV per 10,000 People")
+    selected_states_ev = st.multiselect(
+        "Select up to 5 states to compare:",
+        options=df_map_ev10000["state"].unique(),
+        default=["California", "Washington", "Texas", "Florida", "New York"]
+    )
+    if len(selected_states_ev) > 5:
+        st.error("Please select up to 5 states only.")
+        selected_states_ev = selected_states_ev[:5]
+    if not selected_states_ev:
+        st.warning("Please select at least one state.")
+    else:
+        with perf.stage("figure"):
+            df_compare_ev = df_map_ev10000[df_map_ev10000["state"].isin(selected_states_ev)]
+            fig_compare_ev = px.bar(
+                df_compare_ev,
+                x="state",
+                y="ev_per_10000",
+                labels={"state": "State", "ev_per_10000": "EV per 10,000 People"},
+                color="ev_per_10000",
+                color_continuous_scale="Blues",
+                range_color=(0, max_ev_10000),
+                hover_data=None
+            )
+            fig_compare_ev.update_layout(
+                margin=dict(l=0, r=0, t=0, b=0),
+                coloraxis_colorbar=dict(
+                    orientation="v",
+                    len=1,
+                    thickness=16,
+                    x=1.05,
+                    xanchor="left",
+                    y=0.47,
+                    yanchor="middle",
+                    title="EV per 10,000 People"
+                )
+            )
+            fig_compare_ev.update_traces(
+                hovertemplate="EV per 10,000 People<br>%{x}: <b>%{y}</b><extra></extra>"
+            )
+        st.plotly_chart(fig_compare_ev, use_container_width=True, config={"displayModeBar": False})
+        
+    st.markdown("---")
+    
+    # Load the precomputed per-state fact table (Densities and log transformations included)
+    df_merged = datastore.state_facts().dropna(subset=["Charging Stations per 10k", "ev_per_10000"])
+
+    # Research Question 2: EV Charging Station Density vs Population Density
+    st.header("EV Charging Station Density vs. Population Density (Log Scale)")
+    with perf.stage("figure"):
+        fit = regression.fit_columns(df_merged, "EV per 10000 (log)", "Charging Stations per 10k (log)")
+        spread = resampling.resample_columns(df_merged, "EV per 10000 (log)", "Charging Stations per 10k (log)")
+        fig_population = px.scatter(
+            df_merged,
+            x="EV per 10000 (log)",
+            y="Charging Stations per 10k (log)",
+            title="EV Charging Station Density vs. Population Density (Log Scale)",
+            labels={"EV per 10000 (log)": "EVs per 10K People (log)", "Charging Stations per 10k (log)": "Charging Stations per 10K People (log)"},
+        )
+        fig_population.update_traces(marker=dict(size=8, opacity=0.7, color="#4C72B0"))
+        fig_population.add_traces(regression.trend_traces(fit))
+    st.plotly_chart(fig_population, use_container_width=True)
+
+    # Insights (the wording follows the fitted values)
+    if fit.slope < 1:
+        slope_text = ("Since the slope is less than 1, this suggests that the growth rate of charging stations is lower than that of EVs, "
+                      "indicating that EV adoption may be outpacing charging infrastructure expansion.")
+    else:
+        slope_text = ("Since the slope is at least 1, this suggests that charging stations grow at least as fast as EVs, "
+                      "indicating that charging infrastructure expansion is keeping pace with EV adoption.")
+    if fit.r2 < 0.9:
+        r2_text = (f"While this R² value indicates a {regression.strength(fit.r2)} correlation, it is not close to 1, implying that additional factors "
+                   "such as policies, economic conditions, or regional infrastructure strategies likely play a role in determining charging station density.")
+    else:
+        r2_text = (f"This R² value indicates a {regression.strength(fit.r2)} correlation close to 1, implying that EV density alone explains "
+                   "most of the variation in charging station density between states.")
+    st.markdown(f"""
+    <b>Key Insights: EV Charging Station Density vs. Population Density (Log Scale)</b>
+    <ul>
+        <li>This graph illustrates the relationship between <b>population density (log-scale)</b> and <b>EV charging station density (log-scale)</b>.</li>
+        <li>An <b>Ordinary Least Squares (OLS) regression analysis</b> is performed, yielding the following equation:</li>
+    </ul>
+    <div style="text-align: center; font-size: 16px; font-weight: bold; margin-top: -0.2cm; margin-bottom: 5px;">
+        {fit.equation("Charging Stations per 10K People (log)", "EVs per 10K People (log)")}
+    </div>
+    <ul>
+        <li><b>Slope ({fit.slope:.6g})</b>: A 1% increase in log-transformed EV density corresponds to a {fit.slope:.2f}% increase in log-transformed charging station density. {slope_text}</li>
+        <li><b>Intercept ({fit.intercept:.6g})</b>: Represents the expected log value of charging station density when log-transformed EV density is 0 (i.e., when there is only one EV). This suggests that a baseline level of charging infrastructure may still exist even in areas with very low EV density.</li>
+        <li><b>R² = {fit.r2:.6f}</b>: {r2_text}</li>
+        <li><b>Uncertainty</b>: {spread.summary()}.</li>
+    </ul>
+    """, unsafe_allow_html=True)
+
+    st.markdown("")
+    st.markdown("")
+    st.markdown("")
+
+    # Data source & Abbreviations
+    st.markdown("""
+    <div style="font-size: 14px; color: gray;">
+        <b>Acronyms and Abbreviations</b>: EV = Electric Vehicle  
+        <br>
+        <b>Source</b>: TransAtlas from the Alternative Fuels Data Center (AFDC)
+    </div>
+    """, unsafe_allow_html=True)
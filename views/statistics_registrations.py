@@ -0,0 +1,294 @@
+# EV Statistics I page
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+import figcache
+import geometry
+import datastore
+import perf
+import regression
+import resampling
+import states
+
+
+def render():
+    #########################################################
+    # 3. U.S. EV Registrations by State (2023) & State Filter
+    #########################################################
+    st.header("U.S. Electric Vehicles Registrations by State")
+    
+    # EV registration data (dictionary-based)
+    state_ev_data = {
+        'California': 1256646, 'Texas': 230125, 'Florida': 254878, 'New York': 131250,
+        'Illinois': 99573, 'Ohio': 50393, 'Georgia': 92368, 'North Carolina': 70164,
+        'Michigan': 50284, 'Pennsylvania': 70154, 'Washington': 152101, 'Arizona': 89798,
+        'Colorado': 90083, 'Massachusetts': 73768, 'Virginia': 84936, 'New Jersey': 134753,
+        'Tennessee': 33221, 'Indiana': 26101, 'Minnesota': 37050, 'Maryland': 72139,
+        'Missouri': 26861, 'Wisconsin': 24943, 'Oregon': 64361, 'Nevada': 47361, 'South Carolina': 20873,
+        'Kentucky': 11617, 'Alabama': 13047, 'Louisiana': 8150, 'Utah': 39998, 'Iowa': 9031,
+        'Kansas': 11271, 'Oklahoma': 22843, 'Arkansas': 7108, 'Mississippi': 3590, 'Nebraska': 6920,
+        'New Mexico': 10276, 'West Virginia': 2758, 'Hawaii': 25565, 'Idaho': 8501, 'Maine': 7377,
+        'New Hampshire': 9861, 'Montana': 4608, 'Rhode Island': 6396, 'Delaware': 8435, 'South Dakota': 1675,
+        'North Dakota': 959, 'Alaska': 2697, 'Vermont': 7816, 'Connecticut': 31557, 'District of Columbia': 8066, 'Wyoming': 1139
+    }
+    with perf.stage("transform"):
+        df_state = pd.DataFrame(list(state_ev_data.items()), columns=['State', 'EV_Count'])
+
+        df_state['State_Code'] = states.codes(states.keys(df_state['State']))
+
+        max_ev = df_state["EV_Count"].max()
+
+    # Figures are cached as Plotly JSON (figcache) and only rebuilt when the data or options change
+    # Dedicated colorbar figure
+    def build_colorbar():
+        df_dummy = pd.DataFrame({
+            "dummy_x": [0, 1], 
+            "dummy_y": [0, 1], 
+            "value": [0, max_ev]
+        })
+        fig_colorbar = px.scatter(
+            df_dummy, 
+            x="dummy_x", 
+            y="dummy_y", 
+            color="value", 
+            color_continuous_scale="Blues", 
+            range_color=(0, max_ev)
+        )
+
+        fig_colorbar.update_traces(marker=dict(size=0), hovertemplate=None, hoverinfo="skip")
+        fig_colorbar.update_xaxes(visible=False)
+        fig_colorbar.update_yaxes(visible=False)
+        fig_colorbar.update_layout(
+            height=60,
+            margin=dict(l=0, r=0, t=0, b=0),
+            coloraxis_colorbar=dict(
+                orientation="h",
+                x=0.54, xanchor="center",
+                y=0, yanchor="top",
+                title=None
+            ),
+            title=dict(
+                text="<span style='color:gray; font-size:14px; font-weight:normal;'>Electric Vehicles</span>",
+                x=0.08, y=0.83,
+                xanchor="left", yanchor="top"
+            )
+        )
+        return fig_colorbar
+    fig_colorbar = figcache.cached_figure("colorbar", df_state, "EV_Count", "Blues", (None, 60), build_colorbar)
+
+    # US Map (Choropleth Map)
+    def build_map():
+        fig_map = px.choropleth(
+            df_state,
+            locations="State_Code",
+            geojson=geometry.state_geojson(),
+            featureidkey="id",
+            color="EV_Count",
+            custom_data=["State", "EV_Count"],
+            scope="usa",
+            color_continuous_scale="Blues",
+            range_color=(0, max_ev),
+            labels={"EV_Count": "Electric Vehicles"}
+        )
+        fig_map.update_traces(
+            hovertemplate="Electric Vehicles<br>%{customdata[0]}: <b>%{customdata[1]:,}</b><extra></extra>"
+        )
+        fig_map.update_layout(
+            margin=dict(l=0, r=0, t=0, b=0),
+            height=380, width=600,
+            coloraxis_showscale=False
+        )
+        return fig_map
+    fig_map = figcache.cached_figure("choropleth", df_state, "EV_Count", "Blues", (600, 380), build_map)
+    
+    # Top 10 States (Bar Chart)
+    def build_top10():
+        df_top10 = df_state.sort_values("EV_Count", ascending=False).head(10)
+        fig_top10 = px.bar(
+            df_top10,
+            x="EV_Count", y="State",
+            orientation="h",
+            custom_data=["State", "EV_Count"],
+            color="EV_Count",
+            color_continuous_scale="Blues",
+            range_color=(0, max_ev),
+            labels={"EV_Count": "Electric Vehicles", "State": "State"}
+        )
+        fig_top10.update_traces(
+            hovertemplate="Electric Vehicles<br>%{customdata[0]}: <b>%{customdata[1]:,}</b><extra></extra>"
+        )
+        fig_top10.update_layout(
+            margin=dict(l=0, r=0, t=10, b=0),
+            yaxis=dict(autorange="reversed"),
+            bargap=0.35,
+            height=400,
+            coloraxis_showscale=False
+        )
+        fig_top10.update_xaxes(
+            showgrid=True, gridcolor="lightgray", gridwidth=1, griddash="dot"
+        )
+        return fig_top10
+    fig_top10 = figcache.cached_figure("top10", df_state, "EV_Count", "Blues", (None, 400), build_top10)
+
+    # Map + Bar Chart (Two-Column Layout)
+    col1, col2 = st.columns([1, 1], gap="small")
+
+    with col1:
+        st.write("#### 🚙 EV Registrations by State (2023)")
+        st.plotly_chart(fig_map, use_container_width=True, config={"scrollZoom": True, "displayModeBar": True})   # Add Zoom In/Out and Modebar
+
+    with col2:
+        st.write("#### Top 10 States by EV Registrations")
+        st.plotly_chart(fig_top10, use_container_width=True, config={"displayModeBar": False})
+
+    # Position colorbar at the bottom
+    st.plotly_chart(fig_colorbar, use_container_width=True, config={"displayModeBar": False})
+
+    st.markdown("")
+    st.markdown("")
+
+    # Data source
+    st.markdown("""
+    <div style="font-size: 14px; color: gray;">
+        <b>Source</b>: TransAtlas from the Alternative Fuels Data Center (AFDC)
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+    
+    # Add a dropdown menu to filter by state
+    st.write("#### 🔍 Search for a State's EV Registration")
+
+    # Sort alphabetically using sorted()
+    state_list = sorted(df_state["State"].unique())
+    selected_state = st.selectbox("Select a state:", state_list)
+    
+    filtered_data = df_state[df_state["State"] == selected_state]
+    st.write(f"**{selected_state}** has **{filtered_data['EV_Count'].values[0]:,}** registered electric vehicles.")
+
+    # Charging stations of the selected state (Only that state's partition is read)
+    df_state_stations = datastore.state_stations(filtered_data["State_Code"].values[0], ["City"])
+    if len(df_state_stations):
+        top_cities = df_state_stations["City"].value_counts().head(3)
+        st.write(f"It has **{len(df_state_stations):,}** public charging stations, most of them in {', '.join(map(str, top_cities.index))}.")
+
+    st.markdown("---")
+    
+    # Load the precomputed per-state fact table (Station counts, registrations, population and densities)
+    df_merged = datastore.state_facts()
+
+    # Remove missing values (Exclude states with no population or charging station data)
+    with perf.stage("transform"):
+        df_merged = df_merged.dropna(subset=["Charging Stations per 10k", "EV_Registrations"])
+
+        # Fit the linear regression and its bootstrap/permutation spread (Cached per dataset)
+        fit = regression.fit_columns(df_merged, "Charging Stations per 10k", "EV_Registrations")
+        spread = resampling.resample_columns(df_merged, "Charging Stations per 10k", "EV_Registrations")
+
+    # Title
+    st.header("Relationship Between EV Charging Station Density & EV Adoptions")
+    
+    # Add explanation of EV charging station density calculation method
+    st.markdown("""
+    To calculate the **charging station density** for each state, the total number of charging stations is divided by the state’s population normalized per 10,000 residents. 
+    This provides a standardized measure of charging station availability relative to population size.
+    """)
+
+    # Scatter plot with linear regression
+    with perf.stage("figure"):
+        fig = px.scatter(
+            df_merged,
+            x="Charging Stations per 10k",
+            y="EV_Registrations",
+            title="EV Charging Station Density vs. EV Adoptions",
+            labels={"Charging Stations per 10k": "Charging Stations per 10K People", "EV_Registrations": "EV Adoptions"},
+        )
+    
+        fig.update_traces(marker=dict(size=8, opacity=0.7, color="#4C72B0"))
+        fig.add_traces(regression.trend_traces(fit))    # Add linear regression line
+
+    # Display graph
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Insights
+    st.markdown(f"""
+    <b>Key Insights: EV Charging Station Density vs. EV Adoptions</b>
+    <ul>
+        <li>This graph illustrates the relationship between EV charging station density per 10,000 people and EV adoptions by state in the U.S.</li>
+        <li>An <b>Ordinary Least Squares (OLS) regression line</b> is included, with the following equation:</li>
+    </ul>
+    <div style="text-align: center; font-size: 16px; font-weight: bold; margin-top: -0.2cm; margin-bottom: 5px;">
+        {fit.equation("EV Adoptions", "Charging Stations per 10K")}</div>
+    <ul>
+        <li><b>R² value ({fit.r2:.6f})</b> is <b>{regression.strength(fit.r2)}</b>, indicating a {"weak" if fit.r2 < 0.3 else "clear"} correlation between charging station density and EV adoptions.</li>
+        <li><b>Uncertainty</b>: {spread.summary()}. An interval for r that includes 0 means the correlation may be due to chance.</li>
+        <li>The majority of the data points are concentrated in the lower charging station density range (1-2 per 10K people), with some states showing high EV adoptions.</li>
+        <li>A higher charging station density does not necessarily lead to higher EV adoption, as other factors such as policies, infrastructure, and economic conditions may also play a role.</li>
+    </ul>
+    """, unsafe_allow_html=True)
+
+    st.markdown("---")
+    
+    # Log-transformed columns come precomputed with the fact table
+    df_merged = datastore.state_facts().dropna(subset=["Charging Stations per 10k (log)", "ev_per_10000"])
+    
+    # Research Question 1: EV Charging Station Density vs EV Adoption Rate
+    st.header("EV Charging Station Density vs. EV Adoptions (Log Scale)")
+    st.markdown("""
+    <div style="background-color:#F0F8FF; padding:15px; border-radius:5px">
+        <b>Applying a Log Scale</b><br>
+        The previous graph shows a highly skewed distribution, with most states concentrated in 
+        the lower range of charging station density. 
+        A logarithmic transformation is applied to both axes to better capture variations 
+        across a broader range of values. This adjustment reduces skewness and allows for a 
+        clearer comparison of trends that may not be easily observed on a linear scale.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Linear regression 
+    with perf.stage("figure"):
+        fit = regression.fit_columns(df_merged, "Charging Stations per 10k (log)", "EV Adoptions (log)")
+        spread = resampling.resample_columns(df_merged, "Charging Stations per 10k (log)", "EV Adoptions (log)")
+        fig_adoption = px.scatter(
+            df_merged,
+            x="Charging Stations per 10k (log)",
+            y="EV Adoptions (log)",
+            title="EV Charging Station Density vs. EV Adoptions (Log Scale)",
+            labels={"Charging Stations per 10k (log)": "Charging Stations per 10K People (log)", "EV Adoptions (log)": "EV Adoptions (log)"},
+        )
+        fig_adoption.update_traces(marker=dict(size=8, opacity=0.7, color="#4C72B0"))
+        fig_adoption.add_traces(regression.trend_traces(fit))
+    st.plotly_chart(fig_adoption, use_container_width=True)
+    
+    # Insights
+    st.markdown(f"""
+    <b>Key Insights: Log-Transformed EV Charging Station Density vs. EV Adoptions</b>
+    <ul>
+        <li>Applying a logarithmic transformation results in a more balanced distribution of charging station density and EV adoptions.</li>
+        <li>The log scale makes it easier to distinguish variations among data points, particularly in the lower density range.</li>
+        <li>An <b>Ordinary Least Squares (OLS) regression line</b> is included, with the following equation:</li>
+    </ul>
+    <div style="text-align: center; font-size: 16px; font-weight: bold; margin-top: -0.2cm; margin-bottom: 5px;">
+        {fit.equation("log(EV Adoptions)", "log(Charging Stations per 10K)")}</div>
+    <ul>
+        <li><b>Slope ({fit.slope:.6g})</b>: A 1% increase in log-transformed charging station density corresponds to a {fit.slope:.2f}% increase in log-transformed EV adoptions. This suggests that while EV adoptions tend to increase as charging station density rises, the growth rate is not linear but rather gradual.</li>
+        <li><b>Intercept ({fit.intercept:.6g})</b>: Represents the expected log value of EV adoptions when the log-transformed charging station density is 0 (i.e., when there is one charging station).</li>
+        <li><b>R² = {fit.r2:.6f}</b>: Even after log transformation, the coefficient of determination remains {regression.strength(fit.r2)}. This indicates that charging station density alone is insufficient to explain EV adoption numbers, suggesting that other factors, such as policies, economic conditions, and EV prices, likely play a significant role.</li>
+        <li><b>Uncertainty</b>: {spread.summary()}.</li>
+    </ul>
+    """, unsafe_allow_html=True)
+
+    st.markdown("")
+    st.markdown("")
+    st.markdown("")
+    
+    # Data source & Abbreviations
+    st.markdown("""
+    <div style="font-size: 14px; color: gray;">
+        <b>Acronyms and Abbreviations</b>: EV = Electric Vehicle  
+        <br>
+        <b>Source</b>: Vehicle Registration Counts by State (2023) from the Alternative Fuels Data Center (AFDC)
+    </div>
+    """, unsafe_allow_html=True)